@@ -0,0 +1,185 @@
+"""
+Headless batch solver.
+
+    python -m batch puzzles.txt --solver idastar --heuristic linear_conflict \\
+        --workers 8 --timeout 10 --max-nodes 5000000 --out results.jsonl
+
+Input: one puzzle per line, either whitespace/comma separated tiles in row-major
+order (0 is the blank) or a JSON object {"id": ..., "tiles": [...]} /
+{"id": ..., "board": [[...], ...]}. Results are written as JSON lines as soon
+as each instance finishes; a throughput summary goes to stderr.
+
+With --solver anytime the timeout is a budget rather than a failure: the best
+path found within it is reported as solved. The search starts from a
+reduction path, so every solvable board gets one however short the budget.
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from core.board import Board
+from solvers.base_solver import SearchAborted
+from solvers.move_pruning import MoveAutomaton
+from solvers.registry import SOLVERS, HEURISTICS, INFORMED, PRUNED, make_solver
+
+# Per-process cache so table heuristics are opened once per worker
+_heuristics = {}
+
+def parse_line(line, line_number):
+    """Return (instance_id, tiles) for one input line, or None for blanks/comments."""
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    if line.startswith("{"):
+        record = json.loads(line)
+        tiles = record.get("tiles")
+        if tiles is None:
+            tiles = [value for row in record["board"] for value in row]
+        return record.get("id", line_number), [int(value) for value in tiles]
+    return line_number, [int(value) for value in line.replace(",", " ").split()]
+
+def read_instances(path):
+    stream = sys.stdin if path == "-" else open(path)
+    try:
+        for line_number, line in enumerate(stream, 1):
+            parsed = parse_line(line, line_number)
+            if parsed is not None:
+                yield parsed
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+def solve_instance(instance_id, tiles, solver_name, heuristic_name, max_nodes, timeout, weight=None):
+    """Worker entry point: solve one puzzle and return a JSON-ready result."""
+    started = time.perf_counter()
+    result = {"id": instance_id}
+    solver = None
+    try:
+        board = Board.from_tiles(tiles)
+        heuristic = None
+        if solver_name in INFORMED:
+            key = (heuristic_name, board.n)
+            if key not in _heuristics:
+                _heuristics[key] = HEURISTICS[heuristic_name](board.n)
+            heuristic = _heuristics[key]
+        solver = make_solver(solver_name, board, heuristic, weight)
+        solver.set_limits(max_nodes=max_nodes, time_limit=timeout)
+        moves = solver.solve()
+        if moves is None:
+            result["status"] = "unsolvable"
+        else:
+            result["status"] = "solved"
+            result["length"] = len(moves)
+            result["moves"] = moves
+    except SearchAborted as exc:
+        result["status"] = exc.reason.replace(" ", "_")
+    except Exception as exc:  # report and keep the batch going
+        result["status"] = "error"
+        result["error"] = "%s: %s" % (type(exc).__name__, exc)
+    result["nodes"] = getattr(solver, "nodes_explored", 0)
+    result["seconds"] = round(time.perf_counter() - started, 6)
+    return result
+
+def prepare_tables(solver_name, heuristic_name, n):
+    """
+    Build (or open) the tables for board size n in this process before any
+    worker needs them: the heuristic's, and the move-pruning automaton of
+    solvers that use one. Workers then load them from the disk cache
+    instead of each one building the same tables at once.
+    """
+    try:
+        if solver_name in INFORMED:
+            HEURISTICS[heuristic_name](n)
+        if solver_name in PRUNED:
+            MoveAutomaton.load(n)
+    except Exception:
+        pass  # workers hit the same error and report it per instance
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+def run(instances, solver_name, heuristic_name, workers, max_nodes, timeout, out, max_pending=None, weight=None):
+    """Solve every instance across a process pool, streaming results to `out`. Returns the summary."""
+    max_pending = max_pending or workers * 4
+    latencies, nodes, statuses = [], 0, {}
+    prepared = set()  # board sizes whose tables are built
+    started = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        instances = iter(instances)
+        exhausted = False
+        while pending or not exhausted:
+            # Keep a bounded window in flight so huge inputs are never fully queued
+            while not exhausted and len(pending) < max_pending:
+                try:
+                    instance_id, tiles = next(instances)
+                except StopIteration:
+                    exhausted = True
+                    break
+                n = math.isqrt(len(tiles))
+                if n not in prepared:
+                    prepared.add(n)
+                    prepare_tables(solver_name, heuristic_name, n)
+                pending.add(pool.submit(solve_instance, instance_id, tiles, solver_name,
+                                        heuristic_name, max_nodes, timeout, weight))
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                out.write(json.dumps(result) + "\n")
+                out.flush()
+                latencies.append(result["seconds"])
+                nodes += result["nodes"]
+                statuses[result["status"]] = statuses.get(result["status"], 0) + 1
+
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "instances": len(latencies),
+        "statuses": statuses,
+        "elapsed_seconds": round(elapsed, 3),
+        "instances_per_second": round(len(latencies) / elapsed, 3) if elapsed else 0.0,
+        "nodes_per_second": round(nodes / elapsed, 1) if elapsed else 0.0,
+        "p50_latency_seconds": percentile(latencies, 0.50),
+        "p95_latency_seconds": percentile(latencies, 0.95),
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve many puzzles headlessly across worker processes")
+    parser.add_argument("input", help="puzzle file (one state per line or JSONL), '-' for stdin")
+    parser.add_argument("--solver", default="idastar", choices=sorted(SOLVERS))
+    parser.add_argument("--heuristic", default="manhattan", choices=sorted(HEURISTICS))
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--timeout", type=float, default=None, help="per-instance time limit in seconds")
+    parser.add_argument("--max-nodes", type=int, default=None, help="per-instance node expansion limit")
+    parser.add_argument("--weight", type=float, default=None,
+                        help="weighted A* factor for astar, starting weight for anytime")
+    parser.add_argument("--out", default="-", help="results file (JSON lines), '-' for stdout")
+    args = parser.parse_args(argv)
+
+    workers = args.workers or os.cpu_count() or 1
+    out = sys.stdout if args.out == "-" else open(args.out, "w")
+    try:
+        summary = run(read_instances(args.input), args.solver, args.heuristic, workers,
+                      args.max_nodes, args.timeout, out, weight=args.weight)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print("processed %(instances)d instances in %(elapsed_seconds).3fs" % summary, file=sys.stderr)
+    print("  %(instances_per_second).2f instances/sec, %(nodes_per_second).0f nodes/sec" % summary, file=sys.stderr)
+    print("  latency p50 %(p50_latency_seconds).4fs, p95 %(p95_latency_seconds).4fs" % summary, file=sys.stderr)
+    print("  statuses: %s" % json.dumps(summary["statuses"], sort_keys=True), file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
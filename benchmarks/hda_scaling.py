@@ -0,0 +1,61 @@
+"""
+Scaling benchmark for ParallelAStarSolver (HDA*).
+
+    python -m benchmarks.hda_scaling --workers 1 2 4 8 --out hda.json
+
+Solves a fixed set of 4x4 instances with 1, 2, 4 and 8 workers and reports
+wall time, total expansions (search overhead grows with workers) and speedup
+relative to the single-worker run. Every run must return the same optimal
+length.
+"""
+import argparse
+import json
+import time
+from core.board import Board
+from solvers.heuristics import linear_conflict
+from solvers.parallel_a_star import ParallelAStarSolver
+
+# Fixed 4x4 instances (seeded 60-move random walks from the goal) with optimal lengths
+INSTANCES = [
+    ([1, 10, 2, 6, 5, 4, 12, 15, 13, 9, 0, 14, 11, 8, 3, 7], 38),
+    ([6, 5, 9, 3, 13, 2, 11, 10, 1, 8, 15, 4, 14, 12, 7, 0], 42),
+    ([9, 1, 6, 4, 7, 5, 2, 3, 12, 11, 0, 15, 13, 14, 10, 8], 34),
+    ([0, 1, 8, 11, 5, 13, 14, 2, 7, 10, 4, 3, 6, 9, 12, 15], 40),
+    ([6, 8, 15, 4, 1, 2, 3, 0, 9, 5, 10, 7, 14, 13, 11, 12], 34),
+]
+
+def run(worker_counts, heuristic=linear_conflict):
+    rows = []
+    for workers in worker_counts:
+        started = time.perf_counter()
+        expansions = 0
+        for tiles, optimal in INSTANCES:
+            solver = ParallelAStarSolver(Board.from_tiles(tiles), heuristic=heuristic, workers=workers)
+            path = solver.solve()
+            if path is None or len(path) != optimal:
+                raise AssertionError("workers=%d returned %s moves for %s, expected %d"
+                                     % (workers, None if path is None else len(path), tiles, optimal))
+            expansions += solver.nodes_explored
+        rows.append({"workers": workers, "seconds": round(time.perf_counter() - started, 3),
+                     "expansions": expansions})
+    base = rows[0]["seconds"]
+    for row in rows:
+        row["speedup"] = round(base / row["seconds"], 2) if row["seconds"] else 0.0
+    return rows
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="HDA* scaling benchmark on fixed 4x4 instances")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--out", default=None, help="write results as JSON")
+    args = parser.parse_args(argv)
+
+    rows = run(args.workers)
+    print("%8s %10s %12s %8s" % ("workers", "seconds", "expansions", "speedup"))
+    for row in rows:
+        print("%(workers)8d %(seconds)10.3f %(expansions)12d %(speedup)8.2f" % row)
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(rows, f, indent=2)
+
+if __name__ == "__main__":
+    main()
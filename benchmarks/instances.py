@@ -0,0 +1,67 @@
+"""
+Canonical benchmark instance sets.
+
+Sets live in benchmarks/instances/<name>.jsonl, one {"id", "tiles", "optimal"}
+record per line (the same JSONL format `python -m batch` reads):
+- 3x3-dNN: ten 8-puzzles of optimal depth NN, drawn with a fixed seed
+- korf100: Korf's (1985) 100 random 15-puzzles, mirrored to this repo's goal
+  (blank bottom-right) by a 180-degree rotation, which keeps optimal lengths
+
+The 3x3 files are regenerated (deterministically) with
+    python -m benchmarks.instances --regenerate
+"""
+import argparse
+import json
+import os
+import random
+from core.board import Board
+from core.shuffler import Shuffler
+from solvers.bidirectional_bfs import BidirectionalBFSSolver
+
+INSTANCE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "instances")
+
+DEPTHS_3X3 = (8, 12, 16, 20, 24, 28)
+PER_DEPTH = 10
+SEED = 20240601
+
+def available_sets():
+    return sorted(name[:-len(".jsonl")] for name in os.listdir(INSTANCE_DIR) if name.endswith(".jsonl"))
+
+def load_set(name):
+    """Return the list of {"id", "tiles", "optimal"} records of a named set."""
+    with open(os.path.join(INSTANCE_DIR, name + ".jsonl")) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def generate_3x3_sets(seed=SEED):
+    """Seeded walks from the goal, bucketed by exact optimal depth (bidirectional BFS)."""
+    rng = random.Random(seed)
+    buckets = {depth: [] for depth in DEPTHS_3X3}
+    seen = set()
+    while any(len(bucket) < PER_DEPTH for bucket in buckets.values()):
+        board = Board(3)
+        Shuffler(board, rng).shuffle(rng.randint(8, 60))
+        tiles = tuple(int(value) for row in board.grid for value in row)
+        if tiles in seen:
+            continue
+        seen.add(tiles)
+        depth = len(BidirectionalBFSSolver(board).solve())
+        if depth in buckets and len(buckets[depth]) < PER_DEPTH:
+            buckets[depth].append(tiles)
+    return {"3x3-d%02d" % depth: [{"id": "3x3-d%02d-%02d" % (depth, i), "tiles": list(tiles), "optimal": depth}
+                                  for i, tiles in enumerate(bucket)]
+            for depth, bucket in buckets.items()}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="List or regenerate benchmark instance sets")
+    parser.add_argument("--regenerate", action="store_true", help="rewrite the seeded 3x3 sets")
+    args = parser.parse_args(argv)
+    if args.regenerate:
+        for name, records in generate_3x3_sets().items():
+            with open(os.path.join(INSTANCE_DIR, name + ".jsonl"), "w") as f:
+                for record in records:
+                    f.write(json.dumps(record) + "\n")
+    for name in available_sets():
+        print("%-10s %3d instances" % (name, len(load_set(name))))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Heap vs. bucket open list for AStarSolver.
+
+    python -m benchmarks.open_list --sets 3x3-d20 3x3-d24 3x3-d28 --heuristic manhattan
+
+Solves each instance set with both open lists and reports wall time and
+expansions (tie-breaking differs, so the node counts do too). Every path
+must have the set's optimal length.
+"""
+import argparse
+import json
+import time
+from core.board import Board
+from solvers.a_star import AStarSolver
+from solvers.open_list import OPEN_LISTS
+from solvers.registry import HEURISTICS
+from benchmarks.instances import load_set
+
+def run(set_names, heuristic_name="manhattan", open_lists=tuple(OPEN_LISTS)):
+    rows = []
+    for set_name in set_names:
+        records = load_set(set_name)
+        heuristic = HEURISTICS[heuristic_name](int(round(len(records[0]["tiles"]) ** 0.5)))
+        for open_list in open_lists:
+            started = time.perf_counter()
+            nodes = 0
+            for record in records:
+                solver = AStarSolver(Board.from_tiles(record["tiles"]), heuristic, open_list=open_list)
+                path = solver.solve()
+                if path is None or len(path) != record["optimal"]:
+                    raise AssertionError("%s open list returned %s moves for %s, expected %d"
+                                         % (open_list, None if path is None else len(path), record["id"], record["optimal"]))
+                nodes += solver.nodes_explored
+            rows.append({"set": set_name, "open_list": open_list, "seconds": round(time.perf_counter() - started, 3),
+                         "nodes": nodes})
+    return rows
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare A* open-list implementations")
+    parser.add_argument("--sets", nargs="+", default=["3x3-d20", "3x3-d24", "3x3-d28"])
+    parser.add_argument("--heuristic", default="manhattan", choices=sorted(HEURISTICS))
+    parser.add_argument("--out", default=None, help="write results as JSON")
+    args = parser.parse_args(argv)
+
+    rows = run(args.sets, args.heuristic)
+    print("%-10s %-8s %10s %10s" % ("set", "open", "seconds", "nodes"))
+    for row in rows:
+        print("%(set)-10s %(open_list)-8s %(seconds)10.3f %(nodes)10d" % row)
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(rows, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Reproducible solver benchmark suite.
+
+    python -m benchmarks.run --sets 3x3-d20 3x3-d28 --pairs astar:manhattan idastar:linear_conflict \\
+        --out after.json --compare before.json
+
+Each (instance set, solver:heuristic) pair runs in a fresh worker process so
+peak RSS is measured per pair. Records wall time, nodes expanded, nodes/sec,
+peak RSS and how many paths were valid and optimal. Results are written as
+JSON; --compare flags pairs that got slower, expanded more nodes or lost
+optimality beyond the given thresholds (exit status 1).
+"""
+import argparse
+import json
+import multiprocessing as mp
+import platform
+import resource
+import sys
+import time
+from core.board import Board
+from solvers.base_solver import SearchAborted
+from solvers.registry import HEURISTICS, make_solver
+from benchmarks.instances import available_sets, load_set
+
+DEFAULT_SETS = ["3x3-d08", "3x3-d16", "3x3-d24"]
+DEFAULT_PAIRS = ["astar:manhattan", "astar:linear_conflict", "idastar:manhattan",
+                 "idastar:linear_conflict", "idastar:walking", "bibfs:none"]
+
+def _replays_to_goal(tiles, moves):
+    board = Board.from_tiles(tiles)
+    for move in moves:
+        if not board.move(move):
+            return False
+    return board.is_solved()
+
+def run_pair(set_name, pair, limit=None, max_nodes=None, timeout=None):
+    """Benchmark one solver:heuristic pair on one instance set (call in a fresh process)."""
+    solver_name, heuristic_name = pair.split(":")
+    records = load_set(set_name)[:limit]
+    heuristic = None
+    if heuristic_name != "none":
+        heuristic = HEURISTICS[heuristic_name](int(round(len(records[0]["tiles"]) ** 0.5)))
+
+    solved = optimal = nodes = 0
+    statuses = {}
+    started = time.perf_counter()
+    for record in records:
+        solver = make_solver(solver_name, Board.from_tiles(record["tiles"]), heuristic)
+        solver.set_limits(max_nodes=max_nodes, time_limit=timeout)
+        try:
+            moves = solver.solve()
+            status = "solved" if moves is not None else "unsolvable"
+        except SearchAborted as exc:
+            moves, status = None, exc.reason.replace(" ", "_")
+        nodes += solver.nodes_explored
+        statuses[status] = statuses.get(status, 0) + 1
+        if moves is not None and _replays_to_goal(record["tiles"], moves):
+            solved += 1
+            if len(moves) == record["optimal"]:
+                optimal += 1
+    wall = time.perf_counter() - started
+
+    return {
+        "set": set_name,
+        "pair": pair,
+        "instances": len(records),
+        "solved": solved,
+        "optimal": optimal,
+        "statuses": statuses,
+        "wall_seconds": round(wall, 4),
+        "nodes": nodes,
+        "nodes_per_second": round(nodes / wall, 1) if wall else 0.0,
+        # ru_maxrss is KiB on Linux, bytes on macOS
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // (1024 if sys.platform == "darwin" else 1),
+    }
+
+def compare(results, baseline, time_threshold, nodes_threshold):
+    """Return a list of human-readable regressions against a baseline run."""
+    previous = {(row["set"], row["pair"]): row for row in baseline["results"]}
+    regressions = []
+    for row in results["results"]:
+        before = previous.get((row["set"], row["pair"]))
+        if before is None:
+            continue
+        label = "%s %s" % (row["set"], row["pair"])
+        if row["wall_seconds"] > before["wall_seconds"] * (1 + time_threshold):
+            regressions.append("%s: wall time %.3fs -> %.3fs" % (label, before["wall_seconds"], row["wall_seconds"]))
+        if row["nodes"] > before["nodes"] * (1 + nodes_threshold):
+            regressions.append("%s: nodes %d -> %d" % (label, before["nodes"], row["nodes"]))
+        if row["optimal"] < before["optimal"]:
+            regressions.append("%s: optimal paths %d -> %d" % (label, before["optimal"], row["optimal"]))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the solver benchmark suite")
+    parser.add_argument("--sets", nargs="+", default=DEFAULT_SETS, help="choose from: " + ", ".join(available_sets()))
+    parser.add_argument("--pairs", nargs="+", default=DEFAULT_PAIRS, help="solver:heuristic (heuristic 'none' for uninformed solvers)")
+    parser.add_argument("--limit", type=int, default=None, help="only the first N instances of each set")
+    parser.add_argument("--max-nodes", type=int, default=None, help="per-instance node expansion limit")
+    parser.add_argument("--timeout", type=float, default=None, help="per-instance time limit in seconds")
+    parser.add_argument("--out", default=None, help="write results as JSON")
+    parser.add_argument("--compare", default=None, help="baseline JSON from an earlier run")
+    parser.add_argument("--time-threshold", type=float, default=0.20, help="allowed wall-time growth (fraction)")
+    parser.add_argument("--nodes-threshold", type=float, default=0.05, help="allowed node-count growth (fraction)")
+    args = parser.parse_args(argv)
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "started": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "limit": args.limit, "max_nodes": args.max_nodes, "timeout": args.timeout,
+        },
+        "results": [],
+    }
+    print("%-10s %-26s %5s %7s %9s %10s %12s %10s" % ("set", "pair", "n", "optimal", "seconds", "nodes", "nodes/sec", "rss KiB"))
+    # maxtasksperchild=1: every pair gets a fresh process, so peak RSS is its own
+    with mp.get_context().Pool(1, maxtasksperchild=1) as pool:
+        for set_name in args.sets:
+            for pair in args.pairs:
+                row = pool.apply(run_pair, (set_name, pair, args.limit, args.max_nodes, args.timeout))
+                results["results"].append(row)
+                print("%-10s %-26s %5d %7d %9.3f %10d %12.0f %10d" % (
+                    row["set"], row["pair"], row["instances"], row["optimal"], row["wall_seconds"],
+                    row["nodes"], row["nodes_per_second"], row["peak_rss_kb"]))
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.time_threshold, args.nodes_threshold)
+        for line in regressions:
+            print("REGRESSION " + line)
+        if regressions:
+            return 1
+        print("no regressions against %s" % args.compare)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""
+Import-time budget for the game logic and solver packages.
+
+    python -m benchmarks.startup --repeat 5 --out startup.json
+
+Solvers run in short-lived worker processes (batch.py, ui.export), where
+import time dominates. Each target module is imported in a fresh
+`python -X importtime` process (best of --repeat) and its cumulative import
+time is checked against a budget; it must also not pull in numpy or pygame.
+Exits with status 1 when any target breaks its budget.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY = ("numpy", "pygame")
+
+# module -> cumulative import budget in milliseconds (numpy alone is ~100ms)
+BUDGETS = {
+    "core.board": 40,
+    "core.shuffler": 40,
+    "solvers.registry": 40,
+    "solvers.bfs": 60,
+    "solvers.ida_star": 60,
+    "solvers.a_star": 60,
+    "solvers.reduction": 60,
+}
+
+def measure(module):
+    """Import `module` in a fresh interpreter: (cumulative microseconds, heavy modules loaded)."""
+    code = "import sys, %s; print(' '.join(sys.modules))" % module
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    micros = None
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if line.startswith("import time:") and line.rsplit("|", 1)[-1].strip() == module:
+            micros = int(line.split("|")[1])
+    loaded = set(result.stdout.split())
+    return micros, [name for name in HEAVY if name in loaded]
+
+def run(modules, repeat=3):
+    rows = []
+    for module in modules:
+        samples = [measure(module) for _ in range(repeat)]
+        micros = min(sample[0] for sample in samples)
+        heavy = samples[-1][1]
+        budget = BUDGETS.get(module)
+        rows.append({
+            "module": module,
+            "milliseconds": round(micros / 1000, 2),
+            "budget_ms": budget,
+            "heavy_imports": heavy,
+            "ok": not heavy and (budget is None or micros / 1000 <= budget),
+        })
+    return rows
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check import times of the solver packages")
+    parser.add_argument("modules", nargs="*", default=sorted(BUDGETS), help="modules to import (default: all budgeted)")
+    parser.add_argument("--repeat", type=int, default=3, help="fresh imports per module (best is kept)")
+    parser.add_argument("--out", default=None, help="write results as JSON")
+    args = parser.parse_args(argv)
+
+    rows = run(args.modules, args.repeat)
+    print("%-20s %10s %8s  %s" % ("module", "ms", "budget", "heavy imports"))
+    for row in rows:
+        print("%-20s %10.2f %8s  %s%s" % (row["module"], row["milliseconds"], row["budget_ms"] or "-",
+                                          ", ".join(row["heavy_imports"]) or "-", "" if row["ok"] else "  OVER"))
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(rows, f, indent=2)
+    return 0 if all(row["ok"] for row in rows) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,103 @@
-import numpy as np
+from enum import IntEnum
+from core.state import MOVES, codec_for
+
+class Move(IntEnum):
+    """Direction the empty space moves; same order as core.state.MOVES."""
+    UP = 0
+    DOWN = 1
+    LEFT = 2
+    RIGHT = 3
+
+_MOVE_BY_NAME = {move.name: move for move in Move}
+
+_TABLES = {}
+
+def _tables(n):
+    """
+    Per-size lookup tables, built once:
+    - targets[blank][move]: cell the blank moves to, or -1 when off the board
+    - distance[value][cell]: Manhattan distance of tile `value` at `cell`
+    """
+    tables = _TABLES.get(n)
+    if tables is None:
+        targets = []
+        for options in codec_for(n).neighbors:
+            row = [-1] * len(MOVES)
+            for move_name, target in options:
+                row[_MOVE_BY_NAME[move_name]] = target
+            targets.append(tuple(row))
+        distance = [[0] * (n * n)]  # the blank never counts
+        for value in range(1, n * n):
+            goal_row, goal_col = divmod(value - 1, n)
+            distance.append([abs(cell // n - goal_row) + abs(cell % n - goal_col) for cell in range(n * n)])
+        tables = _TABLES[n] = (tuple(targets), distance)
+    return tables
 
 class Board:
+    """
+    Board state kept in a flat row-major tile buffer (0 = blank).
+
+    Moves are table lookups on the blank's index, and the misplaced-tile
+    count and Manhattan sum are updated with each move, so is_solved() and
+    the two basic heuristics are O(1). `grid` is an n x n (read-only) numpy
+    view for existing callers, built on first use so that solvers working on
+    `tiles` never import numpy; assigning to it replaces the tiles.
+    """
     def __init__(self, n):
         self.n = n
-        self.grid = np.arange(1, n*n + 1).reshape((n, n))
-        self.empty_pos = (n-1, n-1)
-        self.grid[self.empty_pos] = 0  # 0 represents the empty space
+        self._targets, self._distance = _tables(n)
+        self.tiles = list(range(1, n * n)) + [0]
+        self.blank = n * n - 1
+        self.misplaced = 0
+        self.manhattan = 0
+        self.history = []  # blank index before each move, for undo()
+        self._grid = None
+
+    @classmethod
+    def from_tiles(cls, tiles):
+        """Build a board from a flat row-major sequence of n*n tile values."""
+        tiles = [int(value) for value in tiles]
+        n = int(round(len(tiles) ** 0.5))
+        if n * n != len(tiles) or sorted(tiles) != list(range(n * n)):
+            raise ValueError("expected a permutation of 0..n*n-1, got %r" % (tiles,))
+        board = cls(n)
+        board.set_tiles(tiles)
+        return board
+
+    def set_tiles(self, tiles):
+        """Overwrite the board with a flat row-major sequence of tile values."""
+        tiles = [int(value) for value in tiles]
+        if len(tiles) != self.n * self.n:
+            raise ValueError("expected %d tiles, got %d" % (self.n * self.n, len(tiles)))
+        self.tiles[:] = tiles
+        self.blank = tiles.index(0)
+        distance = self._distance
+        self.misplaced = sum(1 for cell, value in enumerate(tiles) if value and value != cell + 1)
+        self.manhattan = sum(distance[value][cell] for cell, value in enumerate(tiles))
+        self.history.clear()
+        self._grid = None
+
+    @property
+    def grid(self):
+        if self._grid is None:
+            import numpy as np
+            grid = np.array(self.tiles).reshape((self.n, self.n))
+            grid.flags.writeable = False
+            self._grid = grid
+        return self._grid
+
+    @grid.setter
+    def grid(self, grid):
+        self.set_tiles([value for row in grid for value in row])
+
+    @property
+    def empty_pos(self):
+        return divmod(self.blank, self.n)
+
+    @empty_pos.setter
+    def empty_pos(self, position):
+        y, x = position
+        self.blank = y * self.n + x
 
     def get_grid(self):
         return self.grid
@@ -13,34 +105,48 @@ class Board:
     def get_empty_pos(self):
         return self.empty_pos
 
+    def tile_at(self, y, x):
+        return self.tiles[y * self.n + x]
+
+    def legal_moves(self):
+        targets = self._targets[self.blank]
+        return [move for move in Move if targets[move] >= 0]
+
     def move(self, direction):
-        y, x = self.empty_pos
-        if direction == "UP":
-            if y > 0:
-                self.grid[y][x], self.grid[y-1][x] = self.grid[y-1][x], self.grid[y][x]
-                self.empty_pos = (y-1, x)
-                return True
-        elif direction == "DOWN":
-            if y < self.n - 1:
-                self.grid[y][x], self.grid[y+1][x] = self.grid[y+1][x], self.grid[y][x]
-                self.empty_pos = (y+1, x)
-                return True
-        elif direction == "LEFT":
-            if x > 0:
-                self.grid[y][x], self.grid[y][x-1] = self.grid[y][x-1], self.grid[y][x]
-                self.empty_pos = (y, x-1)
-                return True
-        elif direction == "RIGHT":
-            if x < self.n - 1:
-                self.grid[y][x], self.grid[y][x+1] = self.grid[y][x+1], self.grid[y][x]
-                self.empty_pos = (y, x+1)
-                return True
-        return False
+        """Move the blank by a Move or its name ("UP", ...); False when off the board."""
+        if isinstance(direction, str):
+            direction = _MOVE_BY_NAME.get(direction)
+            if direction is None:
+                return False
+        target = self._targets[self.blank][direction]
+        if target < 0:
+            return False
+        self.history.append(self.blank)
+        self._slide(target)
+        return True
+
+    def undo(self):
+        """Take back the last move; returns it (a Move) or None when there is none."""
+        if not self.history:
+            return None
+        previous = self.history.pop()
+        undone = Move(self._targets[previous].index(self.blank))
+        self._slide(previous)
+        return undone
+
+    def _slide(self, target):
+        tiles, blank = self.tiles, self.blank
+        value = tiles[target]
+        tiles[blank] = value
+        tiles[target] = 0
+        distance = self._distance[value]
+        self.manhattan += distance[blank] - distance[target]
+        self.misplaced += (value != blank + 1) - (value != target + 1)
+        self.blank = target
+        self._grid = None
 
     def is_solved(self):
-        solved_grid = np.arange(1, self.n*self.n + 1).reshape((self.n, self.n))
-        solved_grid[self.n-1][self.n-1] = 0
-        return np.array_equal(self.grid, solved_grid)
+        return self.misplaced == 0
 
     def __str__(self):
         return str(self.grid)
@@ -0,0 +1,89 @@
+"""
+Permutation utilities shared by the solvability check, the shuffler and the
+distance tables: inversion counting and perfect-hash ranking.
+
+Two rankings map the n! permutations of 0..n-1 onto 0..n!-1:
+- Lehmer code: lexicographic order, O(n log n) with a Fenwick tree
+- Myrvold-Ruskey: not ordered, but O(n) with simple swaps, and easy to
+  vectorize - the one used to index tables
+"""
+
+class FenwickTree:
+    """Binary indexed tree over 0..size-1 supporting prefix counts in O(log n)."""
+    def __init__(self, size):
+        self.size = size
+        self.tree = [0] * (size + 1)
+
+    def add(self, index, amount=1):
+        index += 1
+        while index <= self.size:
+            self.tree[index] += amount
+            index += index & -index
+
+    def prefix_sum(self, index):
+        """Sum of entries 0..index-1."""
+        total = 0
+        while index > 0:
+            total += self.tree[index]
+            index -= index & -index
+        return total
+
+def count_inversions(values, upper=None):
+    """
+    Number of pairs i < j with values[i] > values[j], in O(n log n).
+    `values` are distinct non-negative ints below `upper` (default max + 1).
+    """
+    values = [int(value) for value in values]
+    if upper is None:
+        upper = max(values, default=-1) + 1
+    seen = FenwickTree(upper)
+    inversions = 0
+    for count, value in enumerate(values):
+        # earlier values greater than this one
+        inversions += count - seen.prefix_sum(value + 1)
+        seen.add(value)
+    return inversions
+
+def lehmer_rank(perm):
+    """Lexicographic rank of a permutation of 0..n-1."""
+    n = len(perm)
+    seen = FenwickTree(n)
+    rank = 0
+    for i, value in enumerate(perm):
+        # values smaller than this one that are still unused
+        smaller = value - seen.prefix_sum(value)
+        rank = rank * (n - i) + smaller
+        seen.add(value)
+    return rank
+
+def lehmer_unrank(rank, n):
+    """Inverse of lehmer_rank: the permutation of 0..n-1 with that rank."""
+    digits = []
+    for base in range(1, n + 1):
+        rank, digit = divmod(rank, base)
+        digits.append(digit)
+    remaining = list(range(n))
+    return [remaining.pop(digit) for digit in reversed(digits)]
+
+def mr_rank(perm):
+    """Myrvold-Ruskey rank of a permutation of 0..n-1, in O(n)."""
+    perm = list(perm)
+    inverse = [0] * len(perm)
+    for index, value in enumerate(perm):
+        inverse[value] = index
+    rank, scale = 0, 1
+    for i in range(len(perm) - 1, 0, -1):
+        value, j = perm[i], inverse[i]
+        perm[j] = value
+        inverse[value] = j
+        rank += value * scale
+        scale *= i + 1
+    return rank
+
+def mr_unrank(rank, n):
+    """Inverse of mr_rank."""
+    perm = list(range(n))
+    for i in range(n, 0, -1):
+        rank, j = divmod(rank, i)
+        perm[i - 1], perm[j] = perm[j], perm[i - 1]
+    return perm
@@ -1,16 +1,71 @@
 import random
 from core.board import Board
+from core.state import codec_for, is_solvable
 
 class Shuffler:
-    def __init__(self, board):
+    def __init__(self, board, rng=None):
         self.board = board
+        self.rng = rng or random.Random()
 
     def shuffle(self, moves=1000):
+        """
+        Random walk of `moves` blank moves from the current board.
+        Walks on a flat tile list with the precomputed neighbor tables and never
+        steps straight back, then writes the result to the board once.
+        """
+        n = self.board.n
+        neighbors = codec_for(n).neighbors
+        tiles = list(self.board.tiles)
+        blank = self.board.blank
+        previous = None
         for _ in range(moves):
-            direction = random.choice(["UP", "DOWN", "LEFT", "RIGHT"])
-            self.board.move(direction)
+            options = [target for _, target in neighbors[blank] if target != previous]
+            target = self.rng.choice(options)
+            tiles[blank], tiles[target] = tiles[target], 0
+            previous, blank = blank, target
+        self.board.set_tiles(tiles)
+
+    def randomize(self):
+        """Replace the board with a uniformly random solvable configuration."""
+        n = self.board.n
+        tiles = list(range(n * n))
+        self.rng.shuffle(tiles)
+        if not is_solvable(tiles, n):
+            # Swapping two tiles flips the permutation parity - still uniform
+            first, second = [i for i, value in enumerate(tiles) if value != 0][:2]
+            tiles[first], tiles[second] = tiles[second], tiles[first]
+        self.board.set_tiles(tiles)
 
     def is_solvable(self):
-        # This is a placeholder for a real solvability check.
-        # A simple shuffle by making random moves ensures solvability.
-        return True
+        """Parity check (inversions plus blank row) for the current board."""
+        return is_solvable(self.board.tiles, self.board.n)
+
+def random_instances(n, count, seed=None):
+    """
+    `count` uniformly random solvable n x n boards as one (count, n*n) uint8
+    array (row-major tiles, 0 = blank). Sampling is vectorized: shuffle every
+    row, then swap two tiles in the rows with the wrong parity.
+    """
+    import numpy as np
+    size = n * n
+    rng = np.random.default_rng(seed)
+    states = rng.permuted(np.tile(np.arange(size, dtype=np.uint8), (count, 1)), axis=1)
+
+    later = np.triu(np.ones((size, size), dtype=bool), 1)
+    parity = np.empty(count, dtype=np.int64)
+    for start in range(0, count, 1024):
+        chunk = states[start:start + 1024].astype(np.int16)
+        chunk = np.where(chunk == 0, -1, chunk)  # the blank never counts as inverted
+        pairs = (chunk[:, :, None] > chunk[:, None, :]) & (chunk[:, None, :] >= 0) & later
+        parity[start:start + 1024] = pairs.sum(axis=(1, 2))
+    if n % 2 == 0:
+        blank_row = (states == 0).argmax(axis=1) // n
+        parity += n - 1 - blank_row
+
+    bad = np.nonzero(parity % 2)[0]
+    if bad.size:
+        # first two non-blank cells of each unsolvable row
+        cells = np.argsort(states[bad] == 0, axis=1, kind="stable")[:, :2]
+        rows = bad[:, None]
+        states[rows, cells] = states[rows, cells[:, ::-1]]
+    return states
@@ -0,0 +1,133 @@
+"""
+Compact packed-integer encoding for puzzle states.
+
+A board is stored as a single Python int with one fixed-width field per cell:
+- 4-bit nibbles for boards up to 4x4 (a 4x4 state fits in 64 bits)
+- 8-bit bytes above that (the int is the little-endian bytes of the tiles)
+
+The blank position is tracked alongside the packed value, so generating a
+successor is a constant-time swap of two fields instead of rebuilding a grid.
+"""
+from core.permutation import count_inversions
+
+# (name, dy, dx) - direction the empty space moves, same order as the solvers
+MOVES = (
+    ("UP", -1, 0),
+    ("DOWN", 1, 0),
+    ("LEFT", 0, -1),
+    ("RIGHT", 0, 1),
+)
+
+OPPOSITE = {"UP": "DOWN", "DOWN": "UP", "LEFT": "RIGHT", "RIGHT": "LEFT"}
+
+
+class StateCodec:
+    def __init__(self, n):
+        self.n = n
+        self.size = n * n
+        self.bits = 4 if n <= 4 else 8
+        self.mask = (1 << self.bits) - 1
+        self.shifts = tuple(i * self.bits for i in range(self.size))
+
+        self.goal_tiles = tuple(range(1, self.size)) + (0,)
+        self.goal = self.pack(self.goal_tiles)
+        self.goal_blank = self.size - 1
+
+        # neighbors[blank] -> ((move_name, neighbor_index), ...)
+        neighbors = []
+        for index in range(self.size):
+            y, x = divmod(index, n)
+            options = []
+            for move_name, dy, dx in MOVES:
+                ny, nx = y + dy, x + dx
+                if 0 <= ny < n and 0 <= nx < n:
+                    options.append((move_name, ny * n + nx))
+            neighbors.append(tuple(options))
+        self.neighbors = tuple(neighbors)
+
+    def pack(self, tiles):
+        """Pack a flat sequence of tile values into a single int."""
+        state = 0
+        for shift, value in zip(self.shifts, tiles):
+            state |= int(value) << shift
+        return state
+
+    def unpack(self, state):
+        """Return the flat tuple of tile values for a packed state."""
+        mask = self.mask
+        return tuple((state >> shift) & mask for shift in self.shifts)
+
+    def pack_grid(self, grid):
+        """Pack a 2D grid, returning (state, blank_index)."""
+        return self.pack_tiles([value for row in grid for value in row])
+
+    def pack_tiles(self, tiles):
+        """Pack a flat row-major tile sequence, returning (state, blank_index)."""
+        tiles = [int(value) for value in tiles]
+        return self.pack(tiles), tiles.index(0)
+
+    def unpack_rows(self, state):
+        """Return the state as a list of rows, indexable like Board.grid."""
+        tiles = self.unpack(state)
+        n = self.n
+        return [list(tiles[i * n:(i + 1) * n]) for i in range(n)]
+
+    def tile_at(self, state, index):
+        return (state >> self.shifts[index]) & self.mask
+
+    def find_blank(self, state):
+        mask = self.mask
+        for index, shift in enumerate(self.shifts):
+            if (state >> shift) & mask == 0:
+                return index
+        raise ValueError("state has no blank tile")
+
+    def slide(self, state, blank, target):
+        """Move the blank from `blank` to `target` - O(1) field swap."""
+        tile = (state >> self.shifts[target]) & self.mask
+        return state - (tile << self.shifts[target]) + (tile << self.shifts[blank])
+
+    def successors(self, state, blank):
+        """Yield (move_name, new_state, new_blank) for every legal move."""
+        for move_name, target in self.neighbors[blank]:
+            yield move_name, self.slide(state, blank, target), target
+
+
+_CODECS = {}
+
+
+def codec_for(n):
+    """Shared codec per board size - the tables only need building once."""
+    codec = _CODECS.get(n)
+    if codec is None:
+        codec = _CODECS[n] = StateCodec(n)
+    return codec
+
+
+def is_solvable(tiles, n):
+    """
+    Parity test against the standard goal (blank bottom-right).
+    Odd boards: the inversion count must be even.
+    Even boards: inversions plus the blank's distance from the bottom row
+    must be even.
+    Inversions are counted with a Fenwick tree in O(n log n).
+    """
+    tiles = list(tiles)
+    inversions = count_inversions([value for value in tiles if value != 0], len(tiles))
+    if n % 2 == 1:
+        return inversions % 2 == 0
+    blank_row = tiles.index(0) // n
+    return (inversions + (n - 1 - blank_row)) % 2 == 0
+
+
+class GridView:
+    """
+    Read-only stand-in for Board so board-based heuristics can score search
+    states without allocating a full Board (and its numpy grid).
+    """
+    __slots__ = ("n", "tiles", "grid")
+
+    def __init__(self, n, tiles):
+        self.n = n
+        self.tiles = tiles
+        self.grid = [tiles[i * n:(i + 1) * n] for i in range(n)]
@@ -1,9 +1,11 @@
+import time
 import pygame
 from core.board import Board
 from core.state_manager import StateManager, GameState
 from core.shuffler import Shuffler
-from solvers.a_star import AStarSolver
-from solvers.bfs import BFSSolver
+from solvers.background import SolverThread
+from solvers import registry
+from solvers.solution_cache import SolutionCache, CachedSolver
 from ui.renderer import Renderer
 from ui.components import Button, Slider, DecisionLog, Metrics
 from ui.colors import *
@@ -15,6 +17,9 @@ def main():
     shuffler = Shuffler(board)
     shuffler.shuffle()
 
+    # Boards above this size are solved by reduction, streamed move by move
+    OPTIMAL_MAX_SIZE = 4
+
     # Fixed dimensions
     SIDEBAR_WIDTH = 400
     INITIAL_WINDOW_WIDTH = 1200
@@ -38,6 +43,7 @@ def main():
         
         solve_button = Button(sidebar_x + 50, 50, 150, 50, "Solve (A*)")
         bfs_button = Button(sidebar_x + 50, 120, 150, 50, "Solve (BFS)")
+        cancel_button = Button(sidebar_x + 220, 120, 150, 50, "Cancel")
         shuffle_button = Button(sidebar_x + 50, 190, 150, 50, "Shuffle")
         pause_button = Button(sidebar_x + 220, 190, 150, 50, "Pause")
         board_size_slider = Slider(sidebar_x + 220, 260, 150, 20, 2, 9, n)
@@ -48,6 +54,7 @@ def main():
         return {
             'solve_button': solve_button,
             'bfs_button': bfs_button,
+            'cancel_button': cancel_button,
             'shuffle_button': shuffle_button,
             'pause_button': pause_button,
             'board_size_slider': board_size_slider,
@@ -60,8 +67,95 @@ def main():
     renderer = Renderer(screen, board, cell_size=cell_size)
     ui = create_ui_components(INITIAL_WINDOW_WIDTH, INITIAL_WINDOW_HEIGHT)
 
+    # Solutions survive undo/replay: any board on a cached path is answered at once
+    solution_cache = SolutionCache(capacity=256)
+
+    # Background search and solution playback
+    search = None          # SolverThread while a search is running
+    solver = None          # solver whose moves are being played back
+    move_stream = None     # solver.stream()/steps() being played back, one Step per move
+    last_move_time = 0.0
+    highlight = None
+
+    def start_search(solver_class):
+        nonlocal search, solver
+        if search is not None or move_stream is not None:
+            return
+        solver = CachedSolver(solver_class(board), solution_cache)
+        search = SolverThread(solver)
+        state_manager.set_state(GameState.SOLVING)
+        ui['decision_log'].add_message(f"Searching... {solver.get_decision_basis()}")
+        search.start()
+
+    def start_stream():
+        """Play reduction moves as they are generated - no waiting for the full path."""
+        nonlocal solver, move_stream
+        if search is not None or move_stream is not None:
+            return
+        solver = registry.solver_class("reduction")(board)
+        move_stream = solver.stream()
+        if move_stream is None:
+            ui['decision_log'].add_message("No solution found")
+            return
+        state_manager.set_state(GameState.SOLVING)
+        ui['decision_log'].add_message(f"Solving... {solver.get_decision_basis()}")
+
+    def cancel_search():
+        nonlocal search, highlight, move_stream
+        if search is not None:
+            search.cancel()
+            search = None
+        move_stream = None
+        highlight = None
+        state_manager.set_state(GameState.PLAYING)
+
+    def poll_search():
+        """Apply events posted by the background search since the last frame."""
+        nonlocal search, move_stream
+        if search is None:
+            return
+        for kind, payload in search.poll():
+            if kind == "progress":
+                ui['metrics_display'].set_metrics(payload)
+            elif kind == "solution":
+                ui['decision_log'].add_message(f"Improved solution: {len(payload)} moves")
+            elif kind == "done":
+                ui['metrics_display'].set_metrics(solver.get_metrics())
+                if payload is None:
+                    ui['decision_log'].add_message("No solution found")
+                else:
+                    ui['decision_log'].add_message(f"Solution found: {len(payload)} moves")
+                    move_stream = solver.steps(payload)
+                search = None
+            elif kind == "aborted":
+                ui['decision_log'].add_message(f"Search {payload}")
+                search = None
+            elif kind == "error":
+                ui['decision_log'].add_message(f"Solver error: {payload}")
+                search = None
+
+    def play_next_move(now):
+        """Replay one solution move per speed-slider interval without blocking."""
+        nonlocal last_move_time, highlight, move_stream
+        if search is not None or state_manager.get_state() != GameState.SOLVING:
+            return
+        if now - last_move_time < 1.0 / ui['speed_slider'].value:
+            return
+        step = next(move_stream, None) if move_stream is not None else None
+        if step is None:
+            move_stream = None
+            highlight = None
+            state_manager.set_state(GameState.PLAYING)
+            return
+        highlight = board.get_empty_pos()
+        board.move(step.move)
+        last_move_time = now
+        ui['metrics_display'].set_metrics(solver.get_metrics())
+        ui['decision_log'].add_message(f"Move: {step.move} (g={step.g}, h={step.h}, f={step.f}) - {step.basis}")
+
     def new_game(size):
         nonlocal board, shuffler, renderer, n, cell_size
+        cancel_search()
         n = int(size)
         board = Board(n)
         shuffler = Shuffler(board)
@@ -74,6 +168,7 @@ def main():
 
 
     running = True
+    full_redraw = True
     clock = pygame.time.Clock()
     
     while running:
@@ -87,60 +182,38 @@ def main():
                 cell_size = calculate_layout(event.w, event.h)
                 renderer.cell_size = cell_size
                 ui = create_ui_components(event.w, event.h)
+                full_redraw = True
             if event.type == pygame.MOUSEBUTTONDOWN:
+                full_redraw = True
                 pos = pygame.mouse.get_pos()
                 if ui['solve_button'].is_clicked(pos):
-                    state_manager.set_state(GameState.SOLVING)
-                    solver = AStarSolver(board)
-                    solution = solver.solve()
-                    if solution:
-                        for move in solution:
-                            if state_manager.get_state() == GameState.PAUSED:
-                                while state_manager.get_state() == GameState.PAUSED:
-                                    pygame.time.wait(100)
-                                    for ev in pygame.event.get():
-                                        if ev.type == pygame.MOUSEBUTTONDOWN:
-                                            if ui['pause_button'].is_clicked(pygame.mouse.get_pos()):
-                                                state_manager.set_state(GameState.SOLVING)
-
-                            renderer.highlight_piece(board.get_empty_pos())
-                            board.move(move)
-                            metrics = solver.get_metrics()
-                            ui['metrics_display'].set_metrics(metrics)
-                            renderer.move_animation(board.get_empty_pos(), (board.get_empty_pos()[0], board.get_empty_pos()[1]), duration=ui['speed_slider'].value)
-                            ui['decision_log'].add_message(f"Move: {move} - {solver.get_decision_basis()} Metrics: {metrics}")
-                    state_manager.set_state(GameState.PLAYING)
+                    if n <= OPTIMAL_MAX_SIZE:
+                        start_search(registry.solver_class("astar"))
+                    else:
+                        start_stream()
 
                 if ui['bfs_button'].is_clicked(pos):
-                    state_manager.set_state(GameState.SOLVING)
-                    solver = BFSSolver(board)
-                    solution = solver.solve()
-                    if solution:
-                        for move in solution:
-                            if state_manager.get_state() == GameState.PAUSED:
-                                while state_manager.get_state() == GameState.PAUSED:
-                                    pygame.time.wait(100)
-                                    for ev in pygame.event.get():
-                                        if ev.type == pygame.MOUSEBUTTONDOWN:
-                                            if ui['pause_button'].is_clicked(pygame.mouse.get_pos()):
-                                                state_manager.set_state(GameState.SOLVING)
-
-                            renderer.highlight_piece(board.get_empty_pos())
-                            board.move(move)
-                            metrics = solver.get_metrics()
-                            ui['metrics_display'].set_metrics(metrics)
-                            renderer.move_animation(board.get_empty_pos(), (board.get_empty_pos()[0], board.get_empty_pos()[1]), duration=ui['speed_slider'].value)
-                            ui['decision_log'].add_message(f"Move: {move} - {solver.get_decision_basis()} Metrics: {metrics}")
-                    state_manager.set_state(GameState.PLAYING)
+                    # Whole-layer numpy BFS while states fit in 64 bits (up to 4x4)
+                    start_search(registry.solver_class("layeredbfs" if n <= 4 else "bfs"))
+
+                if ui['cancel_button'].is_clicked(pos):
+                    if search is not None or move_stream is not None:
+                        cancel_search()
 
                 if ui['shuffle_button'].is_clicked(pos):
+                    cancel_search()
                     shuffler.shuffle(100)
                 
                 if ui['pause_button'].is_clicked(pos):
                     if state_manager.get_state() == GameState.PAUSED:
-                        state_manager.set_state(GameState.PLAYING)
+                        busy = search is not None or move_stream is not None
+                        state_manager.set_state(GameState.SOLVING if busy else GameState.PLAYING)
+                        if search is not None:
+                            search.token.resume()
                     else:
                         state_manager.set_state(GameState.PAUSED)
+                        if search is not None:
+                            search.token.pause()
 
                 new_size = ui['board_size_slider'].get_value(pos)
                 if new_size is not None and int(new_size) != n:
@@ -148,6 +221,9 @@ def main():
 
                 ui['speed_slider'].get_value(pos)
 
+        poll_search()
+        play_next_move(time.monotonic())
+
         # Manual playing logic
         if state_manager.get_state() == GameState.PLAYING:
             keys = pygame.key.get_pressed()
@@ -163,23 +239,27 @@ def main():
             if moved:
                  ui['decision_log'].add_message("Manual Move")
 
-        # Drawing
-        screen.fill(WHITE)
-        renderer.draw_grid()
-        renderer.draw_pieces()
-        ui['solve_button'].draw(screen)
-        ui['bfs_button'].draw(screen)
-        ui['shuffle_button'].draw(screen)
-        ui['pause_button'].draw(screen)
-        ui['speed_slider'].draw(screen)
-        ui['board_size_slider'].draw(screen)
-        ui['decision_log'].draw(screen)
-        ui['metrics_display'].draw(screen)
-        pygame.display.flip()
+        # Drawing: repaint everything only after a resize or click, otherwise
+        # just the cells and panels that changed
+        if full_redraw:
+            screen.fill(WHITE)
+            renderer.draw(highlight, full=True)
+            for component in ui.values():
+                component.draw(screen)
+            pygame.display.flip()
+            full_redraw = False
+        else:
+            dirty = renderer.draw(highlight)
+            for name in ('decision_log', 'metrics_display'):
+                if ui[name].dirty:
+                    ui[name].draw(screen)
+                    dirty.append(ui[name].rect)
+            if dirty:
+                pygame.display.update(dirty)
         clock.tick(60)
 
+    cancel_search()
     pygame.quit()
 
 if __name__ == "__main__":
     main()
-
@@ -1,34 +1,103 @@
 import heapq
-import numpy as np
-from solvers.base_solver import BaseSolver
-from solvers.heuristics import manhattan_distance_incremental, manhattan_distance
+import itertools
+import time
+from core.state import codec_for, is_solvable
+from solvers.base_solver import BaseSolver, SearchAborted
+from solvers.heuristics import manhattan_distance, batch_heuristic, states_to_array
+from solvers.open_list import OPEN_LISTS
+
+class _Node:
+    """Search-tree node for the memory-bounded mode."""
+    __slots__ = ("state", "blank", "g", "h", "f", "parent", "move", "children", "forgotten", "in_open", "seq")
+
+    def __init__(self, state, blank, g, h, f, parent, move):
+        self.state = state
+        self.blank = blank
+        self.g = g
+        self.h = h
+        self.f = f
+        self.parent = parent
+        self.move = move
+        self.children = 0       # successors currently held in memory
+        self.forgotten = None   # move -> backed-up f of each dropped successor
+        self.in_open = False
+        self.seq = 0            # matches the live open-list entries
+
+# Bytes per stored node in the bounded mode, measured on CPython 3.11 with a
+# 4x4 board (node object, packed state, forgotten-f dicts and heap entries,
+# including not-yet-compacted stale ones). Turns max_bytes into a node count.
+NODE_BYTES = 1024
 
 class AStarSolver(BaseSolver):
-    def __init__(self, board, heuristic=manhattan_distance):
+    def __init__(self, board, heuristic=manhattan_distance, open_list="heap", max_stored=None, max_bytes=None,
+                 weight=1):
         super().__init__(board)
         self.heuristic = heuristic
+        # "heap" (binary heap) or "bucket" (integer f/g buckets, see solvers.open_list)
+        if open_list not in OPEN_LISTS:
+            raise ValueError("unknown open list %r (choose from %s)" % (open_list, ", ".join(OPEN_LISTS)))
+        self.open_list = open_list
+        # Weighted A*: f = g + weight * h finds paths at most `weight` times
+        # longer than optimal, usually after far fewer expansions
+        if weight < 1:
+            raise ValueError("weight must be at least 1")
+        if weight == int(weight):
+            weight = int(weight)  # keep f integral (and bucketable)
+        elif open_list == "bucket":
+            raise ValueError("the bucket open list needs an integer weight")
+        self.weight = weight
+        # Memory budget in stored nodes and/or bytes; either one switches to
+        # the SMA*-style bounded search
+        self.memory_limit = max_stored
+        if max_bytes is not None:
+            by_bytes = max_bytes // NODE_BYTES
+            self.memory_limit = by_bytes if max_stored is None else min(max_stored, by_bytes)
+        if self.memory_limit is not None and self.memory_limit < 2:
+            raise ValueError("memory budget must hold at least two nodes")
         self.nodes_explored = 0
         self.path_cost = 0
+        self.dropped_nodes = 0
+        self.regenerated_nodes = 0
+        self.peak_stored_states = 0
         
         # Pre-calculate goal state once
-        n = board.n
-        self.goal_state = tuple(list(range(1, n*n)) + [0])
+        self.codec = codec_for(board.n)
+        self.goal_state = self.codec.goal
 
     def solve(self):
         """
-        A* search using state tuples and parent pointers for efficiency.
-        - Stores only state hashes, not full Board objects
+        A* search over packed integer states with parent pointers.
+        - States are single ints (see core.state), not tuples of numpy ints
+        - The blank index travels with each frontier entry, so successors
+          are O(1) field swaps instead of grid rebuilds
+        - All successors of a node are scored in one batched heuristic call
+          (no per-node Board allocation)
         - Uses parent pointers to reconstruct path (O(depth) instead of O(nodes))
-        - Reduces memory from O(nodes * depth) to O(nodes)
+        - The open list is a binary heap or integer f/g buckets (open_list=)
+        - weight > 1 inflates h (weighted A*): bounded-suboptimal, much faster
+        - Emits instrumentation events only when something is subscribed
+        - With a memory budget, runs the bounded search in _solve_bounded
         """
-        n = self.board.n
-        start_state = tuple(self.board.grid.flatten())
+        self._start_search()
+        emit = self._emitter()
+        codec = self.codec
+        score = batch_heuristic(self.heuristic, self.board.n)
+        start_state, start_blank = codec.pack_tiles(self.board.tiles)
         
         if start_state == self.goal_state:
             return []
+        if not is_solvable(self.board.tiles, self.board.n):
+            return None  # the other parity class is never reached: don't exhaust it
         
-        # Priority queue: (cost, depth, state)
-        frontier = [(self.heuristic(self.board), 0, start_state)]
+        # Open list of (cost, depth, state, blank) entries
+        start_h = int(score(states_to_array(codec, [start_state]))[0])
+        self.best_h = start_h
+        if self.memory_limit is not None:
+            return self._solve_bounded(score, start_state, start_blank, start_h, emit)
+        weight = self.weight
+        frontier = OPEN_LISTS[self.open_list]()
+        push, pop = frontier.push, frontier.pop
+        push(weight * start_h, 0, start_state, start_blank)
         
         # Track visited states and their parents for path reconstruction
         visited = set()
@@ -36,60 +105,191 @@ class AStarSolver(BaseSolver):
         cost_map = {start_state: 0}  # state -> g(n)
         
         while frontier:
-            _, depth, current_state = heapq.heappop(frontier)
+            f, depth, current_state, blank = pop()
             
             if current_state in visited:
+                if emit is not None:
+                    emit("duplicate", state=current_state, g=depth)
                 continue
                 
             visited.add(current_state)
             self.nodes_explored += 1
+            if self.nodes_explored >= self._next_check:
+                self.f_bound = f
+                self._checkpoint()
+            if emit is not None:
+                emit("expand", state=current_state, g=depth, h=(f - depth) / weight if weight != 1 else f - depth)
             
             if current_state == self.goal_state:
                 # Reconstruct path from parent pointers
                 self.path_cost = depth
                 return self._reconstruct_path(parent_map, current_state)
             
-            # Find empty position in current state
-            current_grid = np.array(current_state, dtype=int).reshape(n, n)
-            empty_pos = tuple(np.argwhere(current_grid == 0)[0])
-            y, x = empty_pos
-            
-            # Try all 4 moves
-            moves = [
-                ("UP", -1, 0),
-                ("DOWN", 1, 0),
-                ("LEFT", 0, -1),
-                ("RIGHT", 0, 1)
-            ]
-            
-            for move_name, dy, dx in moves:
-                ny, nx = y + dy, x + dx
-                
-                if 0 <= ny < n and 0 <= nx < n:
-                    # Create new state by swapping
-                    new_grid = current_grid.copy()
-                    new_grid[y, x], new_grid[ny, nx] = new_grid[ny, nx], new_grid[y, x]
-                    new_state = tuple(new_grid.flatten())
-                    
-                    if new_state not in visited:
-                        new_g = cost_map[current_state] + 1
+            new_g = cost_map[current_state] + 1
+            children = []
+            if emit is not None:
+                started = time.perf_counter()
+            for move_name, new_state, new_blank in codec.successors(current_state, blank):
+                if new_state not in visited:
+                    if new_state not in cost_map or new_g < cost_map[new_state]:
+                        cost_map[new_state] = new_g
                         
-                        if new_state not in cost_map or new_g < cost_map[new_state]:
-                            cost_map[new_state] = new_g
-                            
-                            # Calculate heuristic for new state
-                            temp_board = self.board.__class__(n)
-                            temp_board.grid = new_grid
-                            new_h = self.heuristic(temp_board)
-                            new_f = new_g + new_h
-                            
-                            # Store parent info for path reconstruction
-                            parent_map[new_state] = (current_state, move_name)
-                            
-                            heapq.heappush(frontier, (new_f, new_g, new_state))
+                        # Store parent info for path reconstruction
+                        parent_map[new_state] = (current_state, move_name)
+                        children.append((new_state, new_blank))
+                        continue
+                if emit is not None:
+                    emit("duplicate", state=new_state, g=new_g)
+            if emit is not None:
+                emit("timing", phase="successors", seconds=time.perf_counter() - started)
+                for new_state, _ in children:
+                    emit("generate", state=new_state, g=new_g, parent=current_state)
+            
+            if children:
+                # Calculate heuristic for all new states at once
+                if emit is not None:
+                    started = time.perf_counter()
+                h_values = score(states_to_array(codec, [state for state, _ in children])).tolist()
+                if emit is not None:
+                    emit("timing", phase="heuristic", seconds=time.perf_counter() - started)
+                lowest = min(h_values)
+                if lowest < self.best_h:
+                    self.best_h = lowest
+                for (new_state, new_blank), new_h in zip(children, h_values):
+                    push(new_g + weight * new_h, new_g, new_state, new_blank)
+            if emit is not None:
+                emit("frontier", size=len(frontier))
         
         return None  # No solution found
 
+    def _solve_bounded(self, score, start_state, start_blank, start_h, emit):
+        """
+        SMA*-style search that never holds more than memory_limit nodes.
+        - Searches the tree of move sequences (like IDA*, only the move that
+          undoes the previous one is pruned), so a node's f only ever
+          describes its own subtree and backed-up values stay admissible
+        - Open nodes are ordered by (f, deepest first); once the budget is
+          exceeded the worst leaf (highest f, shallowest) is dropped
+        - A dropped node's f is backed up into its parent, which goes back on
+          the open list at the lowest forgotten f; expanding it again
+          regenerates only the forgotten successors, at their backed-up f
+        - f never decreases from parent to child (pathmax), and a node too
+          deep to extend within the budget gets f = inf
+        - h is scaled by the weight like the unbounded search
+        - Optimal whenever the budget can hold the optimal path; raises
+          SearchAborted("memory limit") when nothing finite is left to expand
+        """
+        codec = self.codec
+        limit = self.memory_limit
+        weight = self.weight
+        infinity = float("inf")
+        counter = itertools.count()
+        best = []   # (f, -g, seq, node): lowest f, deepest first
+        worst = []  # (-f, g, seq, node): highest f, shallowest first
+        root = _Node(start_state, start_blank, 0, start_h, weight * start_h, None, None)
+        stored = 1
+
+        def open_node(node):
+            node.in_open = True
+            node.seq = next(counter)
+            heapq.heappush(best, (node.f, -node.g, node.seq, node))
+            heapq.heappush(worst, (-node.f, node.g, node.seq, node))
+
+        def compact():
+            # Stale heap entries keep dropped nodes alive; rebuild from live ones
+            best[:] = [entry for entry in best if entry[3].in_open and entry[3].seq == entry[2]]
+            worst[:] = [entry for entry in worst if entry[3].in_open and entry[3].seq == entry[2]]
+            heapq.heapify(best)
+            heapq.heapify(worst)
+
+        def drop_worst_leaf():
+            while worst:
+                _, _, seq, node = heapq.heappop(worst)
+                if node.in_open and node.seq == seq and not node.children and node.parent is not None:
+                    break
+            else:
+                return False
+            node.in_open = False
+            self.dropped_nodes += 1
+            if emit is not None:
+                emit("drop", state=node.state, f=node.f)
+            parent = node.parent
+            if parent.forgotten is None:
+                parent.forgotten = {}
+            parent.forgotten[node.move] = node.f
+            parent.f = min(parent.forgotten.values())
+            parent.children -= 1
+            open_node(parent)
+            return True
+
+        open_node(root)
+        while best:
+            _, _, seq, node = heapq.heappop(best)
+            if not node.in_open or node.seq != seq:
+                continue
+            if node.f == infinity:
+                raise SearchAborted("memory limit")
+            node.in_open = False
+            self.nodes_explored += 1
+            if self.nodes_explored >= self._next_check:
+                self.f_bound = node.f
+                self._checkpoint()
+            if emit is not None:
+                emit("expand", state=node.state, g=node.g, h=node.h)
+
+            if node.state == self.goal_state:
+                path = []
+                while node.parent is not None:
+                    path.append(node.move)
+                    node = node.parent
+                path.reverse()
+                self.path_cost = len(path)
+                return path
+
+            forgotten = node.forgotten
+            node.forgotten = None
+            back = None if node.parent is None else node.parent.state
+            new_g = node.g + 1
+            children = []
+            for move_name, new_state, new_blank in codec.successors(node.state, node.blank):
+                if forgotten is not None and move_name not in forgotten:
+                    continue  # that successor is still in memory
+                if new_state == back:
+                    if emit is not None:
+                        emit("duplicate", state=new_state, g=new_g)
+                    continue  # would undo the previous move
+                children.append((move_name, new_state, new_blank))
+
+            h_values = score(states_to_array(codec, [state for _, state, _ in children])).tolist()
+            for (move_name, new_state, new_blank), new_h in zip(children, h_values):
+                if new_h < self.best_h:
+                    self.best_h = new_h
+                if new_state != self.goal_state and new_g + 1 >= limit:
+                    f = infinity  # its successors could never be stored
+                else:
+                    f = max(node.f, new_g + weight * new_h)
+                    if forgotten is not None:
+                        f = max(f, forgotten[move_name])
+                child = _Node(new_state, new_blank, new_g, new_h, f, node, move_name)
+                node.children += 1
+                stored += 1
+                open_node(child)
+                if forgotten is not None:
+                    self.regenerated_nodes += 1
+                if emit is not None:
+                    emit("generate", state=new_state, g=new_g, parent=node.state)
+
+            while stored > limit and drop_worst_leaf():
+                stored -= 1
+            if len(best) + len(worst) > 3 * limit + 64:
+                compact()
+            if stored > self.peak_stored_states:
+                self.peak_stored_states = stored
+            if emit is not None:
+                emit("frontier", size=stored)
+
+        return None  # No solution found
+
     def _reconstruct_path(self, parent_map, goal_state):
         """Reconstruct path from parent pointers - O(depth) operation"""
         path = []
@@ -103,12 +303,23 @@ class AStarSolver(BaseSolver):
         return list(reversed(path))
 
     def get_decision_basis(self):
+        if self.weight != 1:
+            return "Choosing move that minimizes f(n) = g(n) + %s * h(n)" % self.weight
         return "Choosing move that minimizes f(n) = g(n) + h(n)"
 
     def get_metrics(self):
-        return {
+        metrics = {
             "Nodes Explored": self.nodes_explored,
             "Path Cost": self.path_cost,
-            "Algorithm": "A*"
+            "Algorithm": "A*",
+            "Open List": self.open_list
         }
+        if self.weight != 1:
+            metrics["Weight"] = self.weight
+        if self.memory_limit is not None:
+            metrics["Memory Limit (nodes)"] = self.memory_limit
+            metrics["Peak Stored States"] = self.peak_stored_states
+            metrics["Dropped Nodes"] = self.dropped_nodes
+            metrics["Regenerated Nodes"] = self.regenerated_nodes
+        return metrics
 
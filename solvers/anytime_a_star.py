@@ -0,0 +1,224 @@
+import heapq
+import time
+from core.state import codec_for, is_solvable
+from solvers.base_solver import BaseSolver, SearchAborted
+from solvers.heuristics import manhattan_distance, batch_heuristic, states_to_array
+from solvers.reduction import ReductionSolver
+
+class AnytimeAStarSolver(BaseSolver):
+    """
+    Anytime Repairing A* (ARA*): a fast weighted-A* solution first, then
+    better ones with a shrinking weight until the weight reaches 1 (optimal)
+    or a limit stops the search. Every improved path is published through
+    the solution callback (see BaseSolver.attach) and kept in `solutions`.
+
+    With `seed` (the default) a ReductionSolver path, found in milliseconds
+    on any size, is the first incumbent: a limit always leaves a path, even
+    when weighted A* finds none in time (5x5 and up).
+    """
+    def __init__(self, board, heuristic=manhattan_distance, weight=5, step=None, seed=True):
+        super().__init__(board)
+        if weight < 1:
+            raise ValueError("weight must be at least 1")
+        self.heuristic = heuristic
+        self.initial_weight = weight
+        # Default: halve the excess weight each round (5 -> 3 -> 2 -> 1.5 -> ...)
+        self.step = step
+        self.seed = seed
+        self.weight = weight
+        self.nodes_explored = 0
+        self.path_cost = 0
+        self.bound = None        # proven suboptimality bound of the best path
+        self.stopped = None      # limit that ended the search early, if any
+        self.solutions = []      # {"cost", "weight", "bound", "seconds", "nodes"} per improvement
+
+        self.codec = codec_for(board.n)
+        self.goal_state = self.codec.goal
+
+    def _next_weight(self, weight):
+        if self.step is not None:
+            weight -= self.step
+        else:
+            weight = 1 + (weight - 1) / 2
+            if weight < 1.05:
+                weight = 1
+        return max(1, weight)
+
+    def solve(self):
+        """
+        ARA* over packed integer states.
+        - Each round runs weighted A* with f = g + w * h, reusing g-values and
+          parent pointers from earlier rounds instead of starting over
+        - States improved after being expanded in a round go to an
+          inconsistent list and are re-queued, with fresh keys, next round
+        - A round stops as soon as no queued state could beat the current
+          path, so later rounds only repair the previous solution
+        - Starts from a ReductionSolver path (unless seed=False), and queues
+          no state with g + h at or above the best path's cost
+        - When a limit (time, nodes, cancel) hits after a path was found,
+          the best path so far is returned instead of raising
+        - Manhattan distance is updated in O(1) per move; other heuristics
+          score each expansion's new states in one batched call
+        """
+        self._start_search()
+        started = time.monotonic()
+        codec = self.codec
+        score = batch_heuristic(self.heuristic, self.board.n)
+        start_state, start_blank = codec.pack_tiles(self.board.tiles)
+        goal = self.goal_state
+
+        if start_state == goal:
+            return []
+        if not is_solvable(codec.unpack(start_state), self.board.n):
+            return None  # No solution found
+
+        start_h = int(score(states_to_array(codec, [start_state]))[0])
+        self.best_h = start_h
+        h_map = {start_state: start_h}
+        cost_map = {start_state: 0}
+        parent_map = {}       # state -> (parent_state, move_taken)
+        blanks = {start_state: start_blank}
+        distance = self._manhattan_table() if self.heuristic is manhattan_distance else None
+        inconsistent = {start_state}
+        best_path = None
+        weight = self.initial_weight
+        if self.seed:
+            best_path = ReductionSolver(self.board).solve()
+            self._publish(best_path, None, cost_map, h_map, inconsistent, started)
+
+        try:
+            while True:
+                self.weight = weight
+                # New round: every open or inconsistent state re-keyed with the new weight
+                frontier = [(cost_map[s] + weight * h_map[s], cost_map[s], s) for s in inconsistent]
+                heapq.heapify(frontier)
+                queued = inconsistent
+                inconsistent = set()
+                closed = set()
+
+                while frontier:
+                    f, g, state = frontier[0]
+                    goal_g = cost_map.get(goal)
+                    if goal_g is not None and goal_g <= f:
+                        break  # nothing queued can improve on the current path
+                    heapq.heappop(frontier)
+                    if state in closed or g != cost_map[state]:
+                        continue  # stale entry
+                    closed.add(state)
+                    queued.discard(state)
+                    self.nodes_explored += 1
+                    if self.nodes_explored >= self._next_check:
+                        self.f_bound = f
+                        self._checkpoint()
+
+                    new_g = g + 1
+                    blank = blanks[state]
+                    improved = []
+                    for move_name, new_state, new_blank in codec.successors(state, blank):
+                        old_g = cost_map.get(new_state)
+                        if old_g is not None and old_g <= new_g:
+                            continue
+                        if distance is not None and old_g is None:
+                            # The tile at new_blank slides into the old blank cell
+                            tile = distance[codec.tile_at(state, new_blank)]
+                            h = h_map[new_state] = h_map[state] + tile[blank] - tile[new_blank]
+                            if h < self.best_h:
+                                self.best_h = h
+                        cost_map[new_state] = new_g
+                        parent_map[new_state] = (state, move_name)
+                        blanks[new_state] = new_blank
+                        if new_state in closed:
+                            inconsistent.add(new_state)
+                        else:
+                            improved.append(new_state)
+
+                    fresh = [s for s in improved if s not in h_map]
+                    if fresh:
+                        for s, h in zip(fresh, score(states_to_array(codec, fresh)).tolist()):
+                            h_map[s] = h
+                            if h < self.best_h:
+                                self.best_h = h
+                    for s in improved:
+                        if best_path is not None and new_g + h_map[s] >= len(best_path):
+                            continue  # cannot lead to a shorter path
+                        heapq.heappush(frontier, (new_g + weight * h_map[s], new_g, s))
+                        queued.add(s)
+
+                # Everything still queued carries over to the next round
+                inconsistent |= queued
+                goal_g = cost_map.get(goal)
+                if goal_g is not None and (best_path is None or goal_g < len(best_path)):
+                    best_path = self._reconstruct_path(parent_map, goal)
+                    self._publish(best_path, weight, cost_map, h_map, inconsistent, started)
+                elif best_path is not None:
+                    self.bound = self._bound(len(best_path), weight, cost_map, h_map, inconsistent)
+
+                if weight == 1 or (goal_g is None and not inconsistent):
+                    break  # optimal, or nothing left that could beat the incumbent
+                weight = self._next_weight(weight)
+        except SearchAborted as exc:
+            if best_path is None:
+                raise
+            self.stopped = exc.reason
+
+        if best_path is not None:
+            self.path_cost = len(best_path)
+        return best_path
+
+    def _manhattan_table(self):
+        """distance[tile][cell]: Manhattan distance from cell to the tile's goal cell."""
+        n = self.board.n
+        distance = [[0] * (n * n)]
+        for tile in range(1, n * n):
+            goal_y, goal_x = divmod(tile - 1, n)
+            distance.append([abs(cell // n - goal_y) + abs(cell % n - goal_x) for cell in range(n * n)])
+        return distance
+
+    def _bound(self, cost, weight, cost_map, h_map, pending):
+        """
+        min(w, cost / lowest g + h still pending): how far from optimal `cost`
+        can be. `weight` is None for the seed path, which only has the ratio.
+        """
+        lowest = min((cost_map[s] + h_map[s] for s in pending), default=cost)
+        if lowest >= cost:
+            return 1
+        if weight is None:
+            return cost / lowest
+        return min(weight, cost / lowest) if lowest else weight
+
+    def _publish(self, path, weight, cost_map, h_map, pending, started):
+        self.bound = self._bound(len(path), weight, cost_map, h_map, pending)
+        self.path_cost = len(path)
+        self.solutions.append({
+            "cost": len(path),
+            "weight": weight,
+            "bound": round(self.bound, 3),
+            "seconds": round(time.monotonic() - started, 3),
+            "nodes": self.nodes_explored
+        })
+        if self.solution_callback is not None:
+            self.solution_callback(list(path))
+
+    def _reconstruct_path(self, parent_map, goal_state):
+        """Reconstruct path from parent pointers - O(depth) operation"""
+        path = []
+        current_state = goal_state
+        while current_state in parent_map:
+            parent_state, move = parent_map[current_state]
+            path.append(move)
+            current_state = parent_state
+        return list(reversed(path))
+
+    def get_decision_basis(self):
+        return "Minimizing f(n) = g(n) + w * h(n), lowering w after each solution (now w = %s)" % self.weight
+
+    def get_metrics(self):
+        return {
+            "Nodes Explored": self.nodes_explored,
+            "Path Cost": self.path_cost,
+            "Algorithm": "Anytime A* (ARA*)",
+            "Weight": self.weight,
+            "Suboptimality Bound": None if self.bound is None else round(self.bound, 3),
+            "Solutions": [entry["cost"] for entry in self.solutions],
+            "Stopped": self.stopped
+        }
@@ -0,0 +1,73 @@
+"""
+Run a solver on a background thread so a UI loop never blocks on search.
+"""
+import queue
+import threading
+from solvers.base_solver import SearchAborted
+
+class CancelToken:
+    """Shared flag the UI flips to pause, resume or cancel a running search."""
+    def __init__(self):
+        self._cancelled = threading.Event()
+        self._running = threading.Event()
+        self._running.set()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    @property
+    def paused(self):
+        return not self._running.is_set()
+
+    def cancel(self):
+        self._cancelled.set()
+        self._running.set()  # wake a paused search so it can exit
+
+    def pause(self):
+        self._running.clear()
+
+    def resume(self):
+        self._running.set()
+
+    def wait_if_paused(self):
+        self._running.wait()
+
+class SolverThread(threading.Thread):
+    """
+    Runs solver.solve() off the UI thread and posts events to a queue:
+    ("progress", dict), ("solution", path), ("done", path_or_None),
+    ("aborted", reason), ("error", exc)
+    "solution" events only come from anytime solvers, once per improved path.
+    """
+    def __init__(self, solver, token=None):
+        super().__init__(daemon=True)
+        self.solver = solver
+        self.token = token or CancelToken()
+        self.events = queue.Queue()
+        self.solver.attach(self.token, self._post_progress, self._post_solution)
+
+    def _post_progress(self, progress):
+        self.events.put(("progress", progress))
+
+    def _post_solution(self, moves):
+        self.events.put(("solution", moves))
+
+    def run(self):
+        try:
+            self.events.put(("done", self.solver.solve()))
+        except SearchAborted as exc:
+            self.events.put(("aborted", exc.reason))
+        except Exception as exc:  # surface solver bugs in the UI instead of killing the thread silently
+            self.events.put(("error", exc))
+
+    def cancel(self):
+        self.token.cancel()
+
+    def poll(self):
+        """Yield every event posted since the last call, without blocking."""
+        while True:
+            try:
+                yield self.events.get_nowait()
+            except queue.Empty:
+                return
@@ -1,13 +1,174 @@
+import time
 from abc import ABC, abstractmethod
+from collections import namedtuple
+from core.state import codec_for, GridView
+
+# One streamed solution step: the move, then g/h/f of the position it leads to
+Step = namedtuple("Step", "move g h f basis")
+
+class SearchAborted(Exception):
+    """Raised from solve() when a search limit is hit before a solution is found."""
+    def __init__(self, reason):
+        super().__init__(reason)
+        self.reason = reason
 
 class BaseSolver(ABC):
+    # Limits are polled every CHECK_INTERVAL expansions, keeping the hot loop cheap
+    CHECK_INTERVAL = 1024
+
     def __init__(self, board):
         self.board = board
+        self.max_nodes = None
+        self.time_limit = None
+        self.cancel_token = None
+        self.progress_callback = None
+        self.solution_callback = None  # anytime solvers report each improved path here
+        self.f_bound = None  # current f-cost bound, kept fresh at checkpoints
+        self.best_h = None   # lowest heuristic value seen so far
+        self._deadline = None
+        self._next_check = self.CHECK_INTERVAL
+        self._subscribers = {}  # event name (None = all events) -> [callback]
+
+    def set_limits(self, max_nodes=None, time_limit=None):
+        """Cap the search by expanded nodes and/or wall-clock seconds."""
+        self.max_nodes = max_nodes
+        self.time_limit = time_limit
+        return self
+
+    def attach(self, cancel_token=None, progress_callback=None, solution_callback=None):
+        """
+        Let another thread steer the search: `cancel_token` (see
+        solvers.background.CancelToken) can pause or cancel it,
+        `progress_callback(progress)` is called at every checkpoint and
+        `solution_callback(moves)` whenever an anytime solver improves its path.
+        """
+        self.cancel_token = cancel_token
+        self.progress_callback = progress_callback
+        self.solution_callback = solution_callback
+        return self
+
+    def subscribe(self, callback, events=None):
+        """
+        Call `callback(event, data)` for the given events (all when None);
+        see solvers.instrumentation for the event names and payloads.
+        """
+        for event in (None,) if events is None else events:
+            self._subscribers.setdefault(event, []).append(callback)
+        return self
+
+    def unsubscribe(self, callback):
+        for event in list(self._subscribers):
+            callbacks = [cb for cb in self._subscribers[event] if cb is not callback]
+            if callbacks:
+                self._subscribers[event] = callbacks
+            else:
+                del self._subscribers[event]
+        return self
+
+    def _emitter(self):
+        """
+        emit(event, **data) for solve() to call, or None when nobody is
+        subscribed so the search loop can skip instrumentation entirely.
+        """
+        if not self._subscribers:
+            return None
+        subscribers = self._subscribers
+        everything = subscribers.get(None, ())
+
+        def emit(event, **data):
+            for callback in subscribers.get(event, ()):
+                callback(event, data)
+            for callback in everything:
+                callback(event, data)
+        return emit
+
+    def progress(self):
+        """Snapshot of the running search for live display."""
+        return {
+            "Nodes Explored": self.nodes_explored,
+            "f Bound": self.f_bound,
+            "Best h": self.best_h
+        }
+
+    def _start_search(self):
+        """Arm the limits; solvers call this at the top of solve()."""
+        self._deadline = None if self.time_limit is None else time.monotonic() + self.time_limit
+        self._next_check = self.nodes_explored + self.CHECK_INTERVAL
+        if self.max_nodes is not None:
+            self._next_check = min(self._next_check, self.max_nodes)
+
+    def _checkpoint(self):
+        """
+        Called from the search loop once nodes_explored reaches _next_check.
+        Raises SearchAborted when a limit has been exceeded.
+        """
+        if self.max_nodes is not None and self.nodes_explored >= self.max_nodes:
+            raise SearchAborted("node limit")
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            raise SearchAborted("timeout")
+        if self.cancel_token is not None:
+            self.cancel_token.wait_if_paused()
+            if self.cancel_token.cancelled:
+                raise SearchAborted("cancelled")
+        if self.progress_callback is not None:
+            self.progress_callback(self.progress())
+        self._next_check = self.nodes_explored + self.CHECK_INTERVAL
+        if self.max_nodes is not None:
+            self._next_check = min(self._next_check, self.max_nodes)
 
     @abstractmethod
     def solve(self):
         pass
 
+    def generate_moves(self):
+        """
+        Iterator over the solution's moves, or None when there is none.
+        Solvers that find their path piece by piece override this to yield
+        moves before the rest is known; by default it walks solve()'s list.
+        """
+        path = self.solve()
+        return None if path is None else iter(path)
+
+    def stream(self):
+        """
+        Lazily yield a Step per move of the solution (None when unsolvable),
+        so consumers such as the renderer or write_steps() can start on the
+        first move before the whole path exists.
+        """
+        moves = self.generate_moves()
+        return None if moves is None else self.steps(moves)
+
+    def steps(self, moves):
+        """
+        Annotate an iterable of moves, played from the board's current
+        position, with g, h (the solver's heuristic, Manhattan distance for
+        uninformed solvers), f = g + h and the decision basis.
+        """
+        from solvers.heuristics import manhattan_distance
+        tiles = list(self.board.tiles)
+        heuristic = getattr(self, "heuristic", None) or manhattan_distance
+        return self._annotate(moves, tiles, heuristic, heuristic is manhattan_distance,
+                              self.get_decision_basis())
+
+    def _annotate(self, moves, tiles, heuristic, incremental, basis):
+        n = self.board.n
+        neighbors = codec_for(n).neighbors
+        blank = tiles.index(0)
+        h = heuristic(GridView(n, tiles))
+        for g, move in enumerate(moves, 1):
+            target = dict(neighbors[blank])[move]
+            value = tiles[target]
+            tiles[blank], tiles[target] = value, 0
+            if incremental:
+                # Only the slid tile's distance changes
+                goal_row, goal_col = divmod(value - 1, n)
+                h += (abs(blank // n - goal_row) + abs(blank % n - goal_col)
+                      - abs(target // n - goal_row) - abs(target % n - goal_col))
+            else:
+                h = heuristic(GridView(n, tiles))
+            blank = target
+            yield Step(move, g, h, g + h, basis)
+
     @abstractmethod
     def get_decision_basis(self):
         pass
@@ -1,71 +1,89 @@
-import numpy as np
+import time
 from collections import deque
+from core.state import MOVES, codec_for
 from solvers.base_solver import BaseSolver
+from solvers.move_pruning import MoveAutomaton, START
 
 class BFSSolver(BaseSolver):
-    def __init__(self, board):
+    def __init__(self, board, automaton=None):
         super().__init__(board)
+        # Loaded (or built, on a cold cache) here so it never counts against the search limits
+        self.automaton = automaton or MoveAutomaton.load(board.n)
         self.nodes_explored = 0
         self.path_cost = 0
+        self.peak_stored_states = 0
         
         # Pre-calculate goal state once
-        n = board.n
-        self.goal_state = tuple(list(range(1, n*n)) + [0])
+        self.codec = codec_for(board.n)
+        self.goal_state = self.codec.goal
 
     def solve(self):
         """
-        BFS using state tuples and parent pointers for efficiency.
-        - Uses flat tuple states instead of 2D grids
+        BFS over packed integer states with parent pointers.
+        - States are single ints (see core.state) instead of tuples
+        - The blank index is queued with each state, so successors are
+          O(1) field swaps instead of grid rebuilds
         - Uses parent pointers instead of storing full paths
-        - Reduces memory significantly
+        - Each queued state carries its move-pruning automaton state, so
+          moves that complete a known duplicate sequence are never
+          generated (children are queued in move order, which keeps the
+          first path found to each state the one the automaton allows)
         """
-        n = self.board.n
-        start_state = tuple(self.board.grid.flatten())
+        self._start_search()
+        emit = self._emitter()
+        codec = self.codec
+        start_state, start_blank = codec.pack_tiles(self.board.tiles)
         
         if start_state == self.goal_state:
             return []
         
-        # Queue stores only states (not full paths)
-        queue = deque([start_state])
+        transitions = self.automaton.transitions
+        move_index = {name: index for index, (name, _, _) in enumerate(MOVES)}
+        options = [[(move_index[name], name, target) for name, target in cell]
+                   for cell in codec.neighbors]
+
+        # Queue stores (state, blank, automaton state) (not full paths)
+        queue = deque([(start_state, start_blank, START)])
         visited = {start_state}
         parent_map = {}  # state -> (parent_state, move_taken)
         
         while queue:
-            current_state = queue.popleft()
+            current_state, blank, fsm = queue.popleft()
             self.nodes_explored += 1
+            if self.nodes_explored >= self._next_check:
+                self._checkpoint()
+            if emit is not None:
+                emit("expand", state=current_state, g=None, h=None)
+                started = time.perf_counter()
             
             if current_state == self.goal_state:
+                # visited only grows, so its final size is the peak
+                self.peak_stored_states = len(visited)
                 # Reconstruct path from parent pointers
                 self.path_cost = self._get_depth(parent_map, current_state)
                 return self._reconstruct_path(parent_map, current_state)
             
-            # Convert state tuple to grid for easier manipulation
-            current_grid = np.array(current_state, dtype=int).reshape(n, n)
-            empty_pos = tuple(np.argwhere(current_grid == 0)[0])
-            y, x = empty_pos
-            
-            # Try all 4 moves
-            moves = [
-                ("UP", -1, 0),
-                ("DOWN", 1, 0),
-                ("LEFT", 0, -1),
-                ("RIGHT", 0, 1)
-            ]
-            
-            for move_name, dy, dx in moves:
-                ny, nx = y + dy, x + dx
-                
-                if 0 <= ny < n and 0 <= nx < n:
-                    # Create new state by swapping
-                    new_grid = current_grid.copy()
-                    new_grid[y, x], new_grid[ny, nx] = new_grid[ny, nx], new_grid[y, x]
-                    new_state = tuple(new_grid.flatten())
-                    
-                    if new_state not in visited:
-                        visited.add(new_state)
-                        parent_map[new_state] = (current_state, move_name)
-                        queue.append(new_state)
+            moves = transitions[fsm]
+            for index, move_name, new_blank in options[blank]:
+                following = moves[index]
+                if following < 0:
+                    if emit is not None:
+                        emit("duplicate", state=codec.slide(current_state, blank, new_blank), g=None)
+                    continue  # repeats a known duplicate move sequence
+                new_state = codec.slide(current_state, blank, new_blank)
+                if new_state not in visited:
+                    visited.add(new_state)
+                    parent_map[new_state] = (current_state, move_name)
+                    queue.append((new_state, new_blank, following))
+                    if emit is not None:
+                        emit("generate", state=new_state, g=None, parent=current_state)
+                elif emit is not None:
+                    emit("duplicate", state=new_state, g=None)
+            if emit is not None:
+                emit("timing", phase="successors", seconds=time.perf_counter() - started)
+                emit("frontier", size=len(queue))
         
+        self.peak_stored_states = len(visited)
         return None  # No solution found
 
     def _reconstruct_path(self, parent_map, goal_state):
@@ -96,6 +114,7 @@ class BFSSolver(BaseSolver):
         return {
             "Nodes Explored": self.nodes_explored,
             "Path Cost": self.path_cost,
-            "Algorithm": "BFS"
+            "Algorithm": "BFS",
+            "Peak Stored States": self.peak_stored_states
         }
 
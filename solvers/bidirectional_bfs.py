@@ -0,0 +1,145 @@
+import sys
+import time
+from core.state import codec_for, is_solvable, OPPOSITE
+from solvers.base_solver import BaseSolver
+
+class BidirectionalBFSSolver(BaseSolver):
+    def __init__(self, board):
+        super().__init__(board)
+        self.nodes_explored = 0
+        self.path_cost = 0
+        self.forward_frontier = 0
+        self.backward_frontier = 0
+        self.meeting_depth = None  # (forward depth, backward depth)
+        self.peak_stored_states = 0
+        self.peak_memory_bytes = 0
+
+        # Pre-calculate goal state once
+        self.codec = codec_for(board.n)
+        self.goal_state = self.codec.goal
+
+    def solve(self):
+        """
+        Breadth-first search from both ends, meeting in the middle.
+        - Always expands one full layer of the smaller frontier
+        - A state reached by both sides closes the search once that layer
+          is finished; the cheapest meeting point gives an optimal path
+        - Each side keeps its own parent pointers: the forward half is
+          replayed as-is, the backward half with every move inverted
+        """
+        self._start_search()
+        codec = self.codec
+        start_state, start_blank = codec.pack_tiles(self.board.tiles)
+
+        if start_state == self.goal_state:
+            return []
+        if not is_solvable(codec.unpack(start_state), self.board.n):
+            return None  # No solution found
+
+        emit = self._emitter()
+        # state -> (parent_state, move_taken, depth)
+        forward = {start_state: (None, None, 0)}
+        backward = {self.goal_state: (None, None, 0)}
+        forward_layer = [(start_state, start_blank)]
+        backward_layer = [(self.goal_state, codec.goal_blank)]
+
+        while forward_layer and backward_layer:
+            if len(forward_layer) <= len(backward_layer):
+                forward_layer, meeting = self._expand_layer(forward_layer, forward, backward, emit)
+            else:
+                backward_layer, meeting = self._expand_layer(backward_layer, backward, forward, emit)
+            self.forward_frontier = len(forward_layer)
+            self.backward_frontier = len(backward_layer)
+            self._track_memory(forward, backward, forward_layer, backward_layer)
+            if emit is not None:
+                emit("frontier", size=len(forward_layer) + len(backward_layer))
+
+            if meeting is not None:
+                path = self._reconstruct_path(forward, backward, meeting)
+                self.meeting_depth = (forward[meeting][2], backward[meeting][2])
+                self.path_cost = len(path)
+                return path
+
+        return None  # No solution found
+
+    def _expand_layer(self, layer, own, other, emit=None):
+        """Expand one BFS layer; return (next_layer, best meeting state or None)."""
+        codec = self.codec
+        next_layer = []
+        meeting, best = None, None
+
+        for state, blank in layer:
+            self.nodes_explored += 1
+            if self.nodes_explored >= self._next_check:
+                self._checkpoint()
+            depth = own[state][2] + 1
+            if emit is not None:
+                emit("expand", state=state, g=depth - 1, h=None)
+                started = time.perf_counter()
+            for move_name, new_state, new_blank in codec.successors(state, blank):
+                if new_state in own:
+                    if emit is not None:
+                        emit("duplicate", state=new_state, g=depth)
+                    continue
+                own[new_state] = (state, move_name, depth)
+                next_layer.append((new_state, new_blank))
+                if emit is not None:
+                    emit("generate", state=new_state, g=depth, parent=state)
+                if new_state in other:
+                    total = depth + other[new_state][2]
+                    if best is None or total < best:
+                        meeting, best = new_state, total
+            if emit is not None:
+                emit("timing", phase="successors", seconds=time.perf_counter() - started)
+
+        return next_layer, meeting
+
+    def _reconstruct_path(self, forward, backward, meeting):
+        """Start -> meeting from forward pointers, then meeting -> goal inverted."""
+        path = []
+        current_state = meeting
+        while forward[current_state][0] is not None:
+            parent_state, move, _ = forward[current_state]
+            path.append(move)
+            current_state = parent_state
+        path.reverse()
+
+        current_state = meeting
+        while backward[current_state][0] is not None:
+            parent_state, move, _ = backward[current_state]
+            path.append(OPPOSITE[move])
+            current_state = parent_state
+        return path
+
+    def _track_memory(self, forward, backward, forward_layer, backward_layer):
+        """
+        Containers plus the objects they own, sized from one sample entry:
+        each parent-map entry holds an int state key and a (parent, move,
+        depth) tuple, each layer entry a (state, blank) tuple. Parents,
+        move names and small ints are shared objects and not counted again.
+        """
+        stored = len(forward) + len(backward)
+        if stored > self.peak_stored_states:
+            self.peak_stored_states = stored
+            key, value = next(iter(forward.items()))
+            entry = sys.getsizeof(key) + sys.getsizeof(value)
+            queued = len(forward_layer) + len(backward_layer)
+            sample = forward_layer[0] if forward_layer else backward_layer[0] if backward_layer else ()
+            self.peak_memory_bytes = (sys.getsizeof(forward) + sys.getsizeof(backward)
+                                      + sys.getsizeof(forward_layer) + sys.getsizeof(backward_layer)
+                                      + stored * entry + queued * sys.getsizeof(sample))
+
+    def get_decision_basis(self):
+        return "Expanding the smaller of the start and goal frontiers until they meet"
+
+    def get_metrics(self):
+        return {
+            "Nodes Explored": self.nodes_explored,
+            "Path Cost": self.path_cost,
+            "Algorithm": "Bidirectional BFS",
+            "Forward Frontier": self.forward_frontier,
+            "Backward Frontier": self.backward_frontier,
+            "Meeting Depth": self.meeting_depth,
+            "Peak Stored States": self.peak_stored_states,
+            "Peak Memory (KB)": self.peak_memory_bytes // 1024
+        }
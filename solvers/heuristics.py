@@ -1,10 +1,11 @@
-import numpy as np
-
 def manhattan_distance(board):
     """
     Calculate Manhattan distance heuristic.
     Sum of distances from each tile to its goal position.
     """
+    cached = getattr(board, "manhattan", None)  # Board keeps it up to date
+    if cached is not None:
+        return cached
     distance = 0
     n = board.n
     for i in range(n):
@@ -48,6 +49,9 @@ def hamming_distance(board):
     Hamming distance heuristic.
     Number of tiles in wrong position (less accurate than Manhattan).
     """
+    cached = getattr(board, "misplaced", None)  # Board keeps it up to date
+    if cached is not None:
+        return cached
     distance = 0
     n = board.n
     for i in range(n):
@@ -62,37 +66,133 @@ def linear_conflict(board):
     More accurate than Manhattan distance but O(n²) to calculate.
     Useful for smaller boards (4x4 and below).
     """
-    distance = manhattan_distance(board)
     n = board.n
-    
-    # Count conflicts in rows
-    for i in range(n):
-        for j1 in range(n):
-            for j2 in range(j1 + 1, n):
-                val1 = board.grid[i][j1]
-                val2 = board.grid[i][j2]
-                
-                if val1 != 0 and val2 != 0:
-                    target_row1 = (val1 - 1) // n
-                    target_row2 = (val2 - 1) // n
-                    
-                    if (target_row1 == i and target_row2 == i and 
-                        (val1 - 1) % n > (val2 - 1) % n):
-                        distance += 2
-    
-    # Count conflicts in columns
-    for j in range(n):
-        for i1 in range(n):
-            for i2 in range(i1 + 1, n):
-                val1 = board.grid[i1][j]
-                val2 = board.grid[i2][j]
-                
-                if val1 != 0 and val2 != 0:
-                    target_col1 = (val1 - 1) % n
-                    target_col2 = (val2 - 1) % n
-                    
-                    if (target_col1 == j and target_col2 == j and 
-                        (val1 - 1) // n > (val2 - 1) // n):
-                        distance += 2
-    
+    tiles = board.tiles
+    distance = manhattan_distance(board)
+    for line in range(n):
+        distance += row_conflicts(tiles, n, line) + column_conflicts(tiles, n, line)
     return distance
+
+def row_conflicts(tiles, n, row):
+    """
+    Linear-conflict penalty of a single row of a flat tile sequence.
+    Same counting as linear_conflict, so it can be updated one line at a time.
+    """
+    goal_cols = [(value - 1) % n for value in tiles[row * n:(row + 1) * n]
+                 if value != 0 and (value - 1) // n == row]
+    penalty = 0
+    for i in range(len(goal_cols)):
+        for j in range(i + 1, len(goal_cols)):
+            if goal_cols[i] > goal_cols[j]:
+                penalty += 2
+    return penalty
+
+def column_conflicts(tiles, n, col):
+    """Linear-conflict penalty of a single column of a flat tile sequence."""
+    goal_rows = [(value - 1) // n for value in tiles[col::n]
+                 if value != 0 and (value - 1) % n == col]
+    penalty = 0
+    for i in range(len(goal_rows)):
+        for j in range(i + 1, len(goal_rows)):
+            if goal_rows[i] > goal_rows[j]:
+                penalty += 2
+    return penalty
+
+# ---------------------------------------------------------------------------
+# Batched evaluation: score a (k, n*n) uint8 array of states in one call
+# (numpy is imported on first use, so the scalar heuristics above load
+# without it)
+# ---------------------------------------------------------------------------
+
+_LOOKUP_TABLES = {}
+
+def goal_lookup_tables(n):
+    """
+    Precomputed per board size:
+    goal_row[value], goal_col[value] - where each tile belongs
+    cell_row[cell], cell_col[cell]   - coordinates of each flat cell
+    """
+    tables = _LOOKUP_TABLES.get(n)
+    if tables is None:
+        import numpy as np
+        values = np.arange(n * n)
+        goal_index = np.where(values == 0, n * n - 1, values - 1)
+        cells = np.arange(n * n)
+        tables = _LOOKUP_TABLES[n] = (
+            goal_index // n, goal_index % n, cells // n, cells % n
+        )
+    return tables
+
+def states_to_array(codec, states):
+    """Unpack a sequence of packed ints (core.state) into a (k, n*n) uint8 array."""
+    import numpy as np
+    if codec.bits == 4:
+        packed = np.fromiter(states, dtype=np.uint64, count=len(states))
+        shifts = np.arange(0, 4 * codec.size, 4, dtype=np.uint64)
+        return ((packed[:, None] >> shifts) & np.uint64(0xF)).astype(np.uint8)
+    # Byte-wide fields: the packed int is just the little-endian tile bytes
+    raw = b"".join(state.to_bytes(codec.size, "little") for state in states)
+    return np.frombuffer(raw, dtype=np.uint8).reshape(len(states), codec.size)
+
+def manhattan_distance_batch(states, n):
+    """Manhattan distance of every row of a (k, n*n) state array."""
+    import numpy as np
+    states = np.asarray(states)
+    goal_row, goal_col, cell_row, cell_col = goal_lookup_tables(n)
+    distance = np.abs(goal_row[states] - cell_row) + np.abs(goal_col[states] - cell_col)
+    distance[states == 0] = 0
+    return distance.sum(axis=1)
+
+def hamming_distance_batch(states, n):
+    """Number of misplaced (non-blank) tiles in every row of a state array."""
+    import numpy as np
+    states = np.asarray(states)
+    goal = np.append(np.arange(1, n * n), 0)
+    return ((states != 0) & (states != goal)).sum(axis=1)
+
+def linear_conflict_batch(states, n):
+    """Manhattan plus 2 per pair of tiles reversed in their goal row or column."""
+    import numpy as np
+    states = np.asarray(states)
+    goal_row, goal_col, _, _ = goal_lookup_tables(n)
+    grid = states.reshape(len(states), n, n)
+    line = np.arange(n)
+    later = np.triu(np.ones((n, n), dtype=bool), 1)  # pairs j1 < j2
+
+    # Rows: tiles sitting in their goal row, compared by goal column
+    in_line = (grid != 0) & (goal_row[grid] == line[:, None])
+    target = goal_col[grid]
+    conflicts = (in_line[:, :, :, None] & in_line[:, :, None, :] & later
+                 & (target[:, :, :, None] > target[:, :, None, :])).sum(axis=(1, 2, 3))
+
+    # Columns: same test on the transposed grid
+    grid = grid.transpose(0, 2, 1)
+    in_line = (grid != 0) & (goal_col[grid] == line[:, None])
+    target = goal_row[grid]
+    conflicts += (in_line[:, :, :, None] & in_line[:, :, None, :] & later
+                  & (target[:, :, :, None] > target[:, :, None, :])).sum(axis=(1, 2, 3))
+
+    return manhattan_distance_batch(states, n) + 2 * conflicts
+
+BATCH_HEURISTICS = {
+    manhattan_distance: manhattan_distance_batch,
+    hamming_distance: hamming_distance_batch,
+    linear_conflict: linear_conflict_batch,
+}
+
+def batch_heuristic(heuristic, n):
+    """
+    Batched form of `heuristic` for board size n: a callable taking a
+    (k, n*n) uint8 array and returning k values.
+    Heuristic objects can provide their own `batch(states)` method; other
+    callables fall back to one call per row on a lightweight board view.
+    """
+    if hasattr(heuristic, "batch"):
+        return heuristic.batch
+    if heuristic in BATCH_HEURISTICS:
+        batch = BATCH_HEURISTICS[heuristic]
+        return lambda states: batch(states, n)
+
+    import numpy as np
+    from core.state import GridView
+    return lambda states: np.array([heuristic(GridView(n, [int(v) for v in row])) for row in states])
@@ -0,0 +1,188 @@
+import time
+from core.state import MOVES, codec_for, is_solvable, GridView
+from solvers.base_solver import BaseSolver
+from solvers.move_pruning import MoveAutomaton, START
+from solvers.heuristics import (manhattan_distance, manhattan_distance_incremental,
+                                linear_conflict, row_conflicts, column_conflicts)
+
+FOUND = -1
+
+class IDAStarSolver(BaseSolver):
+    def __init__(self, board, heuristic=manhattan_distance, automaton=None):
+        super().__init__(board)
+        self.heuristic = heuristic
+        # Loaded (or built, on a cold cache) here so it never counts against the search limits
+        self.automaton = automaton or MoveAutomaton.load(board.n)
+        self.nodes_explored = 0
+        self.path_cost = 0
+        self.iterations = []  # one {"threshold", "nodes"} entry per deepening pass
+
+        self.codec = codec_for(board.n)
+        self.coords = [divmod(i, board.n) for i in range(board.n * board.n)]
+
+    def solve(self):
+        """
+        Iterative-deepening A*.
+        - Depth-first search bounded by an f-cost threshold; the threshold
+          grows to the smallest f that exceeded it on the previous pass
+        - Steps a move-pruning automaton along the path and never generates
+          a move that completes a known duplicate sequence (undoing the last
+          move, circling a 2x2 block, ...)
+        - Manhattan, linear conflict and heuristics with an incremental()
+          tracker (walking distance) are updated per move
+        - Only the current path is stored, so memory is O(depth)
+        """
+        self._start_search()
+        n = self.board.n
+        codec = self.codec
+        start_state, start_blank = codec.pack_tiles(self.board.tiles)
+
+        if start_state == codec.goal:
+            return []
+        tiles = list(codec.unpack(start_state))
+        if not is_solvable(tiles, n):
+            return None  # No solution found
+
+        emit = self._emitter()
+        goal_tiles = list(codec.goal_tiles)
+        transitions = self.automaton.transitions
+        move_index = {name: index for index, (name, _, _) in enumerate(MOVES)}
+        options = [[(move_index[name], name, target) for name, target in cell]
+                   for cell in codec.neighbors]
+        coords = self.coords
+        path = []
+
+        if self.heuristic is manhattan_distance or self.heuristic is linear_conflict:
+            use_conflicts = self.heuristic is linear_conflict
+            row_lc = [row_conflicts(tiles, n, r) for r in range(n)] if use_conflicts else None
+            col_lc = [column_conflicts(tiles, n, c) for c in range(n)] if use_conflicts else None
+
+            def delta(tile, source, target):
+                # Tile slides from `source` into the old blank cell `target`
+                change = manhattan_distance_incremental(tiles, None, tile, coords[source], coords[target], n)
+                if use_conflicts:
+                    (sy, sx), (ty, tx) = coords[source], coords[target]
+                    if sy == ty:  # horizontal slide: only the two columns change
+                        old = col_lc[sx] + col_lc[tx]
+                        col_lc[sx] = column_conflicts(tiles, n, sx)
+                        col_lc[tx] = column_conflicts(tiles, n, tx)
+                        change += col_lc[sx] + col_lc[tx] - old
+                    else:  # vertical slide: only the two rows change
+                        old = row_lc[sy] + row_lc[ty]
+                        row_lc[sy] = row_conflicts(tiles, n, sy)
+                        row_lc[ty] = row_conflicts(tiles, n, ty)
+                        change += row_lc[sy] + row_lc[ty] - old
+                return change
+
+            def undo(tile, source, target):
+                if use_conflicts:
+                    (sy, sx), (ty, tx) = coords[source], coords[target]
+                    if sy == ty:
+                        col_lc[sx] = column_conflicts(tiles, n, sx)
+                        col_lc[tx] = column_conflicts(tiles, n, tx)
+                    else:
+                        row_lc[sy] = row_conflicts(tiles, n, sy)
+                        row_lc[ty] = row_conflicts(tiles, n, ty)
+
+            from_tiles = None
+            start_h = self.heuristic(self.board)
+        elif hasattr(self.heuristic, "incremental"):
+            # Table heuristics that track moves themselves (WalkingDistance)
+            tracker = self.heuristic.incremental(tiles)
+            delta, undo = tracker.delta, tracker.undo
+            from_tiles = None
+            start_h = tracker.h
+        else:
+            # Any other heuristic scores each node from scratch; table-driven
+            # ones (e.g. PatternDatabase) read the flat tiles directly
+            from_tiles = getattr(self.heuristic, "from_tiles", None)
+            if from_tiles is None:
+                def from_tiles(tiles):
+                    return self.heuristic(GridView(n, tiles))
+
+            def delta(tile, source, target):
+                return None
+
+            def undo(tile, source, target):
+                pass
+
+            start_h = from_tiles(tiles)
+
+        def score(h, tile, source, target):
+            change = delta(tile, source, target)
+            if change is None:
+                return from_tiles(tiles)
+            return h + change
+
+        def search(blank, g, h, fsm, threshold):
+            f = g + h
+            if f > threshold:
+                return f
+            if h == 0 and tiles == goal_tiles:
+                return FOUND
+            if h < self.best_h:
+                self.best_h = h
+            self.nodes_explored += 1
+            if self.nodes_explored >= self._next_check:
+                self.f_bound = threshold
+                self._checkpoint()
+            if emit is not None:
+                emit("expand", state=codec.pack(tiles), g=g, h=h)
+                emit("frontier", size=len(path))  # depth-first: the open list is the path
+
+            minimum = float("inf")
+            moves = transitions[fsm]
+            for index, move_name, target in options[blank]:
+                following = moves[index]
+                if following < 0:
+                    if emit is not None:
+                        emit("duplicate", state=codec.slide(codec.pack(tiles), blank, target), g=g + 1)
+                    continue  # repeats a known duplicate move sequence
+                tile = tiles[target]
+                tiles[blank] = tile
+                tiles[target] = 0
+                if emit is None:
+                    new_h = score(h, tile, target, blank)
+                else:
+                    started = time.perf_counter()
+                    new_h = score(h, tile, target, blank)
+                    emit("timing", phase="heuristic", seconds=time.perf_counter() - started)
+                    emit("generate", state=codec.pack(tiles), g=g + 1, parent=codec.slide(codec.pack(tiles), target, blank))
+                path.append(move_name)
+
+                t = search(target, g + 1, new_h, following, threshold)
+                if t == FOUND:
+                    return FOUND
+
+                path.pop()
+                tiles[target] = tile
+                tiles[blank] = 0
+                undo(tile, target, blank)
+                if t < minimum:
+                    minimum = t
+            return minimum
+
+        threshold = start_h
+        self.best_h = start_h
+        while True:
+            nodes_before = self.nodes_explored
+            t = search(start_blank, 0, start_h, START, threshold)
+            self.iterations.append({"threshold": threshold, "nodes": self.nodes_explored - nodes_before})
+            if t == FOUND:
+                self.path_cost = len(path)
+                return path
+            if t == float("inf"):
+                return None  # No solution found
+            threshold = t
+
+    def get_decision_basis(self):
+        return "Depth-first search pruning nodes with f(n) = g(n) + h(n) above the current threshold"
+
+    def get_metrics(self):
+        return {
+            "Nodes Explored": self.nodes_explored,
+            "Path Cost": self.path_cost,
+            "Algorithm": "IDA*",
+            "Thresholds": [it["threshold"] for it in self.iterations],
+            "Nodes Per Iteration": [it["nodes"] for it in self.iterations]
+        }
@@ -0,0 +1,160 @@
+"""
+Search instrumentation: the events solvers emit and ready-made subscribers.
+
+Attach with BaseSolver.subscribe(callback, events=None); the callback is
+called as callback(event, data) with `data` a dict. When nothing is
+subscribed, solve() sees emit=None and the hot loop pays a single
+`is not None` test per site - no payloads are built and no clocks are read.
+
+Events and payload keys:
+    expand      state, g, h         node taken off the frontier and expanded
+    generate    state, g, parent    successor kept for later expansion
+    duplicate   state, g            successor or frontier entry dropped as a repeat
+    frontier    size                open list size after an expansion
+    timing      phase, seconds      phase is "successors" or "heuristic"
+    drop        state, f            node forgotten by memory-bounded A*
+"""
+import csv
+import json
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+
+EVENTS = ("expand", "generate", "duplicate", "frontier", "timing", "drop")
+
+
+class TraceRecorder:
+    """Subscriber that keeps every event in order and exports it as CSV or JSON."""
+    def __init__(self, limit=None):
+        self.limit = limit  # stop recording after this many events
+        self.records = []
+        self.dropped = 0
+        self._t0 = time.perf_counter()
+
+    def __call__(self, event, data):
+        if self.limit is not None and len(self.records) >= self.limit:
+            self.dropped += 1
+            return
+        self.records.append((time.perf_counter() - self._t0, event, data))
+
+    def rows(self):
+        for seq, (elapsed, event, data) in enumerate(self.records):
+            row = {"seq": seq, "time": round(elapsed, 9), "event": event}
+            row.update(data)
+            yield row
+
+    def to_json(self, target):
+        """Write the trace as a JSON list to a path or open text file."""
+        if isinstance(target, str):
+            with open(target, "w") as f:
+                return self.to_json(f)
+        json.dump(list(self.rows()), target)
+
+    def to_csv(self, target):
+        """Write the trace as CSV; columns are seq, time, event, then every payload key seen."""
+        if isinstance(target, str):
+            with open(target, "w", newline="") as f:
+                return self.to_csv(f)
+        fields = ["seq", "time", "event"]
+        for _, _, data in self.records:
+            for key in data:
+                if key not in fields:
+                    fields.append(key)
+        writer = csv.DictWriter(target, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(self.rows())
+
+
+class PhaseProfiler:
+    """Subscriber that only aggregates: event counts and seconds spent per timing phase."""
+    def __init__(self):
+        self.counts = Counter()
+        self.seconds = defaultdict(float)
+        self.peak_frontier = 0
+
+    def __call__(self, event, data):
+        self.counts[event] += 1
+        if event == "timing":
+            self.seconds[data["phase"]] += data["seconds"]
+        elif event == "frontier" and data["size"] > self.peak_frontier:
+            self.peak_frontier = data["size"]
+
+    def summary(self):
+        return {
+            "counts": dict(self.counts),
+            "seconds": dict(self.seconds),
+            "peak_frontier": self.peak_frontier
+        }
+
+
+class SamplingProfiler:
+    """
+    Statistical profiler for the thread that starts it: a daemon thread
+    samples that thread's stack every `interval` seconds, so time in the
+    hot loop shows up without touching solver code.
+
+        with SamplingProfiler() as profiler:
+            solver.solve()
+        print(profiler.report())
+    """
+    def __init__(self, interval=0.001, thread_id=None):
+        self.interval = interval
+        self.thread_id = thread_id
+        self.samples = 0
+        self.own = Counter()        # innermost frame: "function (file:line)"
+        self.inclusive = Counter()  # every function on the stack, once per sample
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self.thread_id is None:
+            self.thread_id = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        return self
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            self.samples += 1
+            code = frame.f_code
+            self.own["%s (%s:%d)" % (code.co_name, code.co_filename, frame.f_lineno or 0)] += 1
+            seen = set()
+            while frame is not None:
+                code = frame.f_code
+                name = "%s (%s)" % (code.co_name, code.co_filename)
+                if name not in seen:
+                    seen.add(name)
+                    self.inclusive[name] += 1
+                frame = frame.f_back
+
+    def top(self, limit=10, inclusive=False):
+        """[(location, share of samples), ...] for the hottest entries."""
+        counts = self.inclusive if inclusive else self.own
+        total = self.samples or 1
+        return [(name, count / total) for name, count in counts.most_common(limit)]
+
+    def report(self, limit=10):
+        lines = ["%d samples every %.1f ms" % (self.samples, self.interval * 1000)]
+        for title, inclusive in (("self", False), ("inclusive", True)):
+            lines.append("-- %s --" % title)
+            for name, share in self.top(limit, inclusive):
+                lines.append("%6.1f%%  %s" % (share * 100, name))
+        return "\n".join(lines)
@@ -0,0 +1,145 @@
+import time
+import numpy as np
+from core.state import MOVES, codec_for, is_solvable
+from solvers.base_solver import BaseSolver
+
+class LayeredBFSSolver(BaseSolver):
+    """
+    Level-synchronous BFS with each depth layer held as NumPy arrays.
+
+    States are the 4-bit packed ints of core.state as uint64, so boards up to
+    4x4 only. A whole layer is expanded at once: per direction, the tile
+    beside every blank is masked out of the packed word and shifted into the
+    blank's field. The next layer is deduplicated with np.unique and checked
+    against the previous layer with a sorted searchsorted merge - the puzzle
+    graph is bipartite, so a layer's successors can only repeat states one
+    layer back. Each layer keeps its sorted states and the move that reached
+    them (one byte each), enough to walk the path back from the goal.
+
+    Instrumentation is per layer: "frontier" (layer size) and "timing"
+    events, not the per-node ones.
+    """
+    MAX_SIZE = 4
+
+    def __init__(self, board):
+        super().__init__(board)
+        if board.n > self.MAX_SIZE:
+            raise ValueError("LayeredBFSSolver packs states into 64 bits: boards up to %dx%d"
+                             % (self.MAX_SIZE, self.MAX_SIZE))
+        self.nodes_explored = 0
+        self.path_cost = 0
+        self.peak_stored_states = 0
+        self.layer_sizes = []
+
+        self.codec = codec_for(board.n)
+        # targets[blank, move] -> cell the blank moves to, -1 off the board
+        n = board.n
+        self.targets = np.full((n * n, len(MOVES)), -1, dtype=np.int64)
+        for blank in range(n * n):
+            y, x = divmod(blank, n)
+            for index, (_, dy, dx) in enumerate(MOVES):
+                if 0 <= y + dy < n and 0 <= x + dx < n:
+                    self.targets[blank, index] = (y + dy) * n + x + dx
+
+    def solve(self):
+        self._start_search()
+        emit = self._emitter()
+        codec = self.codec
+        start_state, start_blank = codec.pack_tiles(self.board.tiles)
+        goal = np.uint64(codec.goal)
+        self.layer_sizes = [1]
+        if start_state == codec.goal:
+            return []
+        if not is_solvable(self.board.tiles, self.board.n):
+            return None  # the other parity class is never reached: don't exhaust it
+
+        # layers[d] = (sorted states, move that reached each one)
+        layers = [(np.array([start_state], dtype=np.uint64), np.zeros(1, dtype=np.uint8))]
+        frontier_blanks = np.array([start_blank], dtype=np.uint8)
+        previous = np.empty(0, dtype=np.uint64)
+        stored = 1
+
+        while layers[-1][0].size:
+            states = layers[-1][0]
+            self.nodes_explored += states.size
+            if self.nodes_explored >= self._next_check:
+                self._checkpoint()
+            if emit is not None:
+                started = time.perf_counter()
+
+            following, blanks, moves = self._expand(states, frontier_blanks)
+            following, first = np.unique(following, return_index=True)
+            blanks, moves = blanks[first], moves[first]
+            if previous.size:
+                at = np.searchsorted(previous, following)
+                seen = previous[np.minimum(at, previous.size - 1)] == following
+                keep = ~seen
+                following, blanks, moves = following[keep], blanks[keep], moves[keep]
+
+            previous = states
+            layers.append((following, moves))
+            frontier_blanks = blanks
+            stored += following.size
+            self.peak_stored_states = stored
+            self.layer_sizes.append(int(following.size))
+            if emit is not None:
+                emit("timing", phase="successors", seconds=time.perf_counter() - started)
+                emit("frontier", size=int(following.size))
+
+            at = np.searchsorted(following, goal)
+            if at < following.size and following[at] == goal:
+                return self._reconstruct_path(layers, int(at))
+
+        return None  # No solution found
+
+    def _expand(self, states, blanks):
+        """Every successor of a layer: (states, blank cells, move indexes)."""
+        out_states, out_blanks, out_moves = [], [], []
+        four = np.uint64(4)
+        mask = np.uint64(15)
+        for move in range(len(MOVES)):
+            targets = self.targets[blanks, move]
+            valid = targets >= 0
+            if not valid.any():
+                continue
+            parent = states[valid]
+            target = targets[valid].astype(np.uint64)
+            target_shift = target * four
+            blank_shift = blanks[valid].astype(np.uint64) * four
+            tile = (parent >> target_shift) & mask
+            out_states.append(parent - (tile << target_shift) + (tile << blank_shift))
+            out_blanks.append(target.astype(np.uint8))
+            out_moves.append(np.full(parent.size, move, dtype=np.uint8))
+        return np.concatenate(out_states), np.concatenate(out_blanks), np.concatenate(out_moves)
+
+    def _reconstruct_path(self, layers, index):
+        """Walk back from the goal, undoing each layer's stored move."""
+        codec = self.codec
+        state = codec.goal
+        blank = codec.goal_blank
+        n = self.board.n
+        path = []
+        for depth in range(len(layers) - 1, 0, -1):
+            move = int(layers[depth][1][index])
+            move_name, dy, dx = MOVES[move]
+            path.append(move_name)
+            # the blank came from the opposite side
+            parent_blank = blank - dy * n - dx
+            state = codec.slide(state, blank, parent_blank)
+            blank = parent_blank
+            if depth > 1:
+                index = int(np.searchsorted(layers[depth - 1][0], np.uint64(state)))
+        path.reverse()
+        self.path_cost = len(path)
+        return path
+
+    def get_decision_basis(self):
+        return "Expanding each whole depth layer at once before moving to depth d+1"
+
+    def get_metrics(self):
+        return {
+            "Nodes Explored": self.nodes_explored,
+            "Path Cost": self.path_cost,
+            "Algorithm": "Layered BFS",
+            "Peak Stored States": self.peak_stored_states
+        }
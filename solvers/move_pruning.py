@@ -0,0 +1,182 @@
+"""
+Duplicate-move pruning with a finite-state machine over move strings.
+
+Many move sequences lead to the same state as a shorter (or equally long,
+lexicographically smaller) one: UP DOWN undoes itself, and circling the
+blank twelve times around a 2x2 block puts everything back. The builder
+finds such duplicate strings offline. It simulates move strings on an
+unbounded plane, records the effect of each (where every displaced tile and
+the blank end up), and marks a string as a duplicate when an earlier string
+had the same effect. The earlier string's cell footprint must lie inside the
+duplicate's, so the replacement is legal wherever the duplicate is.
+
+The duplicates are compiled into an Aho-Corasick automaton over the four
+moves (core.state.MOVES order). A search carries one automaton state per
+node, and a move whose transition is -1 would complete a duplicate, so it is
+never generated. The lexicographically smallest shortest path never contains
+a duplicate, so pruning keeps IDA* and BFS optimal.
+
+Footprints are limited to a min(n, 4) square, so one table covers every board
+from 4x4 up. Tables are cached as raw int32 files (see table_cache);
+python -m solvers.move_pruning 4 builds one ahead of time.
+"""
+import os
+from array import array
+from collections import deque
+from core.state import MOVES
+from solvers.table_cache import cache_dir, publish
+
+# Longest duplicate strings looked for; 12 catches the loop around a 2x2 block
+DEFAULT_MAX_LENGTH = 12
+
+# Footprints wider than this are not searched (the string count grows ~2x per move)
+MAX_BOX = 4
+
+START = 0
+
+
+def duplicate_strings(max_length=DEFAULT_MAX_LENGTH, box=MAX_BOX):
+    """
+    Minimal duplicate move strings (tuples of MOVES indexes) up to
+    `max_length` moves whose blank path fits in a `box` x `box` square.
+    """
+    # effect -> footprints of the surviving strings with that effect
+    effects = {frozenset(): [frozenset([(0, 0)])]}
+    duplicates = set()
+    # (moves, where: cell -> original cell of its content, blank, footprint, bounds)
+    layer = [((), {}, (0, 0), frozenset([(0, 0)]), (0, 0, 0, 0))]
+    for _ in range(max_length):
+        following = []
+        for moves, where, blank, footprint, (top, bottom, left, right) in layer:
+            for index, (_, dy, dx) in enumerate(MOVES):
+                extended = moves + (index,)
+                if any(extended[start:] in duplicates for start in range(1, len(extended) - 1)):
+                    continue  # already ruled out by a shorter duplicate at its end
+                y, x = blank[0] + dy, blank[1] + dx
+                bounds = (min(top, y), max(bottom, y), min(left, x), max(right, x))
+                if bounds[1] - bounds[0] >= box or bounds[3] - bounds[2] >= box:
+                    continue
+                cell = (y, x)
+                moved = dict(where)
+                moved[blank], moved[cell] = where.get(cell, cell), where.get(blank, blank)
+                effect = frozenset(item for item in moved.items() if item[0] != item[1])
+                cells = footprint | {cell}
+                seen = effects.get(effect)
+                if seen is not None and any(earlier <= cells for earlier in seen):
+                    duplicates.add(extended)
+                    continue
+                effects.setdefault(effect, []).append(cells)
+                following.append((extended, moved, cell, cells, bounds))
+        layer = following
+    return duplicates
+
+
+def build_automaton(duplicates):
+    """Aho-Corasick transitions (flat int32 array, state * 4 + move) -> state, -1 where a duplicate ends."""
+    goto = [[-1] * len(MOVES)]
+    terminal = [False]
+    for moves in sorted(duplicates):
+        state = 0
+        for move in moves:
+            if goto[state][move] < 0:
+                goto[state][move] = len(goto)
+                goto.append([-1] * len(MOVES))
+                terminal.append(False)
+            state = goto[state][move]
+        terminal[state] = True
+
+    # Breadth-first: fill missing edges through the failure links
+    fail = [0] * len(goto)
+    delta = [list(row) for row in goto]
+    queue = deque()
+    for move in range(len(MOVES)):
+        if delta[0][move] < 0:
+            delta[0][move] = 0
+        else:
+            queue.append(delta[0][move])
+    while queue:
+        state = queue.popleft()
+        terminal[state] = terminal[state] or terminal[fail[state]]
+        for move in range(len(MOVES)):
+            child = goto[state][move]
+            if child < 0:
+                delta[state][move] = delta[fail[state]][move]
+            else:
+                fail[child] = delta[fail[state]][move]
+                queue.append(child)
+
+    # Terminal states are never entered: drop them and renumber the rest
+    number = {}
+    for state in range(len(delta)):
+        if not terminal[state]:
+            number[state] = len(number)
+    table = array("i", [-1]) * (len(number) * len(MOVES))
+    for state, row in number.items():
+        for move, target in enumerate(delta[state]):
+            if not terminal[target]:
+                table[row * len(MOVES) + move] = number[target]
+    return table
+
+
+def table_path(box, max_length, directory=None):
+    if directory is None:
+        directory = cache_dir("fsm")
+    else:
+        os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, "fsm-box%d-len%d.bin" % (box, max_length))
+
+
+class MoveAutomaton:
+    """
+    Move-pruning automaton. Start at START; transitions[state][move index]
+    is the next state, or -1 when that move would repeat a known duplicate.
+    """
+    def __init__(self, box, max_length, table, directory=None):
+        self.box = box
+        self.max_length = max_length
+        self.table = table
+        self.directory = directory
+        width = len(MOVES)
+        self.transitions = [table[start:start + width].tolist() for start in range(0, len(table), width)]
+
+    @classmethod
+    def load(cls, n, max_length=DEFAULT_MAX_LENGTH, directory=None, build=True):
+        """Read the cached automaton for an n x n board, building it if missing."""
+        box = min(n, MAX_BOX)
+        path = table_path(box, max_length, directory)
+        if not os.path.exists(path):
+            if not build:
+                raise FileNotFoundError(path)
+            publish(path, build_automaton(duplicate_strings(max_length, box)).tofile)
+        table = array("i")
+        with open(path, "rb") as stream:
+            table.frombytes(stream.read())
+        return cls(box, max_length, table, directory)
+
+    def __len__(self):
+        return len(self.transitions)
+
+    def allows(self, moves):
+        """Whether a sequence of move names survives pruning."""
+        index = {name: i for i, (name, _, _) in enumerate(MOVES)}
+        state = START
+        for move in moves:
+            state = self.transitions[state][index[move]]
+            if state < 0:
+                return False
+        return True
+
+
+def main():
+    import argparse  # CLI only: keeps the solver import path light
+    parser = argparse.ArgumentParser(description="Build move-pruning automata")
+    parser.add_argument("n", type=int, help="board size")
+    parser.add_argument("--max-length", type=int, default=DEFAULT_MAX_LENGTH, help="longest duplicate strings")
+    parser.add_argument("--dir", default=None, help="output directory (default: cache dir)")
+    args = parser.parse_args()
+    automaton = MoveAutomaton.load(args.n, args.max_length, args.dir)
+    print("%s: %d states" % (table_path(automaton.box, args.max_length, args.dir), len(automaton)))
+
+
+if __name__ == "__main__":
+    main()
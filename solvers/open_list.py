@@ -0,0 +1,79 @@
+"""
+Open lists for best-first search over (f, g, state, blank) entries.
+
+HeapOpenList is the binary heap A* always used: O(log N) per operation,
+with equal-f ties ordered by low g first and then by the packed state.
+
+BucketOpenList exploits that f and g are small non-negative integers:
+entries live in buckets[f][g], so push and pop are O(1) amortised. Among
+equal f it pops the highest g first (the node closest to the goal by
+g + h = f), and within one (f, g) bucket the most recently pushed entry.
+"""
+import heapq
+
+
+class HeapOpenList:
+    def __init__(self):
+        self.heap = []
+
+    def __len__(self):
+        return len(self.heap)
+
+    def push(self, f, g, state, blank):
+        heapq.heappush(self.heap, (f, g, state, blank))
+
+    def pop(self):
+        return heapq.heappop(self.heap)
+
+
+class BucketOpenList:
+    def __init__(self):
+        self.buckets = []  # buckets[f][g] -> stack of (state, blank)
+        self.top_g = []    # top_g[f] -> highest g that may still be non-empty
+        self.min_f = 0     # no entry has f below this
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def push(self, f, g, state, blank):
+        buckets = self.buckets
+        while len(buckets) <= f:
+            buckets.append([])
+            self.top_g.append(-1)
+        level = buckets[f]
+        while len(level) <= g:
+            level.append([])
+        level[g].append((state, blank))
+        if g > self.top_g[f]:
+            self.top_g[f] = g
+        # Consistent heuristics never push below min_f, but stay correct if one does
+        if f < self.min_f:
+            self.min_f = f
+        self.size += 1
+
+    def pop(self):
+        if not self.size:
+            raise IndexError("pop from an empty open list")
+        f = self.min_f
+        top_g = self.top_g
+        while True:
+            level = self.buckets[f]
+            g = top_g[f]
+            while g >= 0 and not level[g]:
+                g -= 1
+            if g >= 0:
+                break
+            top_g[f] = -1
+            f += 1
+        top_g[f] = g
+        self.min_f = f
+        self.size -= 1
+        state, blank = level[g].pop()
+        return f, g, state, blank
+
+
+OPEN_LISTS = {
+    "heap": HeapOpenList,
+    "bucket": BucketOpenList,
+}
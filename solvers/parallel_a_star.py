@@ -0,0 +1,324 @@
+"""
+Hash-distributed parallel A* (HDA*).
+
+Every state has exactly one owner process, chosen by its Zobrist hash. Each
+worker keeps its own open list and g-table for the states it owns; generated
+successors that belong to another worker are buffered and shipped in batches
+over that worker's multiprocessing.Queue (a pipe). Workers only expand
+nodes with f below the best solution found so far (a shared incumbent), and
+the coordinator stops the search once every worker is idle and no batch is
+in flight - at that point the incumbent is optimal for an admissible
+heuristic.
+
+Only small fixed-size values live in shared memory: the incumbent, the batch
+counters and idle flags used for termination, each worker's expansion count,
+and a control flag. The coordinator enforces the solver's limits on the
+summed expansion counts and sets the flag to pause or stop the workers,
+which check it every EXPANSIONS_PER_POLL expansions.
+"""
+import heapq
+import multiprocessing as mp
+import os
+import queue
+import random
+import time
+from core.state import codec_for, is_solvable
+from solvers.base_solver import BaseSolver, SearchAborted
+from solvers.heuristics import manhattan_distance, batch_heuristic, states_to_array
+
+INFINITY = 2 ** 31 - 1
+EXPANSIONS_PER_POLL = 32   # nodes expanded between inbox checks
+IDLE_WAIT = 0.005          # seconds an idle worker blocks on its inbox
+
+# Control flag values
+RUN, PAUSED, STOPPED = 0, 1, 2
+
+
+def zobrist_table(n, seed=0x5EED):
+    """Random 64-bit key per (cell, tile); identical in every process."""
+    rng = random.Random(seed + n)
+    return [[rng.getrandbits(64) for _ in range(n * n)] for _ in range(n * n)]
+
+
+def zobrist_hash(table, tiles):
+    value = 0
+    for cell, tile in enumerate(tiles):
+        value ^= table[cell][tile]
+    return value
+
+
+def _worker(index, workers, n, heuristic, batch_size, inboxes, results,
+            incumbent, sent, received, idle, expansions, control):
+    codec = codec_for(n)
+    keys = zobrist_table(n)
+    score = batch_heuristic(heuristic, n)
+    inbox = inboxes[index]
+    goal = codec.goal
+
+    open_list = []      # (f, g, state, blank, zobrist)
+    best = {}           # state -> (g, parent_state, move) for owned states
+    outboxes = [[] for _ in range(workers)]
+    expanded = 0
+
+    def insert(nodes):
+        fresh = []
+        for state, blank, g, zh, parent, move in nodes:
+            known = best.get(state)
+            if known is None or g < known[0]:
+                best[state] = (g, parent, move)
+                fresh.append((state, blank, g, zh))
+        if fresh:
+            h_values = score(states_to_array(codec, [node[0] for node in fresh])).tolist()
+            for (state, blank, g, zh), h in zip(fresh, h_values):
+                heapq.heappush(open_list, (g + h, g, state, blank, zh))
+
+    def flush():
+        for owner, batch in enumerate(outboxes):
+            if batch:
+                sent[index] += 1
+                inboxes[owner].put(("nodes", batch))
+                outboxes[owner] = []
+
+    def handle(message):
+        kind = message[0]
+        if kind == "nodes":
+            idle[index] = 0          # mark busy before acknowledging receipt
+            received[index] += 1
+            insert(message[1])
+        elif kind == "trace":
+            state = message[1]
+            _, parent, move = best[state]
+            results.put(("parent", state, parent, move))
+        elif kind == "stop":
+            results.put(("stats", index, expanded, len(best)))
+            return False
+        return True
+
+    running = True
+    while running:
+        try:
+            while running:
+                running = handle(inbox.get_nowait())
+        except queue.Empty:
+            pass
+        if not running:
+            break
+        if control.value != RUN:
+            if control.value == STOPPED:
+                open_list.clear()    # aborted: only the "stop" message matters now
+            try:
+                running = handle(inbox.get(timeout=IDLE_WAIT))
+            except queue.Empty:
+                pass
+            continue
+
+        bound = incumbent.value
+        work = 0
+        while open_list and work < EXPANSIONS_PER_POLL:
+            f, g, state, blank, zh = heapq.heappop(open_list)
+            if f >= bound:
+                open_list.clear()    # nothing left here can beat the incumbent
+                break
+            if best[state][0] < g:
+                continue             # stale entry
+            work += 1
+            expanded += 1
+            if state == goal:
+                with incumbent.get_lock():
+                    if g < incumbent.value:
+                        incumbent.value = g
+                results.put(("goal", g, state))
+                bound = incumbent.value
+                continue
+
+            local = []
+            for move_name, new_state, new_blank in codec.successors(state, blank):
+                tile = (state >> codec.shifts[new_blank]) & codec.mask
+                new_zh = (zh ^ keys[blank][0] ^ keys[new_blank][tile]
+                          ^ keys[blank][tile] ^ keys[new_blank][0])
+                node = (new_state, new_blank, g + 1, new_zh, state, move_name)
+                owner = new_zh % workers
+                if owner == index:
+                    local.append(node)
+                else:
+                    outboxes[owner].append(node)
+                    if len(outboxes[owner]) >= batch_size:
+                        sent[index] += 1
+                        inboxes[owner].put(("nodes", outboxes[owner]))
+                        outboxes[owner] = []
+            insert(local)
+        expansions[index] = expanded
+
+        if not open_list:
+            flush()
+            idle[index] = 1
+            try:
+                running = handle(inbox.get(timeout=IDLE_WAIT))
+            except queue.Empty:
+                pass
+
+
+class ParallelAStarSolver(BaseSolver):
+    def __init__(self, board, heuristic=manhattan_distance, workers=None, batch_size=64):
+        super().__init__(board)
+        self.heuristic = heuristic
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.nodes_explored = 0
+        self.path_cost = 0
+        self.worker_expansions = []
+        self.stored_states = 0
+
+        self.codec = codec_for(board.n)
+        self.goal_state = self.codec.goal
+
+    def solve(self):
+        """
+        HDA*: A* spread over worker processes by Zobrist hash of the state.
+        - Each worker owns the states that hash to it (own open + g-table)
+        - Successors are batched per destination worker and sent over queues
+        - Terminates when all workers are idle and sent == received twice
+          in a row, then rebuilds the path by asking owners for parents
+        """
+        self._start_search()
+        n = self.board.n
+        codec = self.codec
+        start_state, start_blank = codec.pack_tiles(self.board.tiles)
+
+        if start_state == self.goal_state:
+            return []
+        if not is_solvable(codec.unpack(start_state), n):
+            return None  # No solution found
+
+        ctx = mp.get_context()
+        workers = self.workers
+        inboxes = [ctx.Queue() for _ in range(workers)]
+        results = ctx.Queue()
+        incumbent = ctx.Value("i", INFINITY)
+        # one slot per worker plus one for the coordinator's seed message
+        sent = ctx.Array("q", workers + 1, lock=False)
+        received = ctx.Array("q", workers + 1, lock=False)
+        idle = ctx.Array("b", [1] * workers, lock=False)
+        expansions = ctx.Array("q", workers, lock=False)
+        control = ctx.Value("b", RUN, lock=False)
+
+        processes = [ctx.Process(target=_worker, daemon=True,
+                                 args=(i, workers, n, self.heuristic, self.batch_size,
+                                       inboxes, results, incumbent, sent, received, idle,
+                                       expansions, control))
+                     for i in range(workers)]
+        for process in processes:
+            process.start()
+
+        keys = zobrist_table(n)
+        start_hash = zobrist_hash(keys, codec.unpack(start_state))
+        sent[workers] += 1
+        inboxes[start_hash % workers].put(("nodes", [(start_state, start_blank, 0, start_hash, None, None)]))
+
+        try:
+            goal_cost = self._wait_for_quiescence(results, incumbent, sent, received, idle,
+                                                  expansions, control)
+            path = None if goal_cost is None else self._trace_path(keys, inboxes, results)
+        finally:
+            control.value = STOPPED
+            for inbox in inboxes:
+                inbox.put(("stop",))
+            self._collect_stats(results, workers)
+            for process in processes:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+
+        if path is not None:
+            self.path_cost = len(path)
+        return path
+
+    def _wait_for_quiescence(self, results, incumbent, sent, received, idle, expansions, control):
+        previous = None
+        while True:
+            self._drain(results)
+            self.nodes_explored = sum(expansions[:])
+            self._poll_limits(control)
+
+            all_idle = all(idle[:])
+            counts = (sum(sent[:]), sum(received[:]))
+            snapshot = counts if all_idle and counts[0] == counts[1] else None
+            if snapshot is not None and snapshot == previous:
+                self._drain(results)
+                return None if incumbent.value == INFINITY else incumbent.value
+            previous = snapshot
+            time.sleep(IDLE_WAIT)
+
+    def _poll_limits(self, control):
+        """
+        Run the usual checkpoint (node limit, timeout, pause, cancel,
+        progress) once one is due, pausing or stopping the workers with it.
+        """
+        token = self.cancel_token
+        due = (self.nodes_explored >= self._next_check
+               or (self._deadline is not None and time.monotonic() >= self._deadline)
+               or (token is not None and (token.cancelled or token.paused)))
+        if not due:
+            return
+        if token is not None and token.paused:
+            control.value = PAUSED
+        try:
+            self._checkpoint()
+        except SearchAborted:
+            control.value = STOPPED
+            raise
+        control.value = RUN
+
+    def _drain(self, results):
+        # Goal reports only matter through the shared incumbent; discard them
+        try:
+            while True:
+                results.get_nowait()
+        except queue.Empty:
+            pass
+
+    def _trace_path(self, keys, inboxes, results):
+        """Walk parent pointers across owners, one round trip per move."""
+        codec = self.codec
+        path = []
+        state = self.goal_state
+        while True:
+            owner = zobrist_hash(keys, codec.unpack(state)) % self.workers
+            inboxes[owner].put(("trace", state))
+            while True:
+                message = results.get()
+                if message[0] == "parent" and message[1] == state:
+                    break
+            _, _, parent, move = message
+            if parent is None:
+                break
+            path.append(move)
+            state = parent
+        return list(reversed(path))
+
+    def _collect_stats(self, results, workers):
+        stats = {}
+        deadline = time.monotonic() + 5
+        while len(stats) < workers and time.monotonic() < deadline:
+            try:
+                message = results.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if message[0] == "stats":
+                stats[message[1]] = message[2:]
+        self.worker_expansions = [stats.get(i, (0, 0))[0] for i in range(workers)]
+        self.stored_states = sum(stats.get(i, (0, 0))[1] for i in range(workers))
+        self.nodes_explored = sum(self.worker_expansions)
+
+    def get_decision_basis(self):
+        return "Each worker expands its lowest f(n) = g(n) + h(n) among the states it owns"
+
+    def get_metrics(self):
+        return {
+            "Nodes Explored": self.nodes_explored,
+            "Path Cost": self.path_cost,
+            "Algorithm": "HDA*",
+            "Workers": self.workers,
+            "Worker Expansions": self.worker_expansions,
+            "Stored States": self.stored_states
+        }
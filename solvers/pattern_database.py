@@ -0,0 +1,246 @@
+"""
+Disjoint additive pattern databases.
+
+Each pattern is a subset of tiles. Its table stores, for every placement of
+those tiles, the minimum number of moves *of pattern tiles* needed to bring
+them home - so the values of disjoint patterns can be summed and stay
+admissible. Tables are built once with a retrograde breadth-first search from
+the goal, written as raw uint8 files (one byte per placement) and opened with
+np.memmap: loading is instant and worker processes share the same pages.
+"""
+import argparse
+import os
+import numpy as np
+from core.state import codec_for
+from solvers.table_cache import cache_dir, publish
+
+UNSEEN = 255
+
+# Disjoint tile groups per board size (goal has the blank bottom-right)
+DEFAULT_PARTITIONS = {
+    3: ((1, 2, 3, 4), (5, 6, 7, 8)),
+    4: ((1, 2, 5, 6, 9, 13), (3, 4, 7, 8, 11, 12), (10, 14, 15)),
+    5: ((1, 2, 3, 6, 7, 8), (4, 5, 9, 10, 14, 15),
+        (11, 12, 16, 17, 21, 22), (13, 18, 19, 20, 23, 24)),
+}
+
+# Above this many (pattern + blank) placements the blank is abstracted away:
+# pattern tiles may then step into any free neighbor. Weaker but still
+# admissible, and it keeps 6-tile tables on 5x5 buildable.
+MAX_BLANK_TRACKED_STATES = 64_000_000
+
+CHUNK = 1 << 20
+
+
+def _placements(N, length):
+    size = 1
+    for i in range(length):
+        size *= N - i
+    return size
+
+
+def _rank(positions, N):
+    """Rank rows of distinct cells as partial permutations (mixed radix N, N-1, ...)."""
+    idx = np.zeros(len(positions), dtype=np.int64)
+    for i in range(positions.shape[1]):
+        r = positions[:, i].astype(np.int64)
+        for j in range(i):
+            r -= positions[:, j] < positions[:, i]
+        idx = idx * (N - i) + r
+    return idx
+
+
+def _unrank(idx, length, N):
+    digits = [None] * length
+    idx = idx.copy()
+    for i in reversed(range(length)):
+        digits[i] = idx % (N - i)
+        idx //= N - i
+    positions = np.empty((len(idx), length), dtype=np.int64)
+    for i in range(length):
+        p = digits[i]
+        if i:
+            # digit i counts the free cells before this one
+            for used in np.sort(positions[:, :i], axis=1).T:
+                p = p + (used <= p)
+        positions[:, i] = p
+    return positions
+
+
+def _neighbor_table(n):
+    codec = codec_for(n)
+    table = np.full((n * n, 4), -1, dtype=np.int64)
+    for cell, options in enumerate(codec.neighbors):
+        for d, (_, target) in enumerate(options):
+            table[cell, d] = target
+    return table
+
+
+def _expand(idx, k, track_blank, N, neighbors):
+    """Return (zero_cost, unit_cost) successor ranks of a chunk of states."""
+    length = k + 1 if track_blank else k
+    positions = _unrank(idx, length, N)
+    zero, unit = [], []
+    if track_blank:
+        blank = positions[:, k]
+        for d in range(4):
+            target = neighbors[blank, d]
+            valid = target >= 0
+            occupied = positions[:, :k] == target[:, None]
+            hit = occupied.any(axis=1)
+            moved = positions.copy()
+            moved[:, k] = target
+            rows = np.nonzero(valid & hit)[0]
+            moved[rows, occupied[rows].argmax(axis=1)] = blank[rows]
+            zero.append(_rank(moved[valid & ~hit], N))
+            unit.append(_rank(moved[rows], N))
+    else:
+        for i in range(k):
+            for d in range(4):
+                target = neighbors[positions[:, i], d]
+                valid = (target >= 0) & ~(positions == target[:, None]).any(axis=1)
+                moved = positions[valid]
+                moved[:, i] = target[valid]
+                unit.append(_rank(moved, N))
+    empty = np.empty(0, dtype=np.int64)
+    return (np.concatenate(zero) if zero else empty), np.concatenate(unit)
+
+
+def _claim(dist, candidates, depth):
+    """Mark unseen candidates with `depth` and return them (deduplicated)."""
+    candidates = np.unique(candidates)
+    candidates = candidates[dist[candidates] == UNSEEN]
+    dist[candidates] = depth
+    return candidates
+
+
+def build_table(n, pattern, track_blank=None):
+    """Retrograde BFS for one pattern; returns a uint8 array indexed by placement rank."""
+    N = n * n
+    k = len(pattern)
+    if track_blank is None:
+        track_blank = _placements(N, k + 1) <= MAX_BLANK_TRACKED_STATES
+    length = k + 1 if track_blank else k
+    neighbors = _neighbor_table(n)
+
+    dist = np.full(_placements(N, length), UNSEEN, dtype=np.uint8)
+    goal = [tile - 1 for tile in pattern] + ([N - 1] if track_blank else [])
+    frontier = _claim(dist, _rank(np.array([goal]), N), 0)
+    depth = 0
+
+    while frontier.size:
+        layer = [frontier]
+        pending = frontier
+        while track_blank and pending.size:
+            # Blank moves through non-pattern cells are free
+            found = []
+            for start in range(0, pending.size, CHUNK):
+                zero, _ = _expand(pending[start:start + CHUNK], k, track_blank, N, neighbors)
+                found.append(_claim(dist, zero, depth))
+            pending = np.concatenate(found)
+            layer.append(pending)
+
+        following = []
+        for part in layer:
+            for start in range(0, part.size, CHUNK):
+                _, unit = _expand(part[start:start + CHUNK], k, track_blank, N, neighbors)
+                following.append(_claim(dist, unit, min(depth + 1, UNSEEN - 1)))
+        frontier = np.concatenate(following)
+        depth += 1
+
+    if track_blank:
+        # Blank digit is the last mixed-radix digit: fold it away with min()
+        dist = dist.reshape(-1, N - k).min(axis=1)
+    return dist
+
+
+def table_path(n, pattern, directory=None):
+    if directory is None:
+        directory = cache_dir("pdb")
+    else:
+        os.makedirs(directory, exist_ok=True)
+    name = "pdb-%dx%d-%s.bin" % (n, n, "-".join(str(tile) for tile in pattern))
+    return os.path.join(directory, name)
+
+
+class PatternDatabase:
+    """
+    Additive pattern-database heuristic. Pass an instance as `heuristic=`
+    to AStarSolver or IDAStarSolver.
+    """
+    def __init__(self, n, patterns, tables, directory=None):
+        self.n = n
+        self.patterns = tuple(tuple(pattern) for pattern in patterns)
+        self.tables = tables
+        self.directory = directory
+        self.__name__ = "pattern_database_" + "-".join(str(len(p)) for p in self.patterns)
+
+    @classmethod
+    def load(cls, n, patterns=None, directory=None, build=True):
+        """Memory-map the tables for `patterns`, building any that are missing."""
+        patterns = patterns or DEFAULT_PARTITIONS[n]
+        tiles = sorted(tile for pattern in patterns for tile in pattern)
+        if len(tiles) != len(set(tiles)) or not set(tiles) <= set(range(1, n * n)):
+            raise ValueError("patterns must be disjoint sets of tiles 1..%d" % (n * n - 1))
+
+        tables = []
+        for pattern in patterns:
+            path = table_path(n, pattern, directory)
+            if not os.path.exists(path):
+                if not build:
+                    raise FileNotFoundError(path)
+                table = build_table(n, pattern)
+                publish(path, table.tofile)
+            size = _placements(n * n, len(pattern))
+            tables.append(np.memmap(path, dtype=np.uint8, mode="r", shape=(size,)))
+        return cls(n, patterns, tables, directory)
+
+    def __reduce__(self):
+        # Worker processes re-open the memory-mapped files instead of copying tables
+        return (PatternDatabase.load, (self.n, self.patterns, self.directory, False))
+
+    def from_tiles(self, tiles):
+        """Heuristic value of a flat tile sequence."""
+        N = self.n * self.n
+        where = [0] * N
+        for cell, value in enumerate(tiles):
+            where[value] = cell
+        total = 0
+        for pattern, table in zip(self.patterns, self.tables):
+            idx = 0
+            for i, tile in enumerate(pattern):
+                p = where[tile]
+                r = p
+                for prev in pattern[:i]:
+                    if where[prev] < p:
+                        r -= 1
+                idx = idx * (N - i) + r
+            total += int(table[idx])
+        return total
+
+    def batch(self, states):
+        """Heuristic values of every row of a (k, n*n) state array."""
+        states = np.asarray(states)
+        N = self.n * self.n
+        total = np.zeros(len(states), dtype=np.int64)
+        for pattern, table in zip(self.patterns, self.tables):
+            positions = np.stack([(states == tile).argmax(axis=1) for tile in pattern], axis=1)
+            total += table[_rank(positions, N)]
+        return total
+
+    def __call__(self, board):
+        return self.from_tiles([int(value) for row in board.grid for value in row])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build pattern-database tables")
+    parser.add_argument("n", type=int, help="board size")
+    parser.add_argument("--dir", default=None, help="output directory (default: cache dir)")
+    args = parser.parse_args()
+    db = PatternDatabase.load(args.n, directory=args.dir)
+    for pattern, table in zip(db.patterns, db.tables):
+        print("%s: %d entries, max %d" % (table_path(args.n, pattern, args.dir), table.size, table.max()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+from collections import deque
+from core.board import Board
+from core.state import codec_for, is_solvable
+from solvers.base_solver import BaseSolver
+from solvers.table_solver import TableSolver
+
+class ReductionSolver(BaseSolver):
+    """
+    Fast, non-optimal solver for any board size.
+
+    Solves the top row and then the left column of the unsolved region one
+    tile at a time, which leaves an (n-1)x(n-1) puzzle; repeats down to
+    3x3 and hands that to an optimal solver (`finisher`, by default a
+    TableSolver lookup in the complete 3x3 distance table). Moves are
+    produced lazily by generate_moves(), so a caller can start animating
+    before the whole path exists.
+    """
+    def __init__(self, board, finisher=None):
+        super().__init__(board)
+        self.finisher = finisher or TableSolver
+        self.nodes_explored = 0
+        self.path_cost = 0
+        self.finisher_moves = 0
+
+        n = board.n
+        self.codec = codec_for(n)
+        # step[a][b]: name of the move taking the blank from cell a to cell b
+        self.step = [dict((target, name) for name, target in self.codec.neighbors[cell])
+                     for cell in range(n * n)]
+
+    def solve(self):
+        """Return the whole path (None when unsolvable)."""
+        moves = self.generate_moves()
+        if moves is None:
+            return None
+        return list(moves)
+
+    def generate_moves(self):
+        """
+        Return a generator of moves that solves the board, or None when the
+        board is unsolvable. The board itself is not modified.
+        """
+        self._start_search()
+        tiles = list(self.board.tiles)
+        if not is_solvable(tiles, self.board.n):
+            return None
+        return self._moves(tiles)
+
+    def _moves(self, tiles):
+        n = self.board.n
+        self.tiles = tiles
+        self.where = [0] * (n * n)
+        for cell, value in enumerate(tiles):
+            self.where[value] = cell
+        self.blank = self.where[0]
+        self.locked = [False] * (n * n)
+        self.path_cost = 0
+
+        def cell(row, col):
+            return row * n + col
+
+        for k in range(n - 3):
+            # Top row of the remaining region: all but the last two tiles directly
+            for col in range(k, n - 2):
+                yield from self._place(cell(k, col) + 1, cell(k, col))
+                self.locked[cell(k, col)] = True
+            yield from self._place_pair(cell(k, n - 2), cell(k, n - 1), cell(k + 1, n - 1), "RIGHT", "DOWN")
+            # Left column below it
+            for row in range(k + 1, n - 2):
+                yield from self._place(cell(row, k) + 1, cell(row, k))
+                self.locked[cell(row, k)] = True
+            yield from self._place_pair(cell(n - 2, k), cell(n - 1, k), cell(n - 1, k + 1), "DOWN", "RIGHT")
+
+        yield from self._finish(max(0, n - 3))
+
+    def _apply(self, target):
+        """Slide the tile at `target` into the blank."""
+        tiles, blank = self.tiles, self.blank
+        value = tiles[target]
+        tiles[blank], tiles[target] = value, 0
+        self.where[value] = blank
+        self.where[0] = target
+        self.blank = target
+        self.path_cost += 1
+        return self.step[blank][target]
+
+    def _route(self, start, goal, blocked):
+        """Shortest cell path start -> goal (both included) avoiding locked cells and `blocked`."""
+        if start == goal:
+            return [start]
+        locked, neighbors = self.locked, self.codec.neighbors
+        parents = {start: None}
+        queue = deque([start])
+        while queue:
+            current = queue.popleft()
+            self.nodes_explored += 1
+            for _, nxt in neighbors[current]:
+                if nxt in parents or locked[nxt] or nxt == blocked:
+                    continue
+                parents[nxt] = current
+                if nxt == goal:
+                    route = [goal]
+                    while parents[route[-1]] is not None:
+                        route.append(parents[route[-1]])
+                    route.reverse()
+                    return route
+                queue.append(nxt)
+        return None
+
+    def _place(self, value, target, avoid=None):
+        """Walk tile `value` to `target` along a shortest route, bringing the blank ahead of it each step."""
+        route = self._route(self.where[value], target, avoid)
+        for nxt in route[1:]:
+            position = self.where[value]
+            blank_route = self._route(self.blank, nxt, position)
+            if blank_route is None:
+                # Blank is boxed in by the tile (e.g. in a dead-end pocket)
+                yield from self._place_jointly((value,), (target,))
+                return
+            for cell in blank_route[1:]:
+                yield self._apply(cell)
+            yield self._apply(position)
+
+    def _place_jointly(self, values, targets, allowed=None):
+        """
+        Fallback: breadth-first search over the positions of `values` plus the
+        blank, moving only through unlocked cells (or just the `allowed` ones).
+        """
+        locked, neighbors = self.locked, self.codec.neighbors
+        targets = tuple(targets)
+        start = (tuple(self.where[value] for value in values), self.blank)
+        parents = {start: None}
+        queue = deque([start])
+        while queue:
+            positions, blank = current = queue.popleft()
+            self.nodes_explored += 1
+            if positions == targets:
+                break
+            for _, nxt in neighbors[blank]:
+                if locked[nxt] or (allowed is not None and nxt not in allowed):
+                    continue
+                following = (tuple(blank if position == nxt else position for position in positions), nxt)
+                if following not in parents:
+                    parents[following] = current
+                    queue.append(following)
+        blanks = []
+        while parents[current] is not None:
+            blanks.append(current[1])
+            current = parents[current]
+        for cell in reversed(blanks):
+            yield self._apply(cell)
+
+    def _place_pair(self, first, second, parking, into_first, into_second):
+        """
+        Place the last two tiles of a row (or column): `first` goes to
+        `second` and the other to `parking` beside it, then the blank enters
+        at `first` and two moves rotate both tiles home.
+
+        With the corner taken, `first` is a dead end: the second tile is
+        routed around it, and if that tile is already inside it (or blocks
+        its exit with the blank inside) the two could only swap forever, so
+        that case is solved by search inside the 3x2 block around the corner.
+        """
+        first_value, second_value = first + 1, second + 1
+        if self.where[first_value] == first and self.where[second_value] == second:
+            self.locked[first] = self.locked[second] = True
+            return
+        yield from self._place(first_value, second)
+        across = parking - second
+        exit_cell = first + across
+        self.locked[second] = True
+        position = self.where[second_value]
+        if position == first or (position == exit_cell and self.blank == first):
+            block = {first, second, exit_cell, parking, exit_cell + across, parking + across}
+            if self.blank not in block:
+                for cell in self._route(self.blank, exit_cell, first)[1:]:
+                    yield self._apply(cell)
+            self.locked[second] = False
+            yield from self._place_jointly((first_value, second_value), (first, second), block)
+            self.locked[first] = self.locked[second] = True
+            return
+        yield from self._place(second_value, parking, avoid=first)
+        self.locked[parking] = True
+        for cell in self._route(self.blank, first, None)[1:]:
+            yield self._apply(cell)
+        yield self._apply(self._neighbor(first, into_first))
+        yield self._apply(self._neighbor(self.blank, into_second))
+        self.locked[parking] = False
+        self.locked[first] = self.locked[second] = True
+
+    def _neighbor(self, cell, move_name):
+        return dict(self.codec.neighbors[cell])[move_name]
+
+    def _finish(self, offset):
+        """Solve the bottom-right (n - offset)-square sub-board with the finisher."""
+        n = self.board.n
+        size = n - offset
+        local = []
+        for row in range(offset, n):
+            for col in range(offset, n):
+                value = self.tiles[row * n + col]
+                if value:
+                    goal_row, goal_col = divmod(value - 1, n)
+                    value = (goal_row - offset) * size + (goal_col - offset) + 1
+                local.append(value)
+        solver = self.finisher(Board.from_tiles(local))
+        moves = solver.solve()
+        self.nodes_explored += solver.nodes_explored
+        self.finisher_moves = len(moves)
+        for move_name in moves:
+            yield self._apply(self._neighbor(self.blank, move_name))
+
+    def get_decision_basis(self):
+        return "Placing the top row and left column tile by tile, then solving the last 3x3 optimally"
+
+    def get_metrics(self):
+        return {
+            "Nodes Explored": self.nodes_explored,
+            "Path Cost": self.path_cost,
+            "Algorithm": "Row/Column Reduction",
+            "Finisher Moves": self.finisher_moves
+        }
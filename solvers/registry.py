@@ -0,0 +1,69 @@
+"""
+Name -> solver / heuristic lookup for the command-line tools.
+
+Solver modules are imported when a solver is first made, so listing names
+(e.g. for argparse choices) or solving with one solver does not load the
+others (or numpy, which several of them need).
+"""
+import importlib
+from solvers.heuristics import manhattan_distance, hamming_distance, linear_conflict
+
+# name -> "module.Class"
+SOLVERS = {
+    "astar": "solvers.a_star.AStarSolver",
+    "idastar": "solvers.ida_star.IDAStarSolver",
+    "bfs": "solvers.bfs.BFSSolver",
+    "bibfs": "solvers.bidirectional_bfs.BidirectionalBFSSolver",
+    "layeredbfs": "solvers.layered_bfs.LayeredBFSSolver",
+    "anytime": "solvers.anytime_a_star.AnytimeAStarSolver",
+    "reduction": "solvers.reduction.ReductionSolver",
+    "table": "solvers.table_solver.TableSolver",
+}
+
+# Solvers that accept a heuristic= argument
+INFORMED = {"astar", "idastar", "anytime"}
+
+# Solvers that accept a weight= argument (the starting weight for anytime)
+WEIGHTED = {"astar", "anytime"}
+
+# Solvers that load a move-pruning automaton (solvers.move_pruning) when made
+PRUNED = {"idastar", "bfs"}
+
+def _pattern_database(n):
+    from solvers.pattern_database import PatternDatabase
+    return PatternDatabase.load(n)
+
+def _walking_distance(n):
+    from solvers.walking_distance import WalkingDistance
+    return WalkingDistance.load(n)
+
+# name -> factory(n); table-backed heuristics are built per board size
+HEURISTICS = {
+    "manhattan": lambda n: manhattan_distance,
+    "hamming": lambda n: hamming_distance,
+    "linear_conflict": lambda n: linear_conflict,
+    "pdb": _pattern_database,
+    "walking": _walking_distance,
+}
+
+def solver_class(name):
+    """Import and return the solver class registered as `name`."""
+    if name not in SOLVERS:
+        raise ValueError("unknown solver %r (choose from %s)" % (name, ", ".join(SOLVERS)))
+    module, _, attribute = SOLVERS[name].rpartition(".")
+    return getattr(importlib.import_module(module), attribute)
+
+def make_solver(name, board, heuristic="manhattan", weight=None):
+    cls = solver_class(name)
+    options = {}
+    if weight is not None:
+        if name not in WEIGHTED:
+            raise ValueError("solver %r does not take a weight (choose from %s)" % (name, ", ".join(sorted(WEIGHTED))))
+        options["weight"] = weight
+    if name not in INFORMED:
+        return cls(board, **options)
+    if isinstance(heuristic, str):
+        if heuristic not in HEURISTICS:
+            raise ValueError("unknown heuristic %r (choose from %s)" % (heuristic, ", ".join(HEURISTICS)))
+        heuristic = HEURISTICS[heuristic](board.n)
+    return cls(board, heuristic=heuristic, **options)
@@ -0,0 +1,256 @@
+"""
+Solution cache in front of any BaseSolver.
+
+Entries are keyed by (solver identity, board size, packed start state). Every
+state along a cached path is indexed too, so a board that lies on a known
+solution (e.g. after undoing a few moves, or part-way through playback) is
+answered at once by slicing that path. The in-memory store is a bounded LRU
+over paths; an optional SQLite file keeps solutions across runs.
+"""
+import sqlite3
+import threading
+from collections import OrderedDict
+from core.state import codec_for
+from solvers.base_solver import BaseSolver
+
+def solver_identity(solver):
+    """Solver class, heuristic name and weight - results are only shared between equal searches."""
+    identity = type(solver).__name__
+    heuristic = getattr(solver, "heuristic", None)
+    if heuristic is not None:
+        identity += "/" + getattr(heuristic, "__name__", type(heuristic).__name__)
+    # Weighted searches return longer paths than optimal ones; keep them apart
+    weight = getattr(solver, "initial_weight", getattr(solver, "weight", 1))
+    if weight != 1:
+        identity += "/w%s" % weight
+    return identity
+
+def _states_along(n, state, moves):
+    """Every packed state visited by replaying `moves` from `state`."""
+    codec = codec_for(n)
+    blank = codec.find_blank(state)
+    states = [state]
+    for move in moves:
+        target = dict(codec.neighbors[blank])[move]
+        state = codec.slide(state, blank, target)
+        blank = target
+        states.append(state)
+    return states
+
+class SolutionCache:
+    def __init__(self, capacity=1024, path=None):
+        self.capacity = capacity
+        self.hits = 0
+        self.suffix_hits = 0
+        self.misses = 0
+        self._paths = OrderedDict()  # (identity, n, start_state) -> (moves, states along path)
+        self._index = {}             # (identity, n, state) -> (path key, offset into moves)
+        self._through = {}           # (identity, n, state) -> {path key: offset} of every path via it
+        self._lock = threading.Lock()
+        self._db = None
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.executescript("""
+                CREATE TABLE IF NOT EXISTS paths (
+                    id INTEGER PRIMARY KEY, identity TEXT, n INTEGER, moves TEXT);
+                CREATE TABLE IF NOT EXISTS states (
+                    identity TEXT, n INTEGER, state TEXT, path_id INTEGER, offset INTEGER,
+                    remaining INTEGER, PRIMARY KEY (identity, n, state));
+                CREATE INDEX IF NOT EXISTS states_path ON states (path_id);
+            """)
+            columns = [row[1] for row in self._db.execute("PRAGMA table_info(states)")]
+            if "remaining" not in columns:
+                # Files written before remaining lengths were stored: derive them from the moves
+                with self._db:
+                    self._db.executescript("""
+                        ALTER TABLE states ADD COLUMN remaining INTEGER;
+                        UPDATE states SET remaining = (
+                            SELECT CASE moves WHEN '' THEN 0
+                                   ELSE length(moves) - length(replace(moves, ' ', '')) + 1 END
+                            FROM paths WHERE paths.id = states.path_id) - offset;
+                    """)
+
+    def __len__(self):
+        return len(self._paths)
+
+    def get(self, identity, n, state):
+        """Moves from `state` to the goal, or None if no cached path passes through it."""
+        with self._lock:
+            entry = self._index.get((identity, n, state))
+            if entry is None and self._db is not None:
+                entry = self._load(identity, n, state)
+            if entry is None:
+                self.misses += 1
+                return None
+            path_key, offset = entry
+            self._paths.move_to_end(path_key)
+            self.hits += 1
+            if offset:
+                self.suffix_hits += 1
+            return list(self._paths[path_key][0][offset:])
+
+    def put(self, identity, n, state, moves):
+        """Store a solution of `state`, indexing every state it passes through."""
+        states = _states_along(n, state, moves)
+        moves = tuple(moves)
+
+        with self._lock:
+            if self._insert(identity, n, moves, states) and self._db is not None:
+                self._save(identity, n, moves, states)
+
+    def _insert(self, identity, n, moves, states):
+        """Add a path to the LRU; False when one from the same start is already cached."""
+        path_key = (identity, n, states[0])
+        if path_key in self._paths:
+            self._paths.move_to_end(path_key)
+            return False
+        self._paths[path_key] = (moves, states)
+        for offset, state in enumerate(states):
+            key = (identity, n, state)
+            self._through.setdefault(key, {})[path_key] = offset
+            # the newer path takes over unless the existing one reaches the goal sooner
+            current = self._index.get(key)
+            if current is None or len(moves) - offset <= len(self._paths[current[0]][0]) - current[1]:
+                self._index[key] = (path_key, offset)
+        while len(self._paths) > self.capacity:
+            self._evict()
+        return True
+
+    def _evict(self):
+        """Drop the least recently used path; its states fall back to other paths through them."""
+        path_key, (_, states) = self._paths.popitem(last=False)
+        identity, n, _ = path_key
+        for state in states:
+            key = (identity, n, state)
+            through = self._through.get(key)
+            if through is None:
+                continue  # a state the path visits twice, already handled
+            through.pop(path_key, None)
+            if not through:
+                del self._through[key]
+                del self._index[key]
+            elif self._index[key][0] == path_key:
+                self._index[key] = min(through.items(),
+                                       key=lambda item: len(self._paths[item[0]][0]) - item[1])
+
+    def _load(self, identity, n, state):
+        row = self._db.execute(
+            "SELECT p.moves, s.offset FROM states s JOIN paths p ON p.id = s.path_id "
+            "WHERE s.identity = ? AND s.n = ? AND s.state = ?", (identity, n, str(state))).fetchone()
+        if row is None:
+            return None
+        moves = tuple(row[0].split()) if row[0] else ()
+        offset = row[1]
+        # Keep the suffix from this state in memory
+        suffix = moves[offset:]
+        self._insert(identity, n, suffix, _states_along(n, state, suffix))
+        return self._index[(identity, n, state)]
+
+    def _save(self, identity, n, moves, states):
+        """
+        Store a path; like _insert, each state keeps whichever stored path
+        reaches the goal sooner (ties keep the older row). Path rows left
+        with no state pointing at them are deleted.
+        """
+        keys = [str(state) for state in states]
+        with self._db:
+            # Paths these states point at now, which may lose every state below
+            replaced = set()
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                replaced.update(row[0] for row in self._db.execute(
+                    "SELECT DISTINCT path_id FROM states WHERE identity = ? AND n = ? AND state IN (%s)"
+                    % ", ".join("?" * len(chunk)), [identity, n] + chunk))
+            cursor = self._db.execute("INSERT INTO paths (identity, n, moves) VALUES (?, ?, ?)",
+                                      (identity, n, " ".join(moves)))
+            path_id = cursor.lastrowid
+            self._db.executemany(
+                "INSERT INTO states (identity, n, state, path_id, offset, remaining) VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (identity, n, state) DO UPDATE SET path_id = excluded.path_id, "
+                "offset = excluded.offset, remaining = excluded.remaining "
+                "WHERE excluded.remaining < states.remaining",
+                [(identity, n, key, path_id, offset, len(moves) - offset) for offset, key in enumerate(keys)])
+            self._db.executemany(
+                "DELETE FROM paths WHERE id = ? AND NOT EXISTS (SELECT 1 FROM states WHERE path_id = ?)",
+                [(old, old) for old in replaced | {path_id}])
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+class CachedSolver(BaseSolver):
+    """Answers from a SolutionCache when it can, otherwise runs and records `solver`."""
+    def __init__(self, solver, cache):
+        super().__init__(solver.board)
+        self.solver = solver
+        self.cache = cache
+        self.identity = solver_identity(solver)
+        self.cache_hit = False
+
+    @property
+    def nodes_explored(self):
+        return self.solver.nodes_explored
+
+    @property
+    def heuristic(self):
+        return getattr(self.solver, "heuristic", None)
+
+    def set_limits(self, max_nodes=None, time_limit=None):
+        self.solver.set_limits(max_nodes, time_limit)
+        return self
+
+    def attach(self, cancel_token=None, progress_callback=None, solution_callback=None):
+        self.solver.attach(cancel_token, progress_callback, solution_callback)
+        return self
+
+    def subscribe(self, callback, events=None):
+        self.solver.subscribe(callback, events)
+        return self
+
+    def unsubscribe(self, callback):
+        self.solver.unsubscribe(callback)
+        return self
+
+    def progress(self):
+        return self.solver.progress()
+
+    def solve(self):
+        n = self.board.n
+        state, _ = codec_for(n).pack_tiles(self.board.tiles)
+        moves = self.cache.get(self.identity, n, state)
+        if moves is not None:
+            self.cache_hit = True
+            return moves
+        self.cache_hit = False
+        moves = self.solver.solve()
+        if moves is not None:
+            self.cache.put(self.identity, n, state, moves)
+        return moves
+
+    def generate_moves(self):
+        n = self.board.n
+        state, _ = codec_for(n).pack_tiles(self.board.tiles)
+        moves = self.cache.get(self.identity, n, state)
+        if moves is not None:
+            self.cache_hit = True
+            return iter(moves)
+        self.cache_hit = False
+        moves = self.solver.generate_moves()
+        return None if moves is None else self._recording(n, state, moves)
+
+    def _recording(self, n, state, moves):
+        """Pass streamed moves through, caching the path once it is complete."""
+        path = []
+        for move in moves:
+            path.append(move)
+            yield move
+        self.cache.put(self.identity, n, state, path)
+
+    def get_decision_basis(self):
+        return self.solver.get_decision_basis()
+
+    def get_metrics(self):
+        metrics = dict(self.solver.get_metrics())
+        metrics["Cache"] = "hit" if self.cache_hit else "miss"
+        return metrics
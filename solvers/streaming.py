@@ -0,0 +1,19 @@
+"""
+Consumers for BaseSolver.stream(): write steps out as they are produced
+rather than after the whole path is known.
+"""
+import json
+
+def write_steps(steps, out, flush=True):
+    """
+    Write each Step as one JSON line to the text stream `out` (a file, a
+    socket's makefile("w"), sys.stdout...), flushing per line so a reader
+    on the other end sees moves immediately. Returns the number written.
+    """
+    count = 0
+    for step in steps:
+        out.write(json.dumps(step._asdict()) + "\n")
+        if flush:
+            out.flush()
+        count += 1
+    return count
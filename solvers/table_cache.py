@@ -0,0 +1,31 @@
+import os
+import tempfile
+
+CACHE_DIR_ENV = "NPUZZLE_CACHE_DIR"
+
+def cache_dir(*parts):
+    """
+    Directory for precomputed heuristic tables.
+    Defaults to ~/.cache/n-puzzle; override with $NPUZZLE_CACHE_DIR.
+    """
+    base = os.environ.get(CACHE_DIR_ENV) or os.path.join(os.path.expanduser("~"), ".cache", "n-puzzle")
+    path = os.path.join(base, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def publish(path, write):
+    """
+    Atomically create the cache file `path`: write(stream) fills a private
+    temporary file in the same directory, which then replaces `path`.
+    Processes building the same table at once never share a partial file;
+    the last complete one wins.
+    """
+    fd, temporary = tempfile.mkstemp(dir=os.path.dirname(path), prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as stream:
+            write(stream)
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.unlink(temporary)
+        raise
@@ -0,0 +1,233 @@
+"""
+Walking-distance heuristic (Takahashi).
+
+Rows are abstracted to how many tiles of each goal row they hold: a state is
+an n x n count matrix, counts[row][goal_row], with the blank in the one row
+holding n - 1 tiles. A vertical move carries one tile (of some goal row)
+between the blank's row and a neighboring one, so a breadth-first search
+from the goal over these matrices gives the fewest vertical moves that can
+sort every tile into its goal row. Columns are the same puzzle transposed,
+and since vertical and horizontal moves are counted separately,
+row + column distance is admissible and dominates Manhattan distance.
+
+With the blank in the bottom-right corner the row and column goals are the
+same matrix, so one table serves both. For each size the cache holds three
+raw files: sorted state keys (uint64), their distances (uint8), and the
+state reached by each (direction, goal line) move (int32, -1 = none). Those
+transitions let IDA* keep h up to date with two list lookups per move.
+"""
+import argparse
+import os
+from collections import deque
+import numpy as np
+from solvers.table_cache import cache_dir, publish
+
+# 4x4 has 24,964 row states; 5x5 would take far too long to enumerate
+MAX_SIZE = 4
+
+# Transition columns: direction * n + goal line; UP = tile moves toward line 0
+UP, DOWN = 0, 1
+
+
+def _goal(n):
+    counts = [[0] * n for _ in range(n)]
+    for line in range(n):
+        counts[line][line] = n
+    counts[n - 1][n - 1] = n - 1  # the blank's line
+    return counts
+
+
+def _key(counts, n):
+    """Base n+1 digits of every line but the last (the column totals imply it)."""
+    key = 0
+    for line in range(n - 2, -1, -1):
+        for goal in range(n - 1, -1, -1):
+            key = key * (n + 1) + counts[line][goal]
+    return key
+
+
+def build_tables(n):
+    """Breadth-first search over count matrices; returns (keys, distance, transitions)."""
+    goal = _goal(n)
+    index = {_key(goal, n): 0}
+    states = [(goal, n - 1)]
+    distance = [0]
+    edges = []  # (state, column, successor) by index
+    queue = deque([0])
+    while queue:
+        current = queue.popleft()
+        counts, blank = states[current]
+        for line, direction in ((blank + 1, UP), (blank - 1, DOWN)):
+            if not 0 <= line < n:
+                continue
+            for goal_line in range(n):
+                if not counts[line][goal_line]:
+                    continue
+                moved = [list(row) for row in counts]
+                moved[line][goal_line] -= 1
+                moved[blank][goal_line] += 1
+                key = _key(moved, n)
+                following = index.get(key)
+                if following is None:
+                    following = index[key] = len(states)
+                    states.append((moved, line))
+                    distance.append(distance[current] + 1)
+                    queue.append(following)
+                edges.append((current, direction * n + goal_line, following))
+
+    # Store in key order so a key's position is its index
+    keys = np.array(list(index), dtype=np.uint64)
+    order = np.argsort(keys)
+    position = np.empty_like(order)
+    position[order] = np.arange(len(order))
+    transitions = np.full((len(states), 2 * n), -1, dtype=np.int32)
+    for state, column, following in edges:
+        transitions[position[state], column] = position[following]
+    return keys[order], np.array(distance, dtype=np.uint8)[order], transitions
+
+
+def table_paths(n, directory=None):
+    if directory is None:
+        directory = cache_dir("wd")
+    else:
+        os.makedirs(directory, exist_ok=True)
+    return tuple(os.path.join(directory, "wd-%dx%d-%s.bin" % (n, n, part))
+                 for part in ("keys", "dist", "next"))
+
+
+class _Tracker:
+    """Row and column table indexes of one board, updated as tiles slide."""
+    __slots__ = ("n", "distance", "transitions", "rows", "cols", "h", "_stack")
+
+    def __init__(self, table, tiles):
+        self.n = table.n
+        self.distance = table.distance_list
+        self.transitions = table.transitions_list
+        self.rows, self.cols = table.indexes(tiles)
+        self.h = self.distance[self.rows] + self.distance[self.cols]
+        self._stack = []
+
+    def delta(self, tile, source, target):
+        """Change in h when `tile` slides from cell `source` into `target`."""
+        n = self.n
+        rows, cols = self.rows, self.cols
+        self._stack.append((rows, cols))
+        distance = self.distance
+        if source - target in (n, -n):
+            column = (UP if target < source else DOWN) * n + (tile - 1) // n
+            self.rows = self.transitions[rows][column]
+            return distance[self.rows] - distance[rows]
+        column = (UP if target < source else DOWN) * n + (tile - 1) % n
+        self.cols = self.transitions[cols][column]
+        return distance[self.cols] - distance[cols]
+
+    def undo(self, tile, source, target):
+        self.rows, self.cols = self._stack.pop()
+
+
+class WalkingDistance:
+    """
+    Walking-distance heuristic for boards up to 4x4. Pass an instance as
+    `heuristic=` to AStarSolver or IDAStarSolver.
+    """
+    __name__ = "walking_distance"
+
+    def __init__(self, n, keys, distance, transitions, directory=None):
+        self.n = n
+        self.keys = keys
+        self.distance = distance
+        self.transitions = transitions
+        self.directory = directory
+        self._index = None
+        self._lists = None
+
+    @classmethod
+    def load(cls, n, directory=None, build=True):
+        """Read the cached tables for n, building them if missing."""
+        if not 2 <= n <= MAX_SIZE:
+            raise ValueError("walking-distance tables go from 2x2 up to %dx%d" % (MAX_SIZE, MAX_SIZE))
+        paths = table_paths(n, directory)
+        if not all(os.path.exists(path) for path in paths):
+            if not build:
+                raise FileNotFoundError(paths[0])
+            for table, path in zip(build_tables(n), paths):
+                publish(path, table.tofile)
+        keys = np.fromfile(paths[0], dtype=np.uint64)
+        distance = np.fromfile(paths[1], dtype=np.uint8)
+        transitions = np.fromfile(paths[2], dtype=np.int32).reshape(len(keys), 2 * n)
+        return cls(n, keys, distance, transitions, directory)
+
+    def __reduce__(self):
+        # Worker processes re-read the small table files
+        return (WalkingDistance.load, (self.n, self.directory, False))
+
+    @property
+    def distance_list(self):
+        self._ensure_lists()
+        return self._lists[0]
+
+    @property
+    def transitions_list(self):
+        self._ensure_lists()
+        return self._lists[1]
+
+    def _ensure_lists(self):
+        # Plain lists index faster than numpy arrays one element at a time
+        if self._lists is None:
+            self._lists = (self.distance.tolist(), self.transitions.tolist())
+
+    def indexes(self, tiles):
+        """(row state, column state) table indexes of a flat tile sequence."""
+        if self._index is None:
+            self._index = {key: position for position, key in enumerate(self.keys.tolist())}
+        n = self.n
+        rows = [[0] * n for _ in range(n)]
+        cols = [[0] * n for _ in range(n)]
+        for cell, value in enumerate(tiles):
+            if value:
+                row, col = divmod(cell, n)
+                goal_row, goal_col = divmod(value - 1, n)
+                rows[row][goal_row] += 1
+                cols[col][goal_col] += 1
+        return self._index[_key(rows, n)], self._index[_key(cols, n)]
+
+    def from_tiles(self, tiles):
+        """Heuristic value of a flat tile sequence."""
+        rows, cols = self.indexes(tiles)
+        return int(self.distance[rows]) + int(self.distance[cols])
+
+    def incremental(self, tiles):
+        """Tracker with `h` and IDA*'s delta/undo hooks for a tile list edited in place."""
+        return _Tracker(self, tiles)
+
+    def batch(self, states):
+        """Heuristic values of every row of a (k, n*n) state array."""
+        states = np.asarray(states).astype(np.int64)
+        n = self.n
+        occupied = states != 0
+        goal = np.where(occupied, states - 1, 0)
+        # weight[line, goal] = place value of that count in the key
+        weight = np.zeros((n, n), dtype=np.uint64)
+        weight[:n - 1] = ((n + 1) ** np.arange(n * (n - 1), dtype=np.uint64)).reshape(n - 1, n)
+        cells = np.arange(n * n)
+        row_keys = (weight[cells // n, goal // n] * occupied).sum(axis=1, dtype=np.uint64)
+        col_keys = (weight[cells % n, goal % n] * occupied).sum(axis=1, dtype=np.uint64)
+        distance = self.distance.astype(np.int64)
+        return (distance[np.searchsorted(self.keys, row_keys)]
+                + distance[np.searchsorted(self.keys, col_keys)])
+
+    def __call__(self, board):
+        return self.from_tiles([int(value) for row in board.grid for value in row])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build walking-distance tables")
+    parser.add_argument("n", type=int, help="board size (2 to %d)" % MAX_SIZE)
+    parser.add_argument("--dir", default=None, help="output directory (default: cache dir)")
+    args = parser.parse_args()
+    table = WalkingDistance.load(args.n, directory=args.dir)
+    print("%s: %d states, max %d" % (table_paths(args.n, args.dir)[0], len(table.keys), table.distance.max()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import time
+import unittest
+from core.board import Board
+from solvers.a_star import AStarSolver
+from solvers.anytime_a_star import AnytimeAStarSolver
+from solvers.background import SolverThread
+
+class TestSolverThread(unittest.TestCase):
+    def _wait_for(self, search, kinds, timeout=10):
+        deadline = time.monotonic() + timeout
+        seen = []
+        while time.monotonic() < deadline:
+            for kind, payload in search.poll():
+                seen.append(kind)
+                if kind in kinds:
+                    return kind, payload, seen
+            time.sleep(0.01)
+        self.fail("no %s event within %ss (saw %s)" % (kinds, timeout, seen))
+
+    def test_cancel_running_search(self):
+        board = Board.from_tiles([15, 14, 13, 12, 11, 10, 9, 8, 7, 6, 5, 4, 3, 1, 2, 0])
+        search = SolverThread(AStarSolver(board))
+        search.start()
+        _, progress, _ = self._wait_for(search, {"progress"})
+        self.assertIn("f Bound", progress)
+        search.cancel()
+        kind, reason, _ = self._wait_for(search, {"aborted", "done"})
+        self.assertEqual((kind, reason), ("aborted", "cancelled"))
+        search.join(timeout=5)
+
+    def test_finished_search_posts_path(self):
+        board = Board.from_tiles([1, 2, 3, 4, 5, 6, 7, 0, 8])
+        search = SolverThread(AStarSolver(board))
+        search.start()
+        kind, path, _ = self._wait_for(search, {"done"})
+        self.assertEqual(path, ["RIGHT"])
+
+    def test_anytime_search_posts_each_solution(self):
+        board = Board.from_tiles([8, 6, 7, 2, 5, 4, 3, 0, 1])
+        search = SolverThread(AnytimeAStarSolver(board, weight=5))
+        search.start()
+        kind, path, seen = self._wait_for(search, {"done"})
+        self.assertEqual(len(path), 31)
+        self.assertIn("solution", seen)
+
+if __name__ == '__main__':
+    unittest.main()
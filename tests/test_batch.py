@@ -0,0 +1,48 @@
+import io
+import json
+import unittest
+from unittest import mock
+from batch import parse_line, percentile, run
+from solvers.move_pruning import MoveAutomaton
+from solvers.heuristics import manhattan_distance
+from solvers.registry import HEURISTICS
+
+class TestBatch(unittest.TestCase):
+    def test_parse_line_formats(self):
+        self.assertEqual(parse_line("1 2 3 0", 4), (4, [1, 2, 3, 0]))
+        self.assertEqual(parse_line('{"id": "a", "board": [[1, 2], [0, 3]]}', 1), ("a", [1, 2, 0, 3]))
+        self.assertIsNone(parse_line("# comment", 2))
+
+    def test_percentile_nearest_rank(self):
+        self.assertEqual(percentile(list(range(1, 11)), 0.50), 5)
+        self.assertEqual(percentile(list(range(1, 101)), 0.95), 95)
+        self.assertEqual(percentile([7], 0.50), 7)
+        self.assertEqual(percentile([1, 2, 3], 0.0), 1)
+        self.assertEqual(percentile([], 0.5), 0.0)
+
+    def test_run_streams_results(self):
+        instances = [(1, [1, 2, 3, 4, 5, 6, 7, 0, 8]), (2, [1, 2, 3, 4, 5, 6, 8, 7, 0]),
+                     (3, [8, 6, 7, 2, 5, 4, 3, 0, 1])]
+        out = io.StringIO()
+        summary = run(instances, "idastar", "manhattan", workers=1, max_nodes=50, timeout=None, out=out)
+        results = {r["id"]: r for r in map(json.loads, out.getvalue().splitlines())}
+        self.assertEqual(results[1]["moves"], ["RIGHT"])
+        self.assertEqual(results[2]["status"], "unsolvable")
+        self.assertEqual(results[3]["status"], "node_limit")
+        self.assertEqual(summary["instances"], 3)
+
+    def test_tables_built_before_dispatch(self):
+        built = []
+
+        def factory(n):
+            built.append(n)  # only calls made in this (the parent) process land here
+            return manhattan_distance
+        instances = [(1, [1, 2, 3, 4, 5, 6, 7, 0, 8]), (2, [1, 2, 0, 3])]
+        with mock.patch.dict(HEURISTICS, {"recording": factory}), \
+                mock.patch.object(MoveAutomaton, "load", wraps=MoveAutomaton.load) as load:
+            run(instances, "idastar", "recording", workers=1, max_nodes=None, timeout=None, out=io.StringIO())
+        self.assertEqual(built, [3, 2])
+        self.assertEqual([call.args[0] for call in load.call_args_list], [3, 2])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from benchmarks.instances import available_sets, load_set
+from benchmarks.run import compare, run_pair
+from benchmarks.startup import ROOT, run as run_startup
+
+class TestBenchmarkSuite(unittest.TestCase):
+    def test_instance_sets(self):
+        self.assertIn("korf100", available_sets())
+        self.assertEqual(len(load_set("korf100")), 100)
+        self.assertTrue(all(r["optimal"] == 8 for r in load_set("3x3-d08")))
+
+    def test_run_pair_and_compare(self):
+        row = run_pair("3x3-d08", "idastar:manhattan", limit=3)
+        self.assertEqual((row["instances"], row["solved"], row["optimal"]), (3, 3, 3))
+        self.assertGreater(row["nodes"], 0)
+
+        baseline = {"results": [row]}
+        self.assertEqual(compare({"results": [row]}, baseline, 0.2, 0.05), [])
+        worse = dict(row, nodes=row["nodes"] * 2, optimal=2)
+        self.assertEqual(len(compare({"results": [worse]}, baseline, 0.2, 0.05)), 2)
+
+    def test_solver_imports_stay_light(self):
+        rows = run_startup(["solvers.registry", "core.shuffler"], repeat=1)
+        self.assertEqual([row["heavy_imports"] for row in rows], [[], []])
+        self.assertTrue(all(row["milliseconds"] > 0 for row in rows))
+
+    def test_solving_without_numpy(self):
+        code = ("import sys\n"
+                "from core.board import Board\n"
+                "from solvers.registry import make_solver\n"
+                "for name in ('idastar', 'bfs', 'reduction'):\n"
+                "    board = Board.from_tiles([8, 6, 7, 2, 5, 4, 3, 0, 1])\n"
+                "    assert len(make_solver(name, board, 'linear_conflict').solve()) == 31\n"
+                "print('numpy' in sys.modules, 'pygame' in sys.modules)\n")
+        # An empty cache: the 3x3 table and move automata are built on the way, without numpy too
+        with tempfile.TemporaryDirectory() as directory:
+            env = dict(os.environ, NPUZZLE_CACHE_DIR=directory)
+            result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env,
+                                    capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.split(), ["False", "False"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import random
+import unittest
+import numpy as np
+from core.board import Board, Move
+from solvers.heuristics import manhattan_distance, hamming_distance
+from core.state import GridView
+
+class TestBoard(unittest.TestCase):
+    def test_moves_and_string_api(self):
+        board = Board(3)
+        self.assertTrue(board.is_solved())
+        self.assertFalse(board.move("DOWN"))
+        self.assertFalse(board.move("SIDEWAYS"))
+        self.assertTrue(board.move("UP"))
+        self.assertTrue(board.move(Move.LEFT))
+        self.assertEqual(board.get_empty_pos(), (1, 1))
+        np.testing.assert_array_equal(board.grid, [[1, 2, 3], [4, 0, 5], [7, 8, 6]])
+        self.assertEqual(sorted(board.legal_moves()), list(Move))
+        self.assertFalse(board.is_solved())
+
+        board.grid = np.array([[4, 1, 3], [7, 2, 5], [0, 8, 6]])
+        self.assertEqual(board.get_empty_pos(), (2, 0))
+        self.assertEqual(board.tile_at(0, 0), 4)
+        self.assertEqual(board.history, [])
+
+    def test_incremental_counters_and_undo(self):
+        rng = random.Random(5)
+        board = Board(4)
+        played = []
+        for _ in range(300):
+            move = rng.choice(board.legal_moves())
+            self.assertTrue(board.move(move.name))
+            played.append(move)
+            view = GridView(4, list(board.tiles))
+            self.assertEqual(board.manhattan, manhattan_distance(view))
+            self.assertEqual(board.misplaced, hamming_distance(view))
+        self.assertEqual(manhattan_distance(board), board.manhattan)
+
+        while played:
+            self.assertEqual(board.undo(), played.pop())
+        self.assertIsNone(board.undo())
+        self.assertTrue(board.is_solved())
+        self.assertEqual((board.manhattan, board.misplaced), (0, 0))
+
+if __name__ == '__main__':
+    unittest.main()
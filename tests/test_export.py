@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from core.board import Board
+
+try:
+    import pygame
+    from ui.export import export_solution, frames
+except ImportError:  # the UI is optional for the solver tests
+    pygame = None
+
+try:
+    import PIL
+except ImportError:
+    PIL = None
+
+@unittest.skipIf(pygame is None, "pygame not installed")
+class TestExport(unittest.TestCase):
+    def setUp(self):
+        self.board = Board.from_tiles([4, 1, 3, 7, 2, 5, 0, 8, 6])
+        self.moves = ["UP", "UP", "RIGHT", "DOWN", "RIGHT", "DOWN"]
+
+    def test_frames_follow_the_moves(self):
+        rendered = list(frames(self.board, self.moves, cell_size=20, steps_per_move=3))
+        self.assertEqual(len(rendered), 1 + 3 * len(self.moves))
+        size, data = rendered[-1]
+        self.assertEqual(size, (61, 61))
+        self.assertEqual(len(data), 61 * 61 * 3)
+        self.assertEqual(self.board.tiles, [4, 1, 3, 7, 2, 5, 0, 8, 6])  # untouched
+
+        solved = Board(3)
+        self.assertEqual(list(frames(solved, [], cell_size=20))[0][1], data)
+
+    def test_png_sequence_with_worker_pool(self):
+        with tempfile.TemporaryDirectory() as directory, ProcessPoolExecutor(2) as pool:
+            count = export_solution(self.board, iter(self.moves), directory, "png",
+                                    cell_size=20, steps_per_move=2, pool=pool, window=4)
+            names = sorted(os.listdir(directory))
+            self.assertEqual(count, 13)
+            self.assertEqual(names[0], "frame_00000.png")
+            self.assertEqual(len(names), 13)
+            self.assertEqual(pygame.image.load(os.path.join(directory, names[-1])).get_size(), (61, 61))
+
+    @unittest.skipIf(PIL is None, "Pillow not installed")
+    def test_gif(self):
+        from PIL import Image
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "replay.gif")
+            count = export_solution(self.board, self.moves, path, "gif", cell_size=20, steps_per_move=2)
+            with Image.open(path) as image:
+                self.assertEqual(image.n_frames, count)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,20 @@
+import random
+import unittest
+from core.state import codec_for, GridView
+from solvers.heuristics import (manhattan_distance, hamming_distance, linear_conflict,
+                                batch_heuristic, states_to_array)
+
+class TestBatchHeuristics(unittest.TestCase):
+    def test_batch_matches_scalar(self):
+        rng = random.Random(7)
+        for n in (3, 4, 5):
+            codec = codec_for(n)
+            tiles = [rng.sample(range(n * n), n * n) for _ in range(20)]
+            states = states_to_array(codec, [codec.pack(t) for t in tiles])
+            self.assertEqual(states.shape, (20, n * n))
+            for heuristic in (manhattan_distance, hamming_distance, linear_conflict):
+                expected = [heuristic(GridView(n, t)) for t in tiles]
+                self.assertEqual(batch_heuristic(heuristic, n)(states).tolist(), expected)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import csv
+import io
+import json
+import unittest
+from core.board import Board
+from solvers.a_star import AStarSolver
+from solvers.ida_star import IDAStarSolver
+from solvers.instrumentation import PhaseProfiler, SamplingProfiler, TraceRecorder
+
+TILES = [8, 6, 7, 2, 5, 4, 3, 0, 1]
+
+class TestInstrumentation(unittest.TestCase):
+    def test_events_reach_subscribers(self):
+        profiler = PhaseProfiler()
+        solver = AStarSolver(Board.from_tiles(TILES)).subscribe(profiler)
+        self.assertEqual(len(solver.solve()), 31)
+        self.assertEqual(profiler.counts["expand"], solver.nodes_explored)
+        self.assertGreater(profiler.counts["duplicate"], 0)
+        self.assertIn("heuristic", profiler.seconds)
+        self.assertGreater(profiler.peak_frontier, 0)
+
+    def test_filtered_subscription_and_unsubscribe(self):
+        seen = []
+        callback = lambda event, data: seen.append(event)
+        solver = IDAStarSolver(Board.from_tiles([1, 2, 3, 4, 5, 6, 0, 7, 8]))
+        solver.subscribe(callback, events=["expand"])
+        solver.solve()
+        self.assertTrue(seen and set(seen) == {"expand"})
+        solver.unsubscribe(callback)
+        self.assertIsNone(solver._emitter())
+
+    def test_trace_exporters(self):
+        trace = TraceRecorder()
+        AStarSolver(Board.from_tiles([1, 2, 3, 4, 5, 6, 0, 7, 8])).subscribe(trace).solve()
+        out = io.StringIO()
+        trace.to_csv(out)
+        rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+        self.assertEqual(len(rows), len(trace.records))
+        self.assertEqual(rows[0]["event"], "expand")
+        out = io.StringIO()
+        trace.to_json(out)
+        self.assertEqual(len(json.loads(out.getvalue())), len(trace.records))
+
+    def test_sampling_profiler(self):
+        with SamplingProfiler(interval=0.0005) as profiler:
+            AStarSolver(Board.from_tiles(TILES)).solve()
+        self.assertGreater(profiler.samples, 0)
+        self.assertTrue(any(name.startswith("solve ") for name in profiler.inclusive))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import os
+import unittest
+from core.board import Board
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+try:
+    import pygame
+except ImportError:  # the UI is optional for the solver tests
+    pygame = None
+
+class CountingFont:
+    """Wraps a pygame font and records every string it renders."""
+    def __init__(self, font):
+        self.font = font
+        self.rendered = []
+
+    def render(self, text, *args):
+        self.rendered.append(text)
+        return self.font.render(text, *args)
+
+    def get_height(self):
+        return self.font.get_height()
+
+@unittest.skipIf(pygame is None, "pygame not installed")
+class TestRenderer(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((400, 400))
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_dirty_cells_and_glyph_cache(self):
+        from ui.renderer import Renderer
+        board = Board(4)
+        renderer = Renderer(self.screen, board, cell_size=40)
+        renderer.font = CountingFont(renderer.font)
+        renders = renderer.font.rendered
+
+        self.assertEqual(renderer.draw(), [pygame.Rect(0, 0, 161, 161)])
+        self.assertEqual(len(renders), 15)
+        self.assertEqual(renderer.draw(), [])
+
+        board.move("UP")
+        rects = renderer.draw()
+        self.assertEqual(sorted(map(tuple, rects)), [(120, 80, 40, 40), (120, 120, 40, 40)])
+        self.assertEqual(len(renders), 15)  # glyphs come from the cache
+
+        rects = renderer.draw(highlight=(3, 3))
+        self.assertEqual([tuple(rect) for rect in rects], [(120, 120, 40, 40)])
+        self.assertEqual([tuple(rect) for rect in renderer.draw()], [(120, 120, 40, 40)])
+
+        renderer.cell_size = 30
+        self.assertEqual(renderer.draw(), [pygame.Rect(0, 0, 121, 121)])
+        self.assertEqual(len(renders), 30)
+
+    def test_decision_log_renders_each_message_once(self):
+        from ui.components import DecisionLog
+        log = DecisionLog(0, 0, 200, 60)
+        log.font = CountingFont(log.font)
+        renders = log.font.rendered
+        for i in range(5):
+            log.add_message("message %d" % i)
+        for _ in range(3):
+            log.draw(self.screen)
+        self.assertEqual(len(renders), 5)
+        self.assertFalse(log.dirty)
+        self.assertEqual(len(log.messages), len(log._surfaces))
+
+if __name__ == '__main__':
+    unittest.main()
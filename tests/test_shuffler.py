@@ -0,0 +1,41 @@
+import random
+import unittest
+from core.board import Board
+from core.shuffler import Shuffler, random_instances
+from core.state import is_solvable
+from core.permutation import count_inversions
+
+class TestShuffler(unittest.TestCase):
+    def test_count_inversions(self):
+        rng = random.Random(1)
+        values = rng.sample(range(50), 30)
+        expected = sum(1 for i in range(30) for j in range(i + 1, 30) if values[i] > values[j])
+        self.assertEqual(count_inversions(values), expected)
+
+    def test_is_solvable_parity(self):
+        self.assertTrue(is_solvable([1, 2, 3, 4, 5, 6, 7, 8, 0], 3))
+        self.assertFalse(is_solvable([1, 2, 3, 4, 5, 6, 8, 7, 0], 3))
+        self.assertTrue(is_solvable([1, 2, 3, 0], 2))
+        self.assertFalse(is_solvable([2, 1, 3, 0], 2))
+        board = Board.from_tiles([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 15, 14, 0])
+        self.assertFalse(Shuffler(board).is_solvable())
+
+    def test_shuffle_and_randomize_stay_solvable(self):
+        board = Board(4)
+        shuffler = Shuffler(board, random.Random(3))
+        shuffler.shuffle(200)
+        self.assertTrue(shuffler.is_solvable())
+        for _ in range(20):
+            shuffler.randomize()
+            self.assertTrue(shuffler.is_solvable())
+
+    def test_random_instances_bulk(self):
+        for n in (2, 3, 4):
+            states = random_instances(n, 500, seed=n)
+            self.assertEqual(states.shape, (500, n * n))
+            self.assertTrue(all(is_solvable(row, n) for row in states))
+        # all 12 solvable 2x2 boards show up
+        self.assertEqual(len({tuple(row) for row in random_instances(2, 600, seed=0)}), 12)
+
+if __name__ == '__main__':
+    unittest.main()
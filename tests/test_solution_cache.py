@@ -0,0 +1,91 @@
+import os
+import tempfile
+import unittest
+from core.board import Board
+from core.state import codec_for
+from solvers.a_star import AStarSolver
+from solvers.solution_cache import SolutionCache, CachedSolver
+
+TILES = [4, 1, 3, 7, 2, 5, 0, 8, 6]
+
+class TestSolutionCache(unittest.TestCase):
+    def test_hit_and_suffix_lookup(self):
+        cache = SolutionCache(capacity=4)
+        first = CachedSolver(AStarSolver(Board.from_tiles(TILES)), cache)
+        moves = first.solve()
+        self.assertEqual(first.get_metrics()["Cache"], "miss")
+
+        board = Board.from_tiles(TILES)
+        again = CachedSolver(AStarSolver(board), cache)
+        self.assertEqual(again.solve(), moves)
+        self.assertTrue(again.cache_hit)
+
+        board.move(moves[0])
+        board.move(moves[1])
+        suffix = CachedSolver(AStarSolver(board), cache).solve()
+        self.assertEqual(suffix, moves[2:])
+        self.assertEqual((cache.hits, cache.suffix_hits), (2, 1))
+
+    def test_lru_eviction(self):
+        cache = SolutionCache(capacity=1)
+        codec = codec_for(3)
+        cache.put("x", 3, codec.pack([1, 2, 3, 4, 5, 6, 7, 0, 8]), ["RIGHT"])
+        cache.put("x", 3, codec.pack([1, 2, 3, 4, 5, 0, 7, 8, 6]), ["DOWN"])
+        self.assertEqual(len(cache), 1)
+        self.assertIsNone(cache.get("x", 3, codec.pack([1, 2, 3, 4, 5, 6, 7, 0, 8])))
+        self.assertEqual(cache.get("x", 3, codec.goal), [])
+
+        # States shared with the evicted path are still answered by the path that survives
+        cache = SolutionCache(capacity=2)
+        via = codec.pack([1, 2, 3, 4, 5, 6, 7, 0, 8])
+        cache.put("x", 3, codec.pack([1, 2, 3, 4, 0, 6, 7, 5, 8]), ["DOWN", "RIGHT"])
+        cache.put("x", 3, codec.pack([1, 2, 3, 4, 5, 6, 0, 7, 8]), ["RIGHT", "RIGHT"])  # newest: via points here
+        self.assertEqual(cache.get("x", 3, codec.pack([1, 2, 3, 4, 0, 6, 7, 5, 8])), ["DOWN", "RIGHT"])
+        cache.put("x", 3, codec.goal, [])  # evicts RIGHT RIGHT
+        self.assertEqual(cache.get("x", 3, via), ["RIGHT"])
+        self.assertEqual(cache.misses, 0)
+
+    def test_sqlite_persistence(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "solutions.db")
+            cache = SolutionCache(path=path)
+            moves = CachedSolver(AStarSolver(Board.from_tiles(TILES)), cache).solve()
+            cache.close()
+
+            reopened = SolutionCache(path=path)
+            solver = CachedSolver(AStarSolver(Board.from_tiles(TILES)), reopened)
+            self.assertEqual(solver.solve(), moves)
+            self.assertTrue(solver.cache_hit)
+            reopened.close()
+
+    def test_sqlite_keeps_the_shorter_suffix(self):
+        codec = codec_for(3)
+        via = [1, 2, 3, 4, 0, 6, 7, 5, 8]  # DOWN RIGHT from the goal
+        detour = ["RIGHT", "DOWN", "LEFT", "UP"]
+        board = Board.from_tiles(via)
+        for move in detour:
+            board.move(move)
+        longer = detour + AStarSolver(board).solve()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "solutions.db")
+            cache = SolutionCache(path=path)
+            cache.put("x", 3, codec.pack(via), longer)
+            cache.put("x", 3, codec.pack([1, 0, 3, 4, 2, 6, 7, 5, 8]), ["DOWN", "DOWN", "RIGHT"])
+            self.assertEqual(cache.get("x", 3, codec.pack(via)), ["DOWN", "RIGHT"])
+            cache.close()
+
+            reopened = SolutionCache(path=path)
+            self.assertEqual(reopened.get("x", 3, codec.pack(via)), ["DOWN", "RIGHT"])
+            reopened.close()
+
+    def test_sqlite_skips_paths_already_cached(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = SolutionCache(path=os.path.join(directory, "solutions.db"))
+            codec = codec_for(3)
+            for _ in range(3):
+                cache.put("x", 3, codec.pack([1, 2, 3, 4, 5, 6, 7, 0, 8]), ["RIGHT"])
+            self.assertEqual(cache._db.execute("SELECT COUNT(*) FROM paths").fetchone()[0], 1)
+            cache.close()
+
+if __name__ == '__main__':
+    unittest.main()
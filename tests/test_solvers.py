@@ -1,8 +1,27 @@
+import io
+import json
+import sys
+import tempfile
 import unittest
+from unittest import mock
 import numpy as np
 from core.board import Board
 from solvers.a_star import AStarSolver
+from solvers.anytime_a_star import AnytimeAStarSolver
+from solvers.base_solver import SearchAborted
 from solvers.bfs import BFSSolver
+from solvers.ida_star import IDAStarSolver
+from solvers.move_pruning import MoveAutomaton
+from solvers.layered_bfs import LayeredBFSSolver
+from solvers.bidirectional_bfs import BidirectionalBFSSolver
+from solvers.parallel_a_star import ParallelAStarSolver
+from solvers.heuristics import linear_conflict, manhattan_distance
+from solvers.pattern_database import PatternDatabase
+from solvers.open_list import BucketOpenList
+from solvers.reduction import ReductionSolver
+from solvers.streaming import write_steps
+from solvers.walking_distance import WalkingDistance
+from core.shuffler import random_instances
 
 class TestSolvers(unittest.TestCase):
     def test_a_star_solver(self):
@@ -21,5 +40,295 @@ class TestSolvers(unittest.TestCase):
         self.assertIsNotNone(solution)
         self.assertIsInstance(solution, list)
 
+    def test_solvers_agree_on_optimal_length(self):
+        grid = np.array([[4, 1, 3], [7, 2, 5], [0, 8, 6]])
+        lengths = []
+        for solver_class in (AStarSolver, BFSSolver):
+            board = Board(3)
+            board.grid = grid.copy()
+            board.empty_pos = (2, 0)
+            solution = solver_class(board).solve()
+            for move in solution:
+                self.assertTrue(board.move(move))
+            self.assertTrue(board.is_solved())
+            lengths.append(len(solution))
+        self.assertEqual(lengths, [6, 6])
+
+    def test_ida_star_matches_bfs(self):
+        grid = np.array([[8, 6, 7], [2, 5, 4], [3, 0, 1]])
+        expected = len(BFSSolver(self._board(grid)).solve())
+        for heuristic in (None, linear_conflict):
+            board = self._board(grid)
+            solver = IDAStarSolver(board) if heuristic is None else IDAStarSolver(board, heuristic=heuristic)
+            solution = solver.solve()
+            self.assertEqual(len(solution), expected)
+            for move in solution:
+                self.assertTrue(board.move(move))
+            self.assertTrue(board.is_solved())
+            thresholds = solver.get_metrics()["Thresholds"]
+            self.assertEqual(thresholds, sorted(thresholds))
+            self.assertEqual(thresholds[-1], expected)
+
+    def test_bucket_open_list(self):
+        open_list = BucketOpenList()
+        for f, g, state in ((5, 1, "a"), (4, 0, "b"), (5, 3, "c"), (5, 3, "d"), (7, 2, "e")):
+            open_list.push(f, g, state, 0)
+        order = [open_list.pop()[2] for _ in range(len(open_list))]
+        self.assertEqual(order, ["b", "d", "c", "a", "e"])
+
+        grid = np.array([[8, 6, 7], [2, 5, 4], [3, 0, 1]])
+        board = self._board(grid)
+        solver = AStarSolver(board, open_list="bucket")
+        solution = solver.solve()
+        self.assertEqual(len(solution), 31)
+        for move in solution:
+            self.assertTrue(board.move(move))
+        self.assertTrue(board.is_solved())
+
+    def test_memory_bounded_a_star(self):
+        grid = np.array([[8, 6, 7], [2, 5, 4], [3, 0, 1]])
+        board = self._board(grid)
+        solver = AStarSolver(board, heuristic=linear_conflict, max_stored=100)
+        solution = solver.solve()
+        self.assertEqual(len(solution), 31)
+        for move in solution:
+            self.assertTrue(board.move(move))
+        self.assertTrue(board.is_solved())
+        metrics = solver.get_metrics()
+        self.assertLessEqual(metrics["Peak Stored States"], 100)
+        self.assertGreater(metrics["Dropped Nodes"], 0)
+        self.assertGreater(metrics["Regenerated Nodes"], 0)
+
+        # Too small to hold a 31-move path: gives up instead of growing
+        with self.assertRaises(SearchAborted) as aborted:
+            AStarSolver(self._board(grid), max_stored=10).solve()
+        self.assertEqual(aborted.exception.reason, "memory limit")
+
+    def test_weighted_a_star_is_bounded(self):
+        grid = np.array([[8, 6, 7], [2, 5, 4], [3, 0, 1]])
+        for weight in (1.5, 3):
+            board = self._board(grid)
+            solver = AStarSolver(board, weight=weight)
+            solution = solver.solve()
+            self.assertLessEqual(len(solution), weight * 31)
+            for move in solution:
+                self.assertTrue(board.move(move))
+            self.assertTrue(board.is_solved())
+            self.assertEqual(solver.get_metrics()["Weight"], weight)
+
+    def test_anytime_a_star_improves_to_optimal(self):
+        grid = np.array([[8, 6, 7], [2, 5, 4], [3, 0, 1]])
+        published = []
+        solver = AnytimeAStarSolver(self._board(grid), weight=5)
+        solver.attach(solution_callback=published.append)
+        solution = solver.solve()
+        self.assertEqual(len(solution), 31)
+        costs = [len(path) for path in published]
+        self.assertEqual(costs, sorted(costs, reverse=True))
+        self.assertEqual(costs[-1], 31)
+        self.assertEqual(solver.get_metrics()["Suboptimality Bound"], 1)
+
+        # A limit after the first path returns the best path instead of raising
+        board = Board.from_tiles([1, 10, 2, 6, 5, 4, 12, 15, 13, 9, 0, 14, 11, 8, 3, 7])
+        solver = AnytimeAStarSolver(board, weight=5)
+        solver.set_limits(max_nodes=3000)
+        solution = solver.solve()
+        self.assertEqual(solver.get_metrics()["Stopped"], "node limit")
+        for move in solution:
+            self.assertTrue(board.move(move))
+        self.assertTrue(board.is_solved())
+
+        # Seeded from a reduction path, a limit hit before weighted A* finds anything still returns one
+        tiles = random_instances(7, 1, seed=7).tolist()[0]
+        board = Board.from_tiles(tiles)
+        solver = AnytimeAStarSolver(board, weight=5)
+        solver.set_limits(max_nodes=1)
+        solution = solver.solve()
+        self.assertEqual(solver.get_metrics()["Stopped"], "node limit")
+        self.assertEqual(solver.solutions[0]["weight"], None)
+        for move in solution:
+            self.assertTrue(board.move(move))
+        self.assertTrue(board.is_solved())
+        with self.assertRaises(SearchAborted):
+            AnytimeAStarSolver(Board.from_tiles(tiles), seed=False).set_limits(max_nodes=1).solve()
+
+    def test_reduction_solver_large_boards(self):
+        for n in (2, 3, 4, 5, 9):
+            for tiles in random_instances(n, 5, seed=n).tolist():
+                board = Board.from_tiles(tiles)
+                solution = ReductionSolver(board).solve()
+                for move in solution:
+                    self.assertTrue(board.move(move))
+                self.assertTrue(board.is_solved(), (n, tiles))
+
+        # Moves stream out lazily and leave the board untouched
+        board = Board.from_tiles(random_instances(9, 1, seed=1).tolist()[0])
+        before = board.grid.copy()
+        solver = ReductionSolver(board)
+        moves = solver.generate_moves()
+        first = next(moves)
+        self.assertIn(first, ("UP", "DOWN", "LEFT", "RIGHT"))
+        np.testing.assert_array_equal(board.grid, before)
+        self.assertEqual(1 + len(list(moves)), solver.get_metrics()["Path Cost"])
+
+        unsolvable = Board.from_tiles([2, 1, 3, 4, 5, 6, 7, 8, 0])
+        self.assertIsNone(ReductionSolver(unsolvable).solve())
+
+    def test_stream_annotates_moves(self):
+        grid = np.array([[4, 1, 3], [7, 2, 5], [0, 8, 6]])
+        board = self._board(grid)
+        solver = AStarSolver(board, heuristic=linear_conflict)
+        steps = list(solver.stream())
+        self.assertEqual([step.move for step in steps], AStarSolver(self._board(grid)).solve())
+        self.assertEqual([step.g for step in steps], list(range(1, len(steps) + 1)))
+        self.assertEqual(steps[-1].h, 0)
+        for step in steps:
+            self.assertEqual(step.f, step.g + step.h)
+            self.assertEqual(step.basis, solver.get_decision_basis())
+            self.assertTrue(board.move(step.move))
+            self.assertEqual(step.h, linear_conflict(board))
+
+        # Uninformed solvers report Manhattan distance (tracked incrementally)
+        board = self._board(grid)
+        for step in BFSSolver(board).stream():
+            board.move(step.move)
+            self.assertEqual(step.h, manhattan_distance(board))
+
+        unsolvable = Board.from_tiles([2, 1, 3, 4, 5, 6, 7, 8, 0])
+        self.assertIsNone(ReductionSolver(unsolvable).stream())
+
+        out = io.StringIO()
+        board = Board.from_tiles(random_instances(9, 1, seed=2).tolist()[0])
+        count = write_steps(ReductionSolver(board).stream(), out)
+        lines = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(len(lines), count)
+        self.assertEqual(lines[-1]["h"], 0)
+        self.assertEqual(set(lines[0]), {"move", "g", "h", "f", "basis"})
+
+    def test_bidirectional_bfs_is_optimal(self):
+        grid = np.array([[8, 6, 7], [2, 5, 4], [3, 0, 1]])
+        board = self._board(grid)
+        solver = BidirectionalBFSSolver(board)
+        solution = solver.solve()
+        self.assertEqual(len(solution), 31)
+        for move in solution:
+            self.assertTrue(board.move(move))
+        self.assertTrue(board.is_solved())
+        self.assertEqual(sum(solver.get_metrics()["Meeting Depth"]), 31)
+        # Every stored state owns at least its int key and a 3-tuple of parent, move, depth
+        per_state = sys.getsizeof(2 ** 40) + sys.getsizeof((None, None, 0))
+        self.assertGreaterEqual(solver.peak_memory_bytes, solver.peak_stored_states * per_state)
+
+    def test_layered_bfs_matches_bfs(self):
+        for grid in (np.array([[8, 6, 7], [2, 5, 4], [3, 0, 1]]),
+                     np.array([[4, 1, 3], [7, 2, 5], [0, 8, 6]])):
+            expected = BFSSolver(self._board(grid)).solve()
+            board = self._board(grid)
+            solution = LayeredBFSSolver(board).solve()
+            self.assertEqual(len(solution), len(expected))
+            for move in solution:
+                self.assertTrue(board.move(move))
+            self.assertTrue(board.is_solved())
+        unsolvable = np.array([[2, 1, 3], [4, 5, 6], [7, 8, 0]])
+        self.assertIsNone(LayeredBFSSolver(self._board(unsolvable)).solve())
+        self.assertEqual(LayeredBFSSolver(Board(4)).solve(), [])
+        # parity is checked up front, not by exhausting half the 4x4 space
+        unsolvable = Board.from_tiles([2, 1] + list(range(3, 16)) + [0])
+        self.assertIsNone(LayeredBFSSolver(unsolvable).solve())
+        self.assertIsNone(AStarSolver(unsolvable).solve())
+        with self.assertRaises(ValueError):
+            LayeredBFSSolver(Board(5))
+
+    def test_parallel_a_star_is_optimal(self):
+        grid = np.array([[4, 1, 3], [7, 2, 5], [0, 8, 6]])
+        board = self._board(grid)
+        solver = ParallelAStarSolver(board, workers=2)
+        solution = solver.solve()
+        self.assertEqual(len(solution), 6)
+        for move in solution:
+            self.assertTrue(board.move(move))
+        self.assertTrue(board.is_solved())
+        self.assertEqual(len(solver.get_metrics()["Worker Expansions"]), 2)
+
+    def test_parallel_a_star_honours_limits(self):
+        from solvers.background import CancelToken
+        hard = [0, 12, 9, 13, 15, 11, 10, 14, 3, 7, 2, 5, 4, 8, 6, 1]  # 80 moves
+        solver = ParallelAStarSolver(Board.from_tiles(hard), workers=2).set_limits(max_nodes=2000)
+        with self.assertRaises(SearchAborted) as aborted:
+            solver.solve()
+        self.assertEqual(aborted.exception.reason, "node limit")
+        self.assertGreaterEqual(solver.nodes_explored, 2000)
+
+        token = CancelToken()
+        token.cancel()
+        solver = ParallelAStarSolver(Board.from_tiles(hard), workers=2).attach(token)
+        with self.assertRaises(SearchAborted) as aborted:
+            solver.solve()
+        self.assertEqual(aborted.exception.reason, "cancelled")
+
+    def test_pattern_database_heuristic(self):
+        grid = np.array([[8, 6, 7], [2, 5, 4], [3, 0, 1]])
+        with tempfile.TemporaryDirectory() as directory:
+            db = PatternDatabase.load(3, directory=directory)
+            self.assertLessEqual(db(self._board(grid)), 31)
+            for solver_class in (AStarSolver, IDAStarSolver):
+                solution = solver_class(self._board(grid), heuristic=db).solve()
+                self.assertEqual(len(solution), 31)
+            del db
+
+    def test_move_pruning_automaton(self):
+        grid = np.array([[8, 6, 7], [2, 5, 4], [3, 0, 1]])
+        with tempfile.TemporaryDirectory() as directory:
+            automaton = MoveAutomaton.load(3, directory=directory)
+            parent_only = MoveAutomaton.load(3, max_length=2, directory=directory)
+        self.assertFalse(automaton.allows(["UP", "DOWN"]))
+        self.assertFalse(automaton.allows(["RIGHT", "DOWN", "LEFT", "UP"] * 3))
+        self.assertTrue(automaton.allows(["UP", "LEFT", "UP", "RIGHT"]))
+        self.assertTrue(parent_only.allows(["RIGHT", "DOWN", "LEFT", "UP"] * 3))
+
+        nodes = []
+        for fsm in (parent_only, automaton):
+            solver = IDAStarSolver(self._board(grid), automaton=fsm)
+            self.assertEqual(len(solver.solve()), 31)
+            nodes.append(solver.nodes_explored)
+            board = self._board(grid)
+            solution = BFSSolver(board, automaton=fsm).solve()
+            self.assertEqual(len(solution), 31)
+            for move in solution:
+                self.assertTrue(board.move(move))
+            self.assertTrue(board.is_solved())
+        self.assertLess(nodes[1], nodes[0])
+
+    def test_move_automaton_loads_before_the_search_clock(self):
+        grid = np.array([[1, 2, 3], [4, 0, 6], [7, 5, 8]])
+        with mock.patch.object(MoveAutomaton, "load", wraps=MoveAutomaton.load) as load:
+            solvers = [IDAStarSolver(self._board(grid)), BFSSolver(self._board(grid))]
+            self.assertEqual(load.call_count, 2)
+            for solver in solvers:
+                self.assertEqual(len(solver.set_limits(time_limit=5).solve()), 2)
+            self.assertEqual(load.call_count, 2)
+
+    def test_walking_distance_heuristic(self):
+        grid = np.array([[8, 6, 7], [2, 5, 4], [3, 0, 1]])
+        with tempfile.TemporaryDirectory() as directory:
+            wd = WalkingDistance.load(3, directory=directory)
+            self.assertEqual(len(wd.keys), 105)
+            board = self._board(grid)
+            self.assertGreaterEqual(wd(board), manhattan_distance(board))
+            self.assertLessEqual(wd(board), 31)
+            states = np.array([board.tiles, list(range(1, 9)) + [0]], dtype=np.uint8)
+            self.assertEqual(list(wd.batch(states)), [wd(board), 0])
+            for solver_class in (AStarSolver, IDAStarSolver):
+                solution = solver_class(self._board(grid), heuristic=wd).solve()
+                self.assertEqual(len(solution), 31)
+            with self.assertRaises(ValueError):
+                WalkingDistance.load(5, directory=directory)
+
+    def _board(self, grid):
+        board = Board(len(grid))
+        board.grid = grid.copy()
+        board.empty_pos = tuple(int(v) for v in np.argwhere(grid == 0)[0])
+        return board
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,20 @@
+import unittest
+from core.state import StateCodec, codec_for
+
+class TestStateCodec(unittest.TestCase):
+    def test_pack_roundtrip(self):
+        for n in (2, 3, 4, 5):
+            codec = StateCodec(n)
+            tiles = tuple(reversed(range(n * n)))
+            self.assertEqual(codec.unpack(codec.pack(tiles)), tiles)
+        self.assertLess(codec_for(4).goal.bit_length(), 65)
+
+    def test_successors_swap_blank(self):
+        codec = codec_for(3)
+        moves = {name: codec.unpack(state) for name, state, _ in codec.successors(codec.goal, codec.goal_blank)}
+        self.assertEqual(sorted(moves), ["LEFT", "UP"])
+        self.assertEqual(moves["UP"], (1, 2, 3, 4, 5, 0, 7, 8, 6))
+        self.assertEqual(moves["LEFT"], (1, 2, 3, 4, 5, 6, 7, 0, 8))
+
+if __name__ == '__main__':
+    unittest.main()
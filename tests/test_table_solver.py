@@ -0,0 +1,79 @@
+import itertools
+import math
+import os
+import tempfile
+import unittest
+import numpy as np
+from core.board import Board
+from core.permutation import lehmer_rank, lehmer_unrank, mr_rank, mr_unrank
+from core.shuffler import random_instances
+from solvers.heuristics import linear_conflict
+from solvers.ida_star import IDAStarSolver
+from solvers.table_cache import publish
+from solvers.table_solver import DistanceTable, TableSolver, build_table_python, rank_rows, unrank_rows
+
+class TestPermutationRanking(unittest.TestCase):
+    def test_rankings_are_perfect_hashes(self):
+        for n in (1, 3, 5):
+            perms = list(itertools.permutations(range(n)))
+            self.assertEqual([lehmer_rank(perm) for perm in perms], list(range(math.factorial(n))))
+            self.assertEqual(sorted(mr_rank(perm) for perm in perms), list(range(math.factorial(n))))
+            for rank in range(math.factorial(n)):
+                self.assertEqual(lehmer_rank(lehmer_unrank(rank, n)), rank)
+                self.assertEqual(mr_rank(mr_unrank(rank, n)), rank)
+
+    def test_vectorized_ranking_matches(self):
+        perms = [list(perm) for perm in itertools.permutations(range(5))]
+        self.assertEqual(rank_rows(perms).tolist(), [mr_rank(perm) for perm in perms])
+        np.testing.assert_array_equal(unrank_rows(rank_rows(perms), 5), perms)
+
+class TestTableSolver(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.table = DistanceTable.load(3, directory=cls.directory.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def test_table_file(self):
+        path = os.path.join(self.directory.name, "distance-3x3-mr.bin")
+        self.assertEqual(os.path.getsize(path), math.factorial(9) // 4)
+        self.assertEqual(self.table.depth_mod3([1, 2, 3, 4, 5, 6, 7, 8, 0]), 0)
+        self.assertEqual(self.table.depth_mod3([1, 2, 3, 4, 5, 6, 8, 7, 0]), 3)  # unreachable
+        self.assertEqual(os.listdir(self.directory.name), ["distance-3x3-mr.bin"])  # no temp files left
+
+    def test_python_build_matches(self):
+        self.assertEqual(build_table_python(3), self.table.packed)
+
+    def test_publish_is_atomic(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "table.bin")
+
+            def broken(stream):
+                stream.write(b"partial")
+                raise RuntimeError("builder died")
+            with self.assertRaises(RuntimeError):
+                publish(path, broken)
+            self.assertEqual(os.listdir(directory), [])
+            publish(path, lambda stream: stream.write(b"complete"))
+            with open(path, "rb") as stream:
+                self.assertEqual(stream.read(), b"complete")
+
+    def test_paths_are_optimal(self):
+        board = Board.from_tiles([8, 6, 7, 2, 5, 4, 3, 0, 1])
+        self.assertEqual(len(TableSolver(board, self.table).solve()), 31)
+        for tiles in random_instances(3, 10, seed=4).tolist():
+            board = Board.from_tiles(tiles)
+            solution = TableSolver(board, self.table).solve()
+            self.assertEqual(len(solution), len(IDAStarSolver(Board.from_tiles(tiles), heuristic=linear_conflict).solve()))
+            for move in solution:
+                self.assertTrue(board.move(move))
+            self.assertTrue(board.is_solved())
+        self.assertIsNone(TableSolver(Board.from_tiles([2, 1, 3, 4, 5, 6, 7, 8, 0]), self.table).solve())
+        with self.assertRaises(ValueError):
+            TableSolver(Board(4))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,13 +1,28 @@
 import pygame
 from ui.colors import *
 
+_FONTS = {}
+
+def get_font(size):
+    """
+    Shared default font at `size`. Loading a Font reads and parses the font
+    file, and the UI is rebuilt on every window resize, so each size is
+    loaded once (until pygame.quit()).
+    """
+    font = _FONTS.get(size)
+    if font is None:
+        if not _FONTS:
+            pygame.register_quit(_FONTS.clear)
+        font = _FONTS[size] = pygame.font.Font(None, size)
+    return font
+
 class Button:
     def __init__(self, x, y, width, height, text, color=LIGHT_BLUE, text_color=BLACK):
         self.rect = pygame.Rect(x, y, width, height)
         self.text = text
         self.color = color
         self.text_color = text_color
-        self.font = pygame.font.Font(None, 36)
+        self.font = get_font(36)
 
     def draw(self, screen):
         pygame.draw.rect(screen, self.color, self.rect)
@@ -46,39 +61,53 @@ class Slider:
         return None
 
 class DecisionLog:
+    """Scrolling message list; each message is rendered once, when added."""
     def __init__(self, x, y, width, height, font_size=24, bg_color=WHITE, text_color=BLACK):
         self.rect = pygame.Rect(x, y, width, height)
-        self.font = pygame.font.Font(None, font_size)
+        self.font = get_font(font_size)
         self.bg_color = bg_color
         self.text_color = text_color
         self.messages = []
+        self._surfaces = []
+        self.dirty = True  # needs drawing since the last draw()
 
     def add_message(self, message):
         self.messages.append(message)
+        self._surfaces.append(self.font.render(message, True, self.text_color))
         if len(self.messages) * self.font.get_height() > self.rect.height:
             self.messages.pop(0)
+            self._surfaces.pop(0)
+        self.dirty = True
 
     def draw(self, screen):
         pygame.draw.rect(screen, self.bg_color, self.rect)
-        for i, msg in enumerate(self.messages):
-            text_surface = self.font.render(msg, True, self.text_color)
-            screen.blit(text_surface, (self.rect.x + 5, self.rect.y + 5 + i * self.font.get_height()))
+        line_height = self.font.get_height()
+        for i, text_surface in enumerate(self._surfaces):
+            screen.blit(text_surface, (self.rect.x + 5, self.rect.y + 5 + i * line_height))
+        self.dirty = False
 
 class Metrics:
+    """Key/value lines, re-rendered only when the metrics change."""
     def __init__(self, x, y, width, height, font_size=24, bg_color=WHITE, text_color=BLACK):
         self.rect = pygame.Rect(x, y, width, height)
-        self.font = pygame.font.Font(None, font_size)
+        self.font = get_font(font_size)
         self.bg_color = bg_color
         self.text_color = text_color
         self.metrics = {}
+        self._surfaces = []
+        self.dirty = True  # needs drawing since the last draw()
 
     def set_metrics(self, metrics):
-        self.metrics = metrics
+        if metrics == self.metrics and self._surfaces:
+            return
+        self.metrics = dict(metrics)
+        self._surfaces = [self.font.render(f"{key}: {value}", True, self.text_color)
+                          for key, value in self.metrics.items()]
+        self.dirty = True
 
     def draw(self, screen):
         pygame.draw.rect(screen, self.bg_color, self.rect)
-        i = 0
-        for key, value in self.metrics.items():
-            text_surface = self.font.render(f"{key}: {value}", True, self.text_color)
-            screen.blit(text_surface, (self.rect.x + 5, self.rect.y + 5 + i * self.font.get_height()))
-            i += 1
+        line_height = self.font.get_height()
+        for i, text_surface in enumerate(self._surfaces):
+            screen.blit(text_surface, (self.rect.x + 5, self.rect.y + 5 + i * line_height))
+        self.dirty = False
@@ -0,0 +1,199 @@
+"""
+Headless export of solution replays to PNG sequences or animated GIFs.
+
+    python -m ui.export puzzles.txt --solver reduction --format gif \\
+        --out replays/ --workers 8
+
+Frames are drawn by the normal Renderer onto an off-screen surface (no
+window; the SDL dummy video driver is selected), one per move plus
+`--steps-per-move` - 1 in-between slide positions. Input lines are read
+like batch.py's. Each puzzle is solved, rendered and encoded in a worker
+process, so exporting many replays scales with the pool; export_solution()
+also takes a pool to spread the encoding of one long replay.
+
+PNG needs only pygame; GIF needs Pillow (`pip install Pillow`).
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+from core.board import Board
+from ui.colors import WHITE
+from ui.renderer import Renderer
+
+FORMATS = ("png", "gif")
+
+def frames(board, moves, cell_size=48, steps_per_move=4):
+    """
+    Yield ((width, height), rgb_bytes) for the start position, the
+    in-between slide positions and the end of every move. `board` is
+    copied, not modified.
+    """
+    pygame.font.init()
+    board = Board.from_tiles(board.tiles)
+    side = board.n * cell_size + 1
+    surface = pygame.Surface((side, side))
+    surface.fill(WHITE)
+    renderer = Renderer(surface, board, cell_size=cell_size)
+    renderer.draw(full=True)
+    size = surface.get_size()
+    yield size, pygame.image.tobytes(surface, "RGB")
+    for move in moves:
+        tile_to = board.empty_pos
+        if not board.move(move):
+            raise ValueError("illegal move %r" % (move,))
+        for step in range(1, steps_per_move + 1):
+            renderer.draw_slide(board.empty_pos, tile_to, step / steps_per_move)
+            yield size, pygame.image.tobytes(surface, "RGB")
+
+def _require_pillow():
+    try:
+        from PIL import Image
+    except ImportError:
+        raise RuntimeError("GIF export needs Pillow (pip install Pillow)") from None
+    return Image
+
+def encode_png(path, size, data):
+    """Worker task: write one RGB frame as a PNG file."""
+    pygame.image.save(pygame.image.frombytes(data, size, "RGB"), path)
+    return path
+
+def quantize_frame(size, data):
+    """Worker task: convert one RGB frame to a palette image for the GIF."""
+    Image = _require_pillow()
+    return Image.frombytes("RGB", size, data).quantize(colors=64)
+
+def _ordered(pool, function, arguments, window):
+    """Run function(*args) for each args on `pool` (inline when None), in order, at most `window` in flight."""
+    if pool is None:
+        for args in arguments:
+            yield function(*args)
+        return
+    pending = deque()
+    for args in arguments:
+        pending.append(pool.submit(function, *args))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+def export_solution(board, moves, out, fmt="png", cell_size=48, steps_per_move=4, frame_ms=40, pool=None, window=32):
+    """
+    Replay `moves` (any iterable, e.g. solver.generate_moves()) from `board`
+    into `out`: a directory of frame_00000.png... for "png", a file for "gif".
+    Encoding runs on `pool` (an executor) when given. Returns the frame count.
+    """
+    if fmt not in FORMATS:
+        raise ValueError("unknown format %r (choose from %s)" % (fmt, ", ".join(FORMATS)))
+    rendered = frames(board, moves, cell_size, steps_per_move)
+    if fmt == "png":
+        os.makedirs(out, exist_ok=True)
+        tasks = ((os.path.join(out, "frame_%05d.png" % index), size, data)
+                 for index, (size, data) in enumerate(rendered))
+        return sum(1 for _ in _ordered(pool, encode_png, tasks, window))
+
+    _require_pillow()
+    images = _ordered(pool, quantize_frame, rendered, window)
+    first = next(images)
+    count = [1]
+
+    def counted():
+        for image in images:
+            count[0] += 1
+            yield image
+    first.save(out, save_all=True, append_images=counted(), duration=frame_ms, loop=0, optimize=False)
+    return count[0]
+
+def export_instance(instance_id, tiles, solver_name, heuristic_name, out_dir, fmt, options):
+    """Worker entry point: solve one puzzle and export its replay."""
+    from solvers.registry import make_solver
+    started = time.perf_counter()
+    result = {"id": instance_id}
+    try:
+        board = Board.from_tiles(tiles)
+        solver = make_solver(solver_name, board, heuristic_name)
+        moves = solver.generate_moves()
+        if moves is None:
+            result["status"] = "unsolvable"
+        else:
+            name = str(instance_id)
+            path = os.path.join(out_dir, name + ".gif" if fmt == "gif" else name)
+            result["frames"] = export_solution(board, moves, path, fmt, **options)
+            result["path"] = path
+            result["status"] = "exported"
+    except Exception as exc:  # report and keep the batch going
+        result["status"] = "error"
+        result["error"] = "%s: %s" % (type(exc).__name__, exc)
+    result["seconds"] = round(time.perf_counter() - started, 6)
+    return result
+
+def export_many(instances, solver_name, heuristic_name, out_dir, fmt, workers, out, options=None, max_pending=None):
+    """Export every (id, tiles) instance across a process pool, writing a JSON line per result to `out`."""
+    options = options or {}
+    max_pending = max_pending or workers * 4
+    os.makedirs(out_dir, exist_ok=True)
+    frames_total, exported = 0, 0
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        instances = iter(instances)
+        exhausted = False
+        while pending or not exhausted:
+            while not exhausted and len(pending) < max_pending:
+                try:
+                    instance_id, tiles = next(instances)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending.add(pool.submit(export_instance, instance_id, tiles, solver_name,
+                                        heuristic_name, out_dir, fmt, options))
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                out.write(json.dumps(result) + "\n")
+                out.flush()
+                if result["status"] == "exported":
+                    exported += 1
+                    frames_total += result["frames"]
+    elapsed = time.perf_counter() - started
+    return {
+        "exported": exported,
+        "frames": frames_total,
+        "elapsed_seconds": round(elapsed, 3),
+        "frames_per_second": round(frames_total / elapsed, 1) if elapsed else 0.0,
+    }
+
+def main(argv=None):
+    from batch import read_instances
+    from solvers.registry import SOLVERS, HEURISTICS
+    parser = argparse.ArgumentParser(description="Render solution replays headlessly to PNG frames or GIFs")
+    parser.add_argument("input", help="puzzle file (one state per line or JSONL), '-' for stdin")
+    parser.add_argument("--solver", default="reduction", choices=sorted(SOLVERS))
+    parser.add_argument("--heuristic", default="manhattan", choices=sorted(HEURISTICS))
+    parser.add_argument("--format", default="gif", choices=FORMATS)
+    parser.add_argument("--out", default="replays", help="output directory")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--cell-size", type=int, default=48, help="cell size in pixels")
+    parser.add_argument("--steps-per-move", type=int, default=4, help="frames per move (1 = no in-between frames)")
+    parser.add_argument("--frame-ms", type=int, default=40, help="GIF frame duration in milliseconds")
+    args = parser.parse_args(argv)
+
+    if args.format == "gif":
+        _require_pillow()
+    options = {"cell_size": args.cell_size, "steps_per_move": args.steps_per_move, "frame_ms": args.frame_ms}
+    summary = export_many(read_instances(args.input), args.solver, args.heuristic, args.out, args.format,
+                          args.workers or os.cpu_count() or 1, sys.stdout, options)
+    print("exported %(exported)d replays, %(frames)d frames in %(elapsed_seconds).3fs "
+          "(%(frames_per_second).1f frames/sec)" % summary, file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,57 @@
 import pygame
 import time
 from ui.colors import *
+from ui.components import get_font
 
 class Renderer:
-    def __init__(self, screen, board, cell_size=80):
+    """
+    Draws the board from cell-sized tile surfaces rendered once per cell
+    size, and tracks what is on screen so draw() only repaints the cells
+    that changed and returns their rects for pygame.display.update().
+    """
+    def __init__(self, screen, board, cell_size=80, fps=60):
         self.screen = screen
         self.board = board
+        self.fps = fps  # frame cap for move_animation
+        self.font = get_font(50)
+        self._cell_size = None
         self.cell_size = cell_size
-        self.font = pygame.font.Font(None, 50)
+        self._shown = None            # tiles as last drawn, None when the board must be redrawn
+        self._shown_board = None
+        self._shown_highlight = None
+
+    @property
+    def cell_size(self):
+        return self._cell_size
+
+    @cell_size.setter
+    def cell_size(self, cell_size):
+        if cell_size != self._cell_size:
+            self._cell_size = cell_size
+            self._tiles = {}
+            self._shown = None
+
+    def _tile(self, value):
+        """Cell surface for a tile (0 = empty cell) with its top/left grid lines."""
+        surface = self._tiles.get(value)
+        if surface is None:
+            size = self._cell_size
+            surface = pygame.Surface((size, size))
+            surface.fill(WHITE)
+            pygame.draw.line(surface, BLACK, (0, 0), (size - 1, 0))
+            pygame.draw.line(surface, BLACK, (0, 0), (0, size - 1))
+            if value != 0:
+                text = self.font.render(str(value), True, BLACK)
+                surface.blit(text, text.get_rect(center=(size // 2, size // 2)))
+            self._tiles[value] = surface
+        return surface
+
+    def cell_rect(self, i, j):
+        return pygame.Rect(j * self.cell_size, i * self.cell_size, self.cell_size, self.cell_size)
+
+    def board_rect(self):
+        side = self.board.n * self.cell_size + 1
+        return pygame.Rect(0, 0, side, side)
 
     def draw_grid(self):
         for i in range(self.board.n + 1):
@@ -15,52 +59,87 @@ class Renderer:
             pygame.draw.line(self.screen, BLACK, (i * self.cell_size, 0), (i * self.cell_size, self.board.n * self.cell_size))
 
     def draw_pieces(self):
-        for i in range(self.board.n):
-            for j in range(self.board.n):
-                if self.board.grid[i][j] != 0:
-                    text = self.font.render(str(self.board.grid[i][j]), True, BLACK)
-                    text_rect = text.get_rect(center=(j * self.cell_size + self.cell_size // 2, i * self.cell_size + self.cell_size // 2))
-                    self.screen.blit(text, text_rect)
+        n = self.board.n
+        for index, value in enumerate(self.board.tiles):
+            self.screen.blit(self._tile(value), self.cell_rect(*divmod(index, n)))
+        self._shown = list(self.board.tiles)
+        self._shown_board = self.board
+        self._shown_highlight = None
 
-    def highlight_piece(self, piece_pos, color=GREEN, duration=0.2):
-        i, j = piece_pos
-        rect = pygame.Rect(j * self.cell_size, i * self.cell_size, self.cell_size, self.cell_size)
-        pygame.draw.rect(self.screen, color, rect, 5)
-        pygame.display.flip()
-        time.sleep(duration)
+    def draw(self, highlight=None, full=False):
+        """
+        Bring the board on screen up to date and return the dirty rects:
+        the whole board after a resize, board swap or `full`, otherwise
+        just the cells whose tile or highlight changed since the last call.
+        """
+        if full or self._shown is None or self._shown_board is not self.board:
+            self.draw_grid()
+            self.draw_pieces()
+            if highlight is not None:
+                self.draw_highlight(highlight)
+            return [self.board_rect()]
 
-    def move_animation(self, from_pos, to_pos, duration=0.5):
-        start_time = time.time()
-        from_i, from_j = from_pos
-        to_i, to_j = to_pos
-        val = self.board.grid[to_i][to_j] # The value is already swapped in the board logic
+        n = self.board.n
+        tiles, shown = self.board.tiles, self._shown
+        changed = {index for index in range(n * n) if tiles[index] != shown[index]}
+        if highlight != self._shown_highlight:
+            for position in (self._shown_highlight, highlight):
+                if position is not None:
+                    changed.add(position[0] * n + position[1])
+        rects = []
+        for index in changed:
+            rect = self.cell_rect(*divmod(index, n))
+            self.screen.blit(self._tile(tiles[index]), rect)
+            shown[index] = tiles[index]
+            rects.append(rect)
+        if highlight is not None and highlight[0] * n + highlight[1] in changed:
+            self.draw_highlight(highlight)
+        self._shown_highlight = highlight
+        return rects
 
-        while time.time() - start_time < duration:
-            progress = (time.time() - start_time) / duration
-            curr_i = from_i + (to_i - from_i) * progress
-            curr_j = from_j + (to_j - from_j) * progress
+    def draw_highlight(self, piece_pos, color=GREEN):
+        """Outline a cell as part of the current frame (no flip, no wait)."""
+        i, j = piece_pos
+        pygame.draw.rect(self.screen, color, self.cell_rect(i, j), 5)
+        self._shown_highlight = piece_pos
 
-            # Clear the area
-            self.screen.fill(WHITE)
-            self.draw_grid()
-            # Redraw all pieces except the moving one
-            for r in range(self.board.n):
-                for c in range(self.board.n):
-                    if (r,c) != from_pos and (r,c) != to_pos:
-                         if self.board.grid[r][c] != 0:
-                            text = self.font.render(str(self.board.grid[r][c]), True, BLACK)
-                            text_rect = text.get_rect(center=(c * self.cell_size + self.cell_size // 2, r * self.cell_size + self.cell_size // 2))
-                            self.screen.blit(text, text_rect)
+    def highlight_piece(self, piece_pos, color=GREEN, duration=0.2):
+        rect = self.cell_rect(*piece_pos)
+        pygame.draw.rect(self.screen, color, rect, 5)
+        pygame.display.update(rect)
+        time.sleep(duration)
 
+    def draw_slide(self, from_pos, to_pos, progress):
+        """
+        Paint the tile now at `to_pos` (the board has already moved) a
+        fraction `progress` of the way in from `from_pos`; returns the rect
+        covering both cells.
+        """
+        from_rect, to_rect = self.cell_rect(*from_pos), self.cell_rect(*to_pos)
+        empty = self._tile(0)
+        self.screen.blit(empty, from_rect)
+        self.screen.blit(empty, to_rect)
+        x = from_rect.x + (to_rect.x - from_rect.x) * progress
+        y = from_rect.y + (to_rect.y - from_rect.y) * progress
+        self.screen.blit(self._tile(self.board.tile_at(*to_pos)), (round(x), round(y)))
+        if progress >= 1.0 and self._shown is not None:
+            n = self.board.n
+            for i, j in (from_pos, to_pos):
+                self._shown[i * n + j] = self.board.tiles[i * n + j]
+        return from_rect.union(to_rect)
 
-            # Draw the moving piece
-            text = self.font.render(str(val), True, BLACK)
-            text_rect = text.get_rect(center=(curr_j * self.cell_size + self.cell_size // 2, curr_i * self.cell_size + self.cell_size // 2))
-            self.screen.blit(text, text_rect)
-            pygame.display.flip()
+    def move_animation(self, from_pos, to_pos, duration=0.5):
+        """Slide a tile (see draw_slide) on screen, at most `fps` frames a second."""
+        clock = pygame.time.Clock()
+        start_time = time.monotonic()
+        while True:
+            progress = min(1.0, (time.monotonic() - start_time) / duration)
+            pygame.display.update(self.draw_slide(from_pos, to_pos, progress))
+            if progress >= 1.0:
+                break
+            clock.tick(self.fps)
 
     def render(self):
         self.screen.fill(WHITE)
-        self.draw_grid()
-        self.draw_pieces()
+        self.draw(full=True)
         pygame.display.flip()